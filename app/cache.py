@@ -0,0 +1,257 @@
+"""
+Moduł implementujący prosty cache odczytu (read-through) oparty na pamięci RAM.
+
+Cache przechowuje już zserializowane (gotowe do wysłania w formacie JSON)
+listy zasobów zwracane przez endpointy typu `GET /albums`, `GET /artists`,
+`GET /tracks` oraz `GET /playlists`, a także pojedyncze rekordy zwracane
+przez `GET /artists/{id}` i `GET /tracks/{id}` (klucze `item_key`). Dzięki temu kolejne żądania nie muszą
+wykonywać zapytania do bazy danych ani ponownie budować obiektów ORM.
+
+Wpisy przechowywane są w słowniku `_cache`, gdzie kluczem jest nazwa zasobu
+(np. "albums:all"), a wartością krotka `(value, expires_at, etag, body)`:
+
+- `value` — zserializowana lista zasobów,
+- `expires_at` — znacznik czasu (timestamp), po którego przekroczeniu wpis wygasa,
+- `etag` — skrót zawartości `value` wysyłany w nagłówku HTTP `ETag`; klient,
+  który odeśle go w `If-None-Match`, otrzymuje odpowiedź 304 bez treści,
+- `body` — `value` zakodowane raz do JSON (bajty UTF-8); funkcja `to_response`
+  wysyła je bez ponownego przechodzenia przez jsonable_encoder i json.dumps.
+
+Słownik `_cache` jest lokalny dla procesu - przy kilku procesach uvicorn
+(`--workers`) zapis unieważniałby wpisy tylko w jednym z nich, a pozostałe
+zwracałyby nieaktualne listy i ETagi aż do upływu TTL. Jeśli ustawiona jest
+zmienna środowiskowa CACHE_REDIS_URL, wpisy trafiają do Redisa (klucze
+`cache:<klucz>` z TTL ustawianym po stronie serwera, wartość to ETag i treść
+JSON), więc unieważnienie widzą wszystkie procesy. Wymaga to pakietu `redis`.
+
+Cechy systemu:
+- wpisy mają ograniczony czas życia (TTL),
+- wygasłe wpisy są automatycznie usuwane przy odczycie,
+- warstwa CRUD unieważnia odpowiednie klucze przy każdej operacji zapisu
+  (create / update / delete).
+
+Zmienne globalne:
+_cache: Dict[str, Tuple[Any, float, str, bytes]]
+    Słownik przechowujący wpisy cache.
+
+CACHE_TTL: int
+    Czas życia wpisu w sekundach (domyślnie 60 sekund).
+
+_redis:
+    Klient Redis lub None, gdy cache przechowywany jest w pamięci procesu.
+"""
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from starlette.responses import Response
+
+ALBUMS_KEY = "albums:all"
+ARTISTS_KEY = "artists:all"
+TRACKS_KEY = "tracks:all"
+PLAYLISTS_KEY = "playlists:all"
+
+ARTIST_PREFIX = "artist:"
+TRACK_PREFIX = "track:"
+
+_cache: Dict[str, Tuple[Any, float, str, bytes]] = {}
+
+CACHE_TTL = 60
+
+CACHE_REDIS_URL: str | None = os.getenv("CACHE_REDIS_URL")
+
+if CACHE_REDIS_URL:
+    import redis
+
+    _redis = redis.Redis.from_url(CACHE_REDIS_URL)
+else:
+    _redis = None
+
+_REDIS_PREFIX = "cache:"
+
+class Entry(NamedTuple):
+    """
+        Aktualny wpis cache.
+        Pola:
+            value: Zapamiętana wartość (gotowa do serializacji JSON).
+            etag: ETag wpisu.
+            body: Wartość zakodowana do JSON (bajty UTF-8).
+    """
+    value: Any
+    etag: str
+    body: bytes
+
+def _encode(value: Any) -> bytes:
+    """
+        Koduje wartość do JSON tak samo jak JSONResponse (UTF-8, bez spacji).
+        Parametry:
+            value: Wartość gotowa do serializacji JSON.
+        Zwraca:
+            Zakodowana treść odpowiedzi.
+    """
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+def _make_etag(body: bytes) -> str:
+    """
+        Wylicza ETag (w cudzysłowie, zgodnie z HTTP) na podstawie zawartości wpisu.
+        Parametry:
+            body: Wartość wpisu zakodowana do JSON.
+        Zwraca:
+            ETag postaci '"<16 znaków hex>"'.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def get_entry(key: str) -> Optional[Entry]:
+    """
+        Pobiera wpis zapisany w cache pod danym kluczem.
+        Parametry:
+            key: Klucz wpisu (np. "albums:all").
+        Zwraca:
+            Entry (wartość, etag, treść JSON) lub None, jeśli wpis nie istnieje lub wygasł.
+    """
+    if _redis is not None:
+        raw = _redis.get(_REDIS_PREFIX + key)
+        if raw is None:
+            return None
+        etag, body = raw.split(b"\n", 1)
+        return Entry(json.loads(body), etag.decode(), body)
+
+    data = _cache.get(key)
+    if not data:
+        return None
+
+    value, expires_at, etag, body = data
+
+    if time.time() > expires_at:
+        _cache.pop(key, None)
+        return None
+
+    return Entry(value, etag, body)
+
+def get_cached(key: str) -> Any | None:
+    """
+        Pobiera wartość zapisaną w cache pod danym kluczem.
+        Parametry:
+            key: Klucz wpisu (np. "albums:all").
+        Zwraca:
+            Zapisaną wartość lub None, jeśli wpis nie istnieje lub wygasł.
+    """
+    entry = get_entry(key)
+    return entry.value if entry else None
+
+def set_cached(key: str, value: Any) -> Entry:
+    """
+        Zapisuje wartość w cache na czas CACHE_TTL sekund.
+        Wartość jest kodowana do JSON jednorazowo - ta sama treść służy
+        do wyliczenia ETagu i jest wysyłana przez `to_response`.
+        Parametry:
+            key: Klucz wpisu.
+            value: Zserializowana wartość do zapamiętania.
+        Zwraca:
+            Entry zapisanego wpisu.
+    """
+    body = _encode(value)
+    etag = _make_etag(body)
+    if _redis is not None:
+        _redis.set(_REDIS_PREFIX + key, etag.encode() + b"\n" + body, ex=CACHE_TTL)
+    else:
+        _cache[key] = (value, time.time() + CACHE_TTL, etag, body)
+    return Entry(value, etag, body)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+        Sprawdza, czy nagłówek If-None-Match klienta obejmuje podany ETag.
+        Parametry:
+            if_none_match: Wartość nagłówka If-None-Match (lub None).
+            etag: Aktualny ETag zasobu.
+        Zwraca:
+            True, jeśli klient ma aktualną wersję (odpowiedź 304).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+def to_response(entry: Entry, if_none_match: Optional[str] = None) -> Response:
+    """
+        Buduje odpowiedź HTTP z wpisu cache.
+        Mechanizm:
+        - jeśli klient ma aktualną wersję (If-None-Match) - odpowiedź 304 bez treści,
+        - w przeciwnym razie wysyłana jest zapamiętana treść JSON z nagłówkiem ETag,
+          bez ponownej serializacji wartości.
+        Parametry:
+            entry: Wpis cache.
+            if_none_match: Wartość nagłówka If-None-Match (lub None).
+        Zwraca:
+            Obiekt Response gotowy do zwrócenia z endpointu.
+    """
+    headers = {"ETag": entry.etag}
+    if etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+def item_key(prefix: str, item_id: int) -> str:
+    """
+        Buduje klucz wpisu pojedynczego rekordu.
+        Parametry:
+            prefix: Prefiks rodzaju zasobu (np. ARTIST_PREFIX).
+            item_id: Identyfikator rekordu.
+        Zwraca:
+            Klucz postaci "<prefiks><id>" (np. "artist:1").
+    """
+    return f"{prefix}{item_id}"
+
+def invalidate(*keys: str) -> None:
+    """
+        Usuwa z cache wpisy o podanych kluczach (jeśli istnieją).
+        Parametry:
+            keys: Klucze wpisów do unieważnienia.
+    """
+    if _redis is not None:
+        if keys:
+            _redis.delete(*(_REDIS_PREFIX + key for key in keys))
+        return
+
+    for key in keys:
+        _cache.pop(key, None)
+
+def invalidate_prefix(prefix: str) -> None:
+    """
+        Usuwa z cache wszystkie wpisy, których klucz zaczyna się od prefiksu
+        (np. wszystkie zapamiętane utwory po zmianie, która dotyczy wielu z nich).
+        Parametry:
+            prefix: Prefiks kluczy do unieważnienia.
+    """
+    if _redis is not None:
+        _redis_delete_matching(prefix)
+        return
+
+    # list(_cache) kopiuje klucze jedną operacją, której inne wątki puli
+    # (set_cached w synchronicznych endpointach) nie mogą przerwać; pętla
+    # po samym słowniku zgłosiłaby "dictionary changed size during iteration".
+    for key in list(_cache):
+        if key.startswith(prefix):
+            _cache.pop(key, None)
+
+def _redis_delete_matching(prefix: str) -> None:
+    """
+        Usuwa z Redisa wpisy cache, których klucz zaczyna się od prefiksu
+        (SCAN zamiast KEYS, więc serwer nie jest blokowany).
+        Parametry:
+            prefix: Prefiks kluczy (bez prefiksu `cache:`).
+    """
+    keys = list(_redis.scan_iter(match=f"{_REDIS_PREFIX}{prefix}*"))
+    if keys:
+        _redis.delete(*keys)
+
+def clear() -> None:
+    """
+        Usuwa wszystkie wpisy z cache.
+    """
+    if _redis is not None:
+        _redis_delete_matching("")
+        return
+
+    _cache.clear()
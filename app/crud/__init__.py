@@ -8,6 +8,7 @@ Struktura pakietu:
 - album.py     — operacje CRUD dla modelu Album
 - track.py     — operacje CRUD dla modelu Track
 - playlist.py  — operacje CRUD dla modelu Playlist
+- updater.py   — generowane funkcje przepisujące pola schematów na obiekty ORM
 
 Każdy moduł odpowiada za:
 - tworzenie nowych rekordów (Create),
@@ -49,6 +50,7 @@ from .album import (
 
 from .track import (
     create_track,
+    bulk_create_tracks,
     get_tracks,
     get_track,
     update_track,
@@ -61,7 +63,10 @@ from .playlist import (
     get_playlist,
     update_playlist,
     delete_playlist,
-    add_track_to_playlist,
+    get_playlist_owner_id,
+    get_playlist_track_link,
+    link_playlist_tracks,
+    add_tracks_to_playlist,
     get_playlist_tracks,
     remove_track_from_playlist,
 )
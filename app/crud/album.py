@@ -10,54 +10,65 @@ Wszystkie operacje wykorzystują SQLAlchemy ORM i działają w kontekście
 sesji przekazanej jako argument `db`.
 """
 from typing import Optional
-from sqlalchemy.orm import Session
-from app.models import Album
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session, raiseload
+from app import cache
+from app.crud.updater import commit_keep_loaded, update_by_id
+from app.models import Album, Track
 from app.schemas import AlbumCreate, AlbumUpdate
 
 def create_album(db: Session, album: AlbumCreate) -> Album:
     """
         Tworzy nowy album na podstawie danych wejściowych z Pydantic schema.
+        Wiersz zapisywany jest pojedynczym zapytaniem INSERT ... RETURNING,
+        z pominięciem mechanizmu flush sesji ORM, a po zatwierdzeniu
+        transakcji obiekt nie jest ponownie odczytywany (RETURNING zwrócił
+        już wszystkie kolumny).
         Parametry:
             db: Sesja SQLAlchemy.
             album: Obiekt AlbumCreate zawierający dane nowego albumu.
         Zwraca:
             Obiekt Album zapisany w bazie danych.
     """
-    db_album = Album(**album.model_dump())
-    db.add(db_album)
-    db.commit()
-    db.refresh(db_album)
+    db_album = db.execute(
+        insert(Album).values(**album.model_dump()).returning(Album)
+    ).scalar_one()
+    commit_keep_loaded(db)
+    cache.invalidate(cache.ALBUMS_KEY)
     return db_album
 
 def get_albums(db: Session) -> list[type[Album]]:
     """
         Zwraca listę wszystkich albumów zapisanych w bazie danych.
+        Relacje nie są ładowane (raiseload), więc przypadkowy dostęp
+        do nich zgłosi wyjątek zamiast wykonywać osobne zapytanie dla każdego albumu.
         Parametry:
             db: Sesja SQLAlchemy.
         Zwraca:
             Lista obiektów Album.
     """
-    return db.query(Album).all()
+    return db.scalars(select(Album).options(raiseload("*"))).all()
 
 def get_album(db: Session, album_id: int) -> Optional[Album]:
     """
         Pobiera pojedynczy album na podstawie jego ID.
+        Relacje albumu nie są ładowane (raiseload).
         Parametry:
             db: Sesja SQLAlchemy.
             album_id: Identyfikator albumu.
         Zwraca:
             Obiekt Album, jeśli istnieje, w przeciwnym razie None.
     """
-    return db.query(Album).get(album_id)
+    return db.get(Album, album_id, options=[raiseload("*")])
 
 def update_album(db: Session, album_id: int, data: AlbumUpdate) -> Optional[Album]:
     """
         Aktualizuje dane istniejącego albumu.
         Mechanizm:
-        - pobiera album z bazy,
-        - jeśli nie istnieje - zwraca None,
-        - aktualizuje tylko pola przekazane w `data` (exclude_unset=True),
-        - zapisuje zmiany i odświeża obiekt.
+        - aktualizuje tylko pola przekazane w `data` (data.model_fields_set)
+          jednym zapytaniem UPDATE ... RETURNING (bez wcześniejszego SELECT),
+        - jeśli album nie istnieje - zwraca None,
+        - zapisuje zmiany bez ponownego odczytu obiektu.
         Parametry:
             db: Sesja SQLAlchemy.
             album_id: Identyfikator albumu do aktualizacji.
@@ -65,20 +76,19 @@ def update_album(db: Session, album_id: int, data: AlbumUpdate) -> Optional[Albu
         Zwraca:
             Zaktualizowany obiekt Album lub None, jeśli album nie istnieje.
     """
-    album = get_album(db, album_id)
-    if not album:
-        return None
-
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(album, key, value)
-
-    db.commit()
-    db.refresh(album)
+    album = update_by_id(db, Album, album_id, data)
+    if album:
+        cache.invalidate(cache.ALBUMS_KEY)
     return album
 
 def delete_album(db: Session, album_id: int) -> bool:
     """
         Usuwa album z bazy danych.
+        Mechanizm:
+        - odłącza utwory albumu (album_id = NULL), tak jak robiła to sesja ORM,
+          i unieważnia zapamiętane utwory (zmienia się ich album_id),
+        - usuwa album zapytaniem DELETE ... WHERE id = ? (bez wcześniejszego SELECT),
+        - o istnieniu albumu świadczy liczba usuniętych wierszy.
         Parametry:
             db: Sesja SQLAlchemy.
             album_id: Identyfikator albumu do usunięcia.
@@ -86,9 +96,13 @@ def delete_album(db: Session, album_id: int) -> bool:
             True jeśli album został usunięty,
             False jeśli album o podanym ID nie istnieje.
     """
-    album = db.get(Album, album_id)
-    if not album:
+    db.execute(update(Track).where(Track.album_id == album_id).values(album_id=None))
+    result = db.execute(delete(Album).where(Album.id == album_id))
+    if not result.rowcount:
+        db.rollback()
         return False
-    db.delete(album)
+
     db.commit()
+    cache.invalidate(cache.ALBUMS_KEY, cache.TRACKS_KEY)
+    cache.invalidate_prefix(cache.TRACK_PREFIX)
     return True
@@ -10,34 +10,51 @@ Wszystkie operacje wykorzystują SQLAlchemy ORM i działają w kontekście
 sesji przekazanej jako argument `db`.
 """
 from typing import Optional
-from sqlalchemy.orm import Session
-from app.models import Artist
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session, raiseload
+from app import cache
+from app.crud.updater import commit_keep_loaded, update_by_id
+from app.models import Artist, track_artist
 from app.schemas import ArtistCreate, ArtistUpdate
 
 def create_artist(db: Session, artist: ArtistCreate) -> Artist:
     """
         Tworzy nowego artystę na podstawie danych wejściowych z Pydantic schema.
+        Wiersz zapisywany jest pojedynczym zapytaniem INSERT ... RETURNING,
+        z pominięciem mechanizmu flush sesji ORM, a po zatwierdzeniu
+        transakcji obiekt nie jest ponownie odczytywany (RETURNING zwrócił
+        już wszystkie kolumny).
         Parametry:
             db: Sesja SQLAlchemy.
             artist: Obiekt ArtistCreate zawierający dane nowego artysty.
         Zwraca:
             Obiekt Artist zapisany w bazie danych.
     """
-    db_artist = Artist(**artist.model_dump())
-    db.add(db_artist)
-    db.commit()
-    db.refresh(db_artist)
+    db_artist = db.execute(
+        insert(Artist).values(**artist.model_dump()).returning(Artist)
+    ).scalar_one()
+    commit_keep_loaded(db)
+    cache.invalidate(cache.ARTISTS_KEY)
     return db_artist
 
-def get_artists(db: Session) -> list[type[Artist]]:
+def get_artists(db: Session, limit: Optional[int] = None, after_id: int = 0) -> list[type[Artist]]:
     """
         Zwraca listę wszystkich artystów zapisanych w bazie danych.
+        Relacje nie są ładowane (raiseload), więc przypadkowy dostęp
+        do nich zgłosi wyjątek zamiast wykonywać osobne zapytanie dla każdego artysty.
+        Jeśli podano `limit`, zwracana jest jedna strona (keyset pagination):
+        rekordy o ID większym niż `after_id`, posortowane rosnąco po ID.
         Parametry:
             db: Sesja SQLAlchemy.
+            limit: Maksymalna liczba rekordów (None - wszystkie).
+            after_id: ID ostatniego rekordu poprzedniej strony.
         Zwraca:
             Lista obiektów Artist.
     """
-    return db.query(Artist).all()
+    stmt = select(Artist).options(raiseload("*"))
+    if limit is not None:
+        stmt = stmt.where(Artist.id > after_id).order_by(Artist.id).limit(limit)
+    return db.scalars(stmt).all()
 
 def get_artist(db: Session, artist_id: int) -> Optional[Artist]:
     """
@@ -48,16 +65,16 @@ def get_artist(db: Session, artist_id: int) -> Optional[Artist]:
         Zwraca:
             Obiekt Artist, jeśli istnieje, w przeciwnym razie None.
     """
-    return db.query(Artist).get(artist_id)
+    return db.get(Artist, artist_id)
 
 def update_artist(db: Session, artist_id: int, data: ArtistUpdate) -> Optional[Artist]:
     """
         Aktualizuje dane istniejącego artysty.
         Mechanizm:
-        - pobiera artystę z bazy,
-        - jeśli nie istnieje - zwraca None,
-        - aktualizuje tylko pola przekazane w `data` (exclude_unset=True),
-        - zapisuje zmiany i odświeża obiekt.
+        - aktualizuje tylko pola przekazane w `data` (data.model_fields_set)
+          jednym zapytaniem UPDATE ... RETURNING (bez wcześniejszego SELECT),
+        - jeśli artysta nie istnieje - zwraca None,
+        - zapisuje zmiany bez ponownego odczytu obiektu.
         Parametry:
             db: Sesja SQLAlchemy.
             artist_id: Identyfikator artysty do aktualizacji.
@@ -65,20 +82,17 @@ def update_artist(db: Session, artist_id: int, data: ArtistUpdate) -> Optional[A
         Zwraca:
             Zaktualizowany obiekt Artist lub None, jeśli artysta nie istnieje.
     """
-    artist = get_artist(db, artist_id)
-    if not artist:
-        return None
-
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(artist, key, value)
-
-    db.commit()
-    db.refresh(artist)
+    artist = update_by_id(db, Artist, artist_id, data)
+    if artist:
+        cache.invalidate(cache.ARTISTS_KEY, cache.item_key(cache.ARTIST_PREFIX, artist_id))
     return artist
 
 def delete_artist(db: Session, artist_id: int) -> bool:
     """
         Usuwa artystę z bazy danych.
+        Mechanizm:
+        - usuwa powiązania artysty z utworami (tabela `track_artist`),
+        - usuwa artystę zapytaniem DELETE ... WHERE id = ? (bez wcześniejszego SELECT).
         Parametry:
             db: Sesja SQLAlchemy.
             artist_id: Identyfikator artysty do usunięcia.
@@ -86,9 +100,12 @@ def delete_artist(db: Session, artist_id: int) -> bool:
             True jeśli artysta został usunięty,
             False jeśli artysta o podanym ID nie istnieje.
     """
-    artist = db.get(Artist, artist_id)
-    if not artist:
+    db.execute(delete(track_artist).where(track_artist.c.artist_id == artist_id))
+    result = db.execute(delete(Artist).where(Artist.id == artist_id))
+    if not result.rowcount:
+        db.rollback()
         return False
-    db.delete(artist)
+
     db.commit()
+    cache.invalidate(cache.ARTISTS_KEY, cache.item_key(cache.ARTIST_PREFIX, artist_id))
     return True
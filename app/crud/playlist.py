@@ -4,66 +4,113 @@ Funkcje umożliwiają:
 - tworzenie nowych playlist,
 - pobieranie listy playlist,
 - pobieranie pojedynczej playlisty po ID,
+- pobieranie właściciela playlisty i stanu powiązania playlisty z utworem
+  (bez ładowania obiektów ORM),
 - aktualizację danych playlisty,
 - usuwanie playlist,
 - dodawanie utworów do playlisty,
 - usuwanie utworów z playlisty,
+- hurtowe dodawanie wielu utworów do playlisty,
 - pobieranie listy utworów należących do playlisty.
 Wszystkie operacje wykorzystują SQLAlchemy ORM i działają w kontekście
 sesji przekazanej jako argument `db`.
 """
 from typing import Optional
-from sqlalchemy.orm import Session
-from app.models import Playlist, Track
+from sqlalchemy import delete, insert, select, true
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from app import cache
+from app.crud.updater import commit_keep_loaded, update_by_id
+from app.database import STRICT_LOADING
+from app.models import Playlist, Track, playlist_track
 from app.schemas import PlaylistCreate, PlaylistUpdate
 
+# W trybie ścisłym (STRICT_LOADING) niezaładowane relacje zgłaszają wyjątek.
+_STRICT_OPTIONS = (raiseload("*"),) if STRICT_LOADING else ()
+
 def create_playlist(db: Session, playlist: PlaylistCreate) -> Playlist:
     """
         Tworzy nową playlistę na podstawie danych wejściowych z Pydantic schema.
+        Wiersz zapisywany jest pojedynczym zapytaniem INSERT ... RETURNING,
+        z pominięciem mechanizmu flush sesji ORM, a po zatwierdzeniu
+        transakcji obiekt nie jest ponownie odczytywany (RETURNING zwrócił
+        już wszystkie kolumny).
+        Nowa playlista nie ma utworów, więc relacja `tracks` ustawiana jest
+        na pustą listę bez zapytania do bazy (odczyt `tracks` przy budowie
+        odpowiedzi nie wykonuje leniwego ładowania).
         Parametry:
             db: Sesja SQLAlchemy.
             playlist: Obiekt PlaylistCreate zawierający dane nowej playlisty.
         Zwraca:
             Obiekt Playlist zapisany w bazie danych.
     """
-    db_playlist = Playlist(
-        name=playlist.name,
-        owner_id=playlist.owner_id
-    )
-    db.add(db_playlist)
-    db.commit()
-    db.refresh(db_playlist)
+    db_playlist = db.execute(
+        insert(Playlist)
+        .values(name=playlist.name, owner_id=playlist.owner_id)
+        .returning(Playlist)
+    ).scalar_one()
+    commit_keep_loaded(db)
+    set_committed_value(db_playlist, "tracks", [])
+    cache.invalidate(cache.PLAYLISTS_KEY)
     return db_playlist
 
-def get_playlists(db: Session) -> list[type[Playlist]]:
+def get_playlists(db: Session, limit: Optional[int] = None, after_id: int = 0) -> list[type[Playlist]]:
     """
         Zwraca listę wszystkich playlist zapisanych w bazie danych.
+        Relacje nie są ładowane (raiseload), więc przypadkowy dostęp
+        do nich zgłosi wyjątek zamiast wykonywać osobne zapytanie dla każdej playlisty.
+        Jeśli podano `limit`, zwracana jest jedna strona (keyset pagination):
+        rekordy o ID większym niż `after_id`, posortowane rosnąco po ID.
         Parametry:
             db: Sesja SQLAlchemy.
+            limit: Maksymalna liczba rekordów (None - wszystkie).
+            after_id: ID ostatniego rekordu poprzedniej strony.
         Zwraca:
             Lista obiektów Playlist.
     """
-    return db.query(Playlist).all()
+    stmt = select(Playlist).options(raiseload("*"))
+    if limit is not None:
+        stmt = stmt.where(Playlist.id > after_id).order_by(Playlist.id).limit(limit)
+    return db.scalars(stmt).all()
 
 def get_playlist(db: Session, playlist_id: int) -> Optional[Playlist]:
     """
     Pobiera pojedynczą playlistę na podstawie jej ID.
+    W trybie STRICT_LOADING relacje playlisty nie mogą być ładowane leniwie.
     Parametry:
         db: Sesja SQLAlchemy.
         playlist_id: Identyfikator playlisty.
     Zwraca:
         Obiekt Playlist, jeśli istnieje, w przeciwnym razie None.
     """
-    return db.query(Playlist).get(playlist_id)
+    return db.get(Playlist, playlist_id, options=_STRICT_OPTIONS)
+
+def _get_playlist_with_tracks(db: Session, playlist_id: int) -> Optional[Playlist]:
+    """
+        Pobiera playlistę wraz z listą utworów w jednym dodatkowym zapytaniu
+        (selectinload), zamiast leniwego ładowania relacji przy pierwszym dostępie.
+        Parametry:
+            db: Sesja SQLAlchemy.
+            playlist_id: Identyfikator playlisty.
+        Zwraca:
+            Obiekt Playlist z załadowaną relacją tracks lub None, jeśli nie istnieje.
+    """
+    return db.scalars(
+        select(Playlist)
+        .options(selectinload(Playlist.tracks), *_STRICT_OPTIONS)
+        .where(Playlist.id == playlist_id)
+    ).first()
 
 def update_playlist(db: Session, playlist_id: int, data: PlaylistUpdate) -> Optional[Playlist]:
     """
         Aktualizuje dane istniejącej playlisty.
         Mechanizm:
-        - pobiera playlistę z bazy,
-        - jeśli nie istnieje - zwraca None,
-        - aktualizuje tylko pola przekazane w `data` (exclude_unset=True),
-        - zapisuje zmiany i odświeża obiekt.
+        - aktualizuje tylko pola przekazane w `data` (data.model_fields_set)
+          jednym zapytaniem UPDATE ... RETURNING (bez wcześniejszego SELECT),
+          od razu ładując utwory playlisty (selectinload),
+        - jeśli playlista nie istnieje - zwraca None,
+        - zapisuje zmiany bez ponownego odczytu obiektu.
         Parametry:
             db: Sesja SQLAlchemy.
             playlist_id: Identyfikator playlisty do aktualizacji.
@@ -71,20 +118,17 @@ def update_playlist(db: Session, playlist_id: int, data: PlaylistUpdate) -> Opti
         Zwraca:
             Zaktualizowany obiekt Playlist lub None, jeśli playlisty nie znaleziono.
     """
-    playlist = get_playlist(db, playlist_id)
-    if not playlist:
-        return None
-
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(playlist, key, value)
-
-    db.commit()
-    db.refresh(playlist)
+    playlist = update_by_id(db, Playlist, playlist_id, data, (selectinload(Playlist.tracks),))
+    if playlist:
+        cache.invalidate(cache.PLAYLISTS_KEY)
     return playlist
 
 def delete_playlist(db: Session, playlist_id: int) -> bool:
     """
         Usuwa playlistę z bazy danych.
+        Mechanizm:
+        - usuwa powiązania playlisty z utworami (tabela `playlist_track`),
+        - usuwa playlistę zapytaniem DELETE ... WHERE id = ? (bez wcześniejszego SELECT).
         Parametry:
             db: Sesja SQLAlchemy.
             playlist_id: Identyfikator playlisty do usunięcia.
@@ -92,33 +136,99 @@ def delete_playlist(db: Session, playlist_id: int) -> bool:
             True jeśli playlista została usunięta,
             False jeśli playlista o podanym ID nie istnieje.
     """
-    playlist = db.get(Playlist, playlist_id)
-    if not playlist:
+    db.execute(delete(playlist_track).where(playlist_track.c.playlist_id == playlist_id))
+    result = db.execute(delete(Playlist).where(Playlist.id == playlist_id))
+    if not result.rowcount:
+        db.rollback()
         return False
-    db.delete(playlist)
+
     db.commit()
+    cache.invalidate(cache.PLAYLISTS_KEY)
     return True
 
-def add_track_to_playlist(db: Session, playlist_id: int, track_id: int) -> bool:
+def get_playlist_owner_id(db: Session, playlist_id: int) -> Optional[int]:
+    """
+        Pobiera ID właściciela playlisty (bez ładowania obiektu Playlist).
+        Parametry:
+            db: Sesja SQLAlchemy.
+            playlist_id: Identyfikator playlisty.
+        Zwraca:
+            ID właściciela lub None, jeśli playlista nie istnieje.
+    """
+    return db.scalar(select(Playlist.owner_id).where(Playlist.id == playlist_id))
+
+def get_playlist_track_link(db: Session, playlist_id: int, track_id: int) -> Optional[tuple[int, bool]]:
     """
-        Dodaje utwór do playlisty.
+        Jednym zapytaniem sprawdza istnienie playlisty i utworu, pobiera
+        właściciela playlisty oraz informację, czy utwór już jest na playliście
+        (bez ładowania obiektów ORM).
         Parametry:
             db: Sesja SQLAlchemy.
             playlist_id: Identyfikator playlisty.
             track_id: Identyfikator utworu.
         Zwraca:
-            True jeśli operacja się powiodła,
-            False jeśli playlista lub utwór nie istnieją.
+            Krotka (owner_id, already_linked) lub None,
+            jeśli playlista lub utwór nie istnieją.
     """
-    playlist = get_playlist(db, playlist_id)
-    track = db.query(Track).get(track_id)
+    linked = (
+        select(playlist_track.c.track_id)
+        .where(
+            playlist_track.c.playlist_id == playlist_id,
+            playlist_track.c.track_id == track_id
+        )
+        .exists()
+    )
+    row = db.execute(
+        select(Playlist.owner_id, linked)
+        .join_from(Playlist, Track, true())
+        .where(Playlist.id == playlist_id, Track.id == track_id)
+    ).first()
+    return tuple(row) if row is not None else None
 
-    if not playlist or not track:
-        return False
+# INSERT pomijający istniejące powiązania (ON CONFLICT DO NOTHING na złożonym
+# kluczu głównym), budowany jednorazowo przy imporcie modułu.
+_PLAYLIST_TRACK_INSERT_IGNORE = (
+    sqlite_insert(playlist_track)
+    .on_conflict_do_nothing(index_elements=["playlist_id", "track_id"])
+)
+
+def link_playlist_tracks(db: Session, links: list[dict[str, int]]) -> None:
+    """
+        Wstawia powiązania playlist z utworami bez zatwierdzania transakcji.
+        Mechanizm:
+        - wiersze tabeli `playlist_track` wstawiane są jednym wywołaniem
+          executemany z gotową instrukcją INSERT (bez budowania nowego
+          zapytania dla każdej listy utworów),
+        - powiązania, które już istnieją, są pomijane (ON CONFLICT DO NOTHING
+          na złożonym kluczu głównym).
+        Jest to jedyna ścieżka wstawiania powiązań playlista-utwór; commit
+        wykonuje wywołujący, więc wiele powiązań (również różnych playlist)
+        może trafić do jednej transakcji (np. seed.py).
+        Funkcja nie sprawdza istnienia playlist ani utworów.
+        Parametry:
+            db: Sesja SQLAlchemy.
+            links: Lista słowników {"playlist_id": ..., "track_id": ...}.
+    """
+    if links:
+        db.execute(_PLAYLIST_TRACK_INSERT_IGNORE, links)
 
-    playlist.tracks.append(track)
+def add_tracks_to_playlist(db: Session, playlist_id: int, track_ids: list[int]) -> None:
+    """
+        Dodaje wiele utworów do playlisty (link_playlist_tracks) i zapisuje
+        zmiany jednym commitem.
+        Funkcja nie sprawdza istnienia playlisty ani utworów - wywołujący
+        robi to wcześniej (endpoint dodający utwór przez
+        get_playlist_track_link).
+        Parametry:
+            db: Sesja SQLAlchemy.
+            playlist_id: Identyfikator playlisty.
+            track_ids: Lista identyfikatorów utworów.
+    """
+    if not track_ids:
+        return
+
+    link_playlist_tracks(db, [{"playlist_id": playlist_id, "track_id": tid} for tid in track_ids])
     db.commit()
-    return True
 
 def get_playlist_tracks(db: Session, playlist_id: int) -> Optional[list[Track]]:
     """
@@ -129,7 +239,7 @@ def get_playlist_tracks(db: Session, playlist_id: int) -> Optional[list[Track]]:
         Zwraca:
             Lista obiektów Track lub None, jeśli playlista nie istnieje.
     """
-    playlist = get_playlist(db, playlist_id)
+    playlist = _get_playlist_with_tracks(db, playlist_id)
     if not playlist:
         return None
     return playlist.tracks
@@ -138,9 +248,9 @@ def remove_track_from_playlist(db: Session, playlist_id: int, track_id: int) ->
     """
         Usuwa utwór z playlisty.
         Mechanizm:
-        - sprawdza, czy playlista i utwór istnieją,
-        - sprawdza, czy utwór faktycznie znajduje się na playliście,
-        - usuwa utwór i zapisuje zmiany.
+        - usuwa wiersz z tabeli `playlist_track` jednym zapytaniem DELETE,
+          bez ładowania playlisty i jej utworów,
+        - o powodzeniu świadczy liczba usuniętych wierszy.
         Parametry:
             db: Sesja SQLAlchemy.
             playlist_id: Identyfikator playlisty.
@@ -149,15 +259,14 @@ def remove_track_from_playlist(db: Session, playlist_id: int, track_id: int) ->
             True jeśli utwór został usunięty,
             False jeśli playlista/utwór nie istnieją lub utwór nie był na playliście.
     """
-    playlist = get_playlist(db, playlist_id)
-    track = db.query(Track).get(track_id)
-
-    if not playlist or not track:
-        return False
-
-    if track not in playlist.tracks:
+    result = db.execute(
+        delete(playlist_track).where(
+            playlist_track.c.playlist_id == playlist_id,
+            playlist_track.c.track_id == track_id
+        )
+    )
+    if not result.rowcount:
         return False
 
-    playlist.tracks.remove(track)
     db.commit()
     return True
\ No newline at end of file
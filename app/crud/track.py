@@ -2,6 +2,7 @@
 Moduł zawiera operacje CRUD (Create, Read, Update, Delete) dla modelu Track.
 Funkcje umożliwiają:
 - tworzenie nowych utworów wraz z powiązaniem z artystami,
+- hurtowe tworzenie wielu utworów (np. w seed.py),
 - pobieranie listy wszystkich utworów,
 - pobieranie pojedynczego utworu po ID,
 - aktualizację danych utworu (w tym zmianę artystów),
@@ -10,100 +11,215 @@ Wszystkie operacje wykorzystują SQLAlchemy ORM i działają w kontekście
 sesji przekazanej jako argument `db`.
 """
 import os
+import threading
 from typing import Optional
-from sqlalchemy.orm import Session
-from app.models import Track, Artist
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session, raiseload
+from app import cache, player
+from app.crud.updater import commit_keep_loaded, make_updater
+from app.database import STRICT_LOADING
+from app.models import Track, Artist, playlist_track, track_artist, TRACK_ARTIST_INSERT
 from app.schemas import TrackCreate, TrackUpdate
 
 TRACK_DIR = os.path.join(os.path.dirname(__file__), "..", "static", "tracks")
 TRACK_DIR = os.path.abspath(TRACK_DIR)
 
+# W trybie ścisłym (STRICT_LOADING) niezaładowane relacje zgłaszają wyjątek.
+_STRICT_OPTIONS = (raiseload("*"),) if STRICT_LOADING else ()
+
+_known_files: set[str] = set()
+_known_mtime: int | None = None
+_known_lock = threading.Lock()
+
+def _refresh_known_files() -> None:
+    """
+    Odświeża zbiór nazw plików dostępnych w static/tracks/.
+    Katalog jest ponownie listowany tylko wtedy, gdy zmienił się czas jego
+    modyfikacji - w pozostałych przypadkach zbiór `_known_files` pozostaje
+    bez zmian, a sprawdzenie pliku sprowadza się do wyszukania w zbiorze.
+    """
+    global _known_files, _known_mtime
+
+    try:
+        mtime = os.stat(TRACK_DIR).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    with _known_lock:
+        if mtime == _known_mtime:
+            return
+        if mtime is None:
+            _known_files = set()
+        else:
+            with os.scandir(TRACK_DIR) as entries:
+                _known_files = {e.name for e in entries if e.is_file()}
+        _known_mtime = mtime
+
 def _normalize_filename(filename: str) -> str:
     """
     Normalizuje nazwę pliku:
     - jeśli użytkownik poda "1" - zwróci "1.mp3"
-    - jeśli poda "1.mp3" - zostaje bez zmian
+    - jeśli poda "1.mp3" (w dowolnej wielkości liter, np. "1.Mp3") - zostaje bez zmian
     """
-    if not filename.lower().endswith(".mp3"):
+    if filename[-4:].lower() != ".mp3":
         return filename + ".mp3"
     return filename
 
-def _validate_filename(filename: Optional[str]):
+def _validate_filename(normalized: str):
     """
-    Sprawdza, czy użytkownik podał nazwę pliku MP3.
-    Jeśli filename=None - brak walidacji.
-    Jeśli podano - sprawdza, czy plik istnieje w static/tracks/.
+    Sprawdza, czy plik o znormalizowanej nazwie (wynik `_normalize_filename`)
+    istnieje w static/tracks/.
+    W typowym przypadku wystarcza sprawdzenie zbioru `_known_files`; dopiero
+    gdy nazwy w nim nie ma, wykonywane jest os.path.isfile (np. gdy plik dodano
+    w obrębie tej samej rozdzielczości czasu modyfikacji katalogu).
     """
-    if filename is None:
-        return
+    _refresh_known_files()
 
-    normalized = _normalize_filename(filename)
-    full_path = os.path.join(TRACK_DIR, normalized)
+    if normalized in _known_files:
+        return
 
-    if not os.path.isfile(full_path):
+    if not os.path.isfile(os.path.join(TRACK_DIR, normalized)):
         raise ValueError(f"File '{normalized}' not found in {TRACK_DIR}")
 
 def create_track(db: Session, track: TrackCreate) -> Track:
     """
         Tworzy nowy utwór na podstawie danych wejściowych z Pydantic schema.
         Mechanizm:
-        - tworzy obiekt Track z tytułem, czasem trwania i opcjonalnym albumem,
-        - zapisuje go w bazie,
-        - jeśli podano listę artist_ids:
-            * pobiera artystów z bazy,
-            * przypisuje ich do utworu (relacja many-to-many),
-            * ponownie zapisuje zmiany.
+        - jeśli podano listę artist_ids, pobiera artystów z bazy jednym zapytaniem,
+        - tworzy obiekt Track z tytułem, czasem trwania, opcjonalnym albumem
+          i przypisanymi artystami (relacja many-to-many),
         - jeśli podano nazwę pliku w `file_path`:
             * zapisuje lokalną ścieżkę do pliku,
+        - zapisuje utwór wraz z powiązaniami w jednej transakcji, bez
+          ponownego odczytu obiektu po zatwierdzeniu (ID nadane przy flush,
+          pozostałe pola i artyści są już w obiekcie).
         Parametry:
             db: Sesja SQLAlchemy.
             track: Obiekt TrackCreate zawierający dane nowego utworu.
         Zwraca:
             Obiekt Track zapisany w bazie danych.
     """
-    _validate_filename(track.file_path)
+    normalized = None
+    if track.file_path is not None:
+        normalized = _normalize_filename(track.file_path)
+        _validate_filename(normalized)
+
+    artists = []
+    if track.artist_ids:
+        artists = db.scalars(select(Artist).where(Artist.id.in_(track.artist_ids))).all()
 
     db_track = Track(
         title=track.title,
         duration=track.duration,
-        album_id=track.album_id
+        album_id=track.album_id,
+        artists=artists
     )
 
     if track.file_path:
-        normalized = _normalize_filename(track.file_path)
         db_track.file_path = f"{TRACK_DIR}/{normalized}"
 
     db.add(db_track)
-    db.commit()
-    db.refresh(db_track)
+    commit_keep_loaded(db)
+    cache.invalidate(cache.TRACKS_KEY)
+    player.invalidate_track_cache()
+    return db_track
 
-    if track.artist_ids:
-        artists = db.query(Artist).filter(Artist.id.in_(track.artist_ids)).all()
-        db_track.artists.extend(artists)
-        db.commit()
+def bulk_create_tracks(db: Session, tracks: list[dict]) -> list[int]:
+    """
+        Tworzy wiele utworów wraz z powiązaniami z artystami.
+        Mechanizm:
+        - wiersze tabeli `tracks` wstawiane są jednym wywołaniem executemany
+          z klauzulą RETURNING, która zwraca ID utworów w kolejności wierszy,
+        - wszystkie powiązania utwór-artysta wstawiane są jednym executemany
+          (TRACK_ARTIST_INSERT),
+        - funkcja nie zatwierdza transakcji - wywołujący może zapisać utwory
+          razem z innymi danymi jednym commitem.
+        Funkcja nie waliduje danych ani plików - przeznaczona jest dla kodu,
+        który zna poprawne wartości i ID artystów (np. seed.py).
+        Parametry:
+            db: Sesja SQLAlchemy.
+            tracks: Lista słowników z kolumnami tabeli `tracks` oraz opcjonalną
+                listą ID artystów pod kluczem "artist_ids".
+        Zwraca:
+            Lista ID utworzonych utworów (w kolejności `tracks`).
+    """
+    if not tracks:
+        return []
 
-    return db_track
+    track_ids = db.scalars(
+        insert(Track).returning(Track.id, sort_by_parameter_order=True),
+        [{key: value for key, value in t.items() if key != "artist_ids"} for t in tracks]
+    ).all()
+
+    links = [
+        {"track_id": track_id, "artist_id": artist_id}
+        for track_id, t in zip(track_ids, tracks)
+        for artist_id in t.get("artist_ids", ())
+    ]
+    if links:
+        db.execute(TRACK_ARTIST_INSERT, links)
 
-def get_tracks(db: Session) -> list[type[Track]]:
+    cache.invalidate(cache.TRACKS_KEY)
+    player.invalidate_track_cache()
+    return track_ids
+
+def get_tracks(db: Session, limit: Optional[int] = None, after_id: int = 0) -> list[type[Track]]:
     """
         Zwraca listę wszystkich utworów zapisanych w bazie danych.
+        Relacje nie są ładowane (raiseload), więc przypadkowy dostęp
+        do nich zgłosi wyjątek zamiast wykonywać osobne zapytanie dla każdego utworu.
+        Jeśli podano `limit`, zwracana jest jedna strona (keyset pagination):
+        rekordy o ID większym niż `after_id`, posortowane rosnąco po ID.
         Parametry:
             db: Sesja SQLAlchemy.
+            limit: Maksymalna liczba rekordów (None - wszystkie).
+            after_id: ID ostatniego rekordu poprzedniej strony.
         Zwraca:
             Lista obiektów Track.
     """
-    return db.query(Track).all()
+    stmt = select(Track).options(raiseload("*"))
+    if limit is not None:
+        stmt = stmt.where(Track.id > after_id).order_by(Track.id).limit(limit)
+    return db.scalars(stmt).all()
 
 def get_track(db: Session, track_id: int) -> Optional[Track]:
     """
         Pobiera pojedynczy utwór na podstawie jego ID.
+        W trybie STRICT_LOADING relacje utworu nie mogą być ładowane leniwie.
         Parametry:
             db: Sesja SQLAlchemy.
             track_id: Identyfikator utworu.
         Zwraca:
             Obiekt Track, jeśli istnieje, w przeciwnym razie None.
     """
-    return db.query(Track).get(track_id)
+    return db.get(Track, track_id, options=_STRICT_OPTIONS)
+
+def _sync_track_artists(db: Session, track_id: int, artist_ids: list[int]) -> None:
+    """
+    Ustawia artystów utworu na podstawie listy ID, operując bezpośrednio
+    na tabeli `track_artist`: wstawia brakujące powiązania i usuwa zbędne.
+    ID, które nie odpowiadają istniejącym artystom, są pomijane.
+    """
+    wanted = set(db.scalars(select(Artist.id).where(Artist.id.in_(artist_ids))))
+    linked = set(db.scalars(
+        select(track_artist.c.artist_id).where(track_artist.c.track_id == track_id)
+    ))
+
+    to_remove = linked - wanted
+    if to_remove:
+        db.execute(
+            delete(track_artist).where(
+                track_artist.c.track_id == track_id,
+                track_artist.c.artist_id.in_(to_remove)
+            )
+        )
+
+    to_add = wanted - linked
+    if to_add:
+        db.execute(
+            TRACK_ARTIST_INSERT,
+            [{"track_id": track_id, "artist_id": artist_id} for artist_id in to_add]
+        )
 
 def update_track(db: Session, track_id: int, data: TrackUpdate) -> Optional[Track]:
     """
@@ -111,10 +227,12 @@ def update_track(db: Session, track_id: int, data: TrackUpdate) -> Optional[Trac
         Mechanizm:
         - pobiera utwór z bazy,
         - jeśli nie istnieje - zwraca None,
-        - aktualizuje wszystkie pola oprócz `artist_ids`,
+        - przepisuje przekazane pola (data.model_fields_set) oprócz
+          `artist_ids` i `file_path` funkcją wygenerowaną przez make_updater,
         - jeśli podano `artist_ids`:
-            * pobiera artystów z bazy,
-            * nadpisuje relację track.artists,
+            * pobiera ID istniejących artystów oraz ID aktualnie przypisanych,
+            * dodaje i usuwa w tabeli `track_artist` tylko różnicę
+              (bez ładowania obiektów Artist i pełnego nadpisywania relacji),
         - jeśli podano nazwę pliku w `file_path`:
             * aktualizuje ścieżkę do pliku,
         - zapisuje zmiany i odświeża obiekt.
@@ -129,28 +247,28 @@ def update_track(db: Session, track_id: int, data: TrackUpdate) -> Optional[Trac
     if not track:
         return None
 
-    update_data = data.model_dump(exclude_unset=True)
-
-    if "file_path" in update_data:
-        _validate_filename(update_data["file_path"])
-        normalized = _normalize_filename(update_data["file_path"])
+    if data.file_path is not None:
+        normalized = _normalize_filename(data.file_path)
+        _validate_filename(normalized)
         track.file_path = f"{TRACK_DIR}/{normalized}"
 
-    for key, value in update_data.items():
-        if key not in ("artist_ids", "file_path"):
-            setattr(track, key, value)
+    make_updater(type(data), ("artist_ids", "file_path"))(track, data)
 
     if data.artist_ids:
-        artists = db.query(Artist).filter(Artist.id.in_(data.artist_ids)).all()
-        track.artists = artists
+        _sync_track_artists(db, track_id, data.artist_ids)
 
     db.commit()
     db.refresh(track)
+    cache.invalidate(cache.TRACKS_KEY, cache.item_key(cache.TRACK_PREFIX, track_id))
+    player.invalidate_track_cache()
     return track
 
 def delete_track(db: Session, track_id: int) -> bool:
     """
         Usuwa utwór z bazy danych.
+        Mechanizm:
+        - usuwa powiązania utworu z artystami i playlistami,
+        - usuwa utwór zapytaniem DELETE ... WHERE id = ? (bez wcześniejszego SELECT).
         Parametry:
             db: Sesja SQLAlchemy.
             track_id: Identyfikator utworu do usunięcia.
@@ -158,9 +276,14 @@ def delete_track(db: Session, track_id: int) -> bool:
             True jeśli utwór został usunięty,
             False jeśli utwór o podanym ID nie istnieje.
     """
-    track = db.get(Track, track_id)
-    if not track:
+    db.execute(delete(track_artist).where(track_artist.c.track_id == track_id))
+    db.execute(delete(playlist_track).where(playlist_track.c.track_id == track_id))
+    result = db.execute(delete(Track).where(Track.id == track_id))
+    if not result.rowcount:
+        db.rollback()
         return False
-    db.delete(track)
+
     db.commit()
+    cache.invalidate(cache.TRACKS_KEY, cache.item_key(cache.TRACK_PREFIX, track_id))
+    player.invalidate_track_cache()
     return True
@@ -0,0 +1,120 @@
+"""
+Moduł pomocniczy warstwy CRUD generujący funkcje aktualizujące obiekty ORM
+na podstawie schematów Pydantic (np. AlbumUpdate, TrackUpdate).
+
+Dla każdego schematu (i zestawu pomijanych pól) jednorazowo kompilowana jest
+funkcja postaci:
+
+    def update(obj, data):
+        fields_set = data.__pydantic_fields_set__
+        if "title" in fields_set:
+            obj.title = data.title
+        ...
+
+Wygenerowana funkcja jest zapamiętywana (lru_cache), więc każda kolejna
+aktualizacja sprowadza się do kilku porównań i przypisań - bez budowania
+słownika `model_dump(exclude_unset=True)` i pętli z `setattr`.
+
+Dla modeli bez relacji modyfikowanych przy aktualizacji dostępna jest też
+funkcja `update_by_id`, wykonująca pojedyncze zapytanie
+UPDATE ... WHERE id = ? RETURNING zamiast pobierania obiektu przed zmianą
+(i bez ponownego SELECT po zatwierdzeniu transakcji).
+
+Funkcja `commit_keep_loaded` zatwierdza transakcję bez wygaszania obiektów
+sesji - wykorzystują ją update_by_id oraz funkcje create_* zapisujące wiersz
+przez INSERT ... RETURNING.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence, TypeVar
+from pydantic import BaseModel
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import ORMOption
+
+ModelT = TypeVar("ModelT")
+
+def commit_keep_loaded(db: Session) -> None:
+    """
+        Zatwierdza transakcję bez wygaszania (expire) obiektów sesji.
+        Obiekty zwrócone przez INSERT/UPDATE ... RETURNING mają już aktualne
+        wartości wszystkich kolumn, więc db.refresh() po commit byłby
+        zbędnym SELECT.
+        Parametry:
+            db: Sesja SQLAlchemy.
+    """
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = True
+
+@lru_cache(maxsize=None)
+def make_updater(
+    schema: type[BaseModel],
+    exclude: tuple[str, ...] = ()
+) -> Callable[[Any, BaseModel], None]:
+    """
+        Zwraca funkcję przepisującą ustawione pola schematu na obiekt ORM.
+        Parametry:
+            schema: Klasa schematu Pydantic z danymi aktualizacji.
+            exclude: Nazwy pól, które nie są przepisywane (obsługiwane osobno).
+        Zwraca:
+            Funkcję `update(obj, data)` aktualizującą tylko pola przekazane
+            w `data` (data.model_fields_set).
+    """
+    lines = [
+        "def update(obj, data):",
+        "    fields_set = data.__pydantic_fields_set__",
+    ]
+    for name in schema.model_fields:
+        if name in exclude:
+            continue
+        lines.append(f"    if {name!r} in fields_set:")
+        lines.append(f"        obj.{name} = data.{name}")
+
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["update"]
+
+def update_by_id(
+    db: Session,
+    model: type[ModelT],
+    obj_id: int,
+    data: BaseModel,
+    options: Sequence[ORMOption] = ()
+) -> Optional[ModelT]:
+    """
+        Aktualizuje rekord o podanym ID jednym zapytaniem UPDATE ... RETURNING.
+        Mechanizm:
+        - zbiera wartości pól przekazanych w `data` (data.model_fields_set),
+        - jeśli nie przekazano żadnego pola - zwraca rekord bez zmian,
+        - wykonuje UPDATE z klauzulą RETURNING, która zwraca obiekt ORM
+          (albo nic, jeśli rekord nie istnieje) wraz z relacjami wskazanymi
+          w `options` (np. selectinload),
+        - zatwierdza transakcję bez wygaszania obiektu - wartości zwrócone
+          przez RETURNING są aktualne, więc db.refresh() byłby zbędnym SELECT.
+        Parametry:
+            db: Sesja SQLAlchemy.
+            model: Klasa modelu ORM (np. Album).
+            obj_id: Identyfikator rekordu.
+            data: Schemat Pydantic z danymi aktualizacji.
+            options: Opcje ładowania relacji zwracanego obiektu.
+        Zwraca:
+            Zaktualizowany obiekt lub None, jeśli rekord nie istnieje.
+    """
+    values = {key: getattr(data, key) for key in data.model_fields_set}
+    if not values:
+        return db.get(model, obj_id, options=options)
+
+    obj = db.execute(
+        update(model)
+        .where(model.id == obj_id)
+        .values(**values)
+        .returning(model)
+        .options(*options)
+    ).scalar_one_or_none()
+    if obj is None:
+        return None
+
+    commit_keep_loaded(db)
+    return obj
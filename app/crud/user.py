@@ -7,44 +7,48 @@ Funkcje umożliwiają:
 - pobieranie pojedynczego użytkownika po ID,
 - aktualizację danych użytkownika,
 - usuwanie użytkowników z bazy danych.
-Moduł wykorzystuje Passlib (bcrypt) do bezpiecznego hashowania haseł
-oraz SQLAlchemy ORM do operacji na bazie danych.
+Moduł wykorzystuje funkcje z `app.security` (bcrypt) do bezpiecznego
+hashowania haseł oraz SQLAlchemy ORM do operacji na bazie danych.
 """
 from typing import Optional
-from passlib.context import CryptContext
-from sqlalchemy import literal_column
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
-from app.models import User
+from app import cache
+from app.crud.updater import commit_keep_loaded, update_by_id
+from app.models import Playlist, User, playlist_track
 from app.schemas import UserRegister, UserUpdate
-
-pwd = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.security import hash_password, verify_password
 
 def register_user(db: Session, user: UserRegister) -> User:
     """
         Rejestruje nowego użytkownika i zapisuje go w bazie danych.
         Mechanizm:
         - hasło użytkownika jest hashowane przy użyciu bcrypt,
-        - tworzony jest obiekt User,
-        - użytkownik jest zapisywany w bazie i odświeżany.
+        - użytkownik jest zapisywany pojedynczym zapytaniem INSERT ... RETURNING,
+          które od razu zwraca obiekt User (bez flush sesji ORM),
+        - transakcja zatwierdzana jest bez ponownego odczytu obiektu
+          (RETURNING zwrócił już wszystkie kolumny).
         Parametry:
             db: Sesja SQLAlchemy.
             user: Obiekt UserRegister zawierający dane rejestracyjne.
         Zwraca:
             Obiekt User zapisany w bazie danych.
         """
-    hashed = pwd.hash(user.password)
-    db_user = User(
-        login=user.login,
-        email=user.email,
-        password=hashed,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        birth_date=user.birth_date,
-        role=user.role.value
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    hashed = hash_password(user.password)
+    db_user = db.execute(
+        insert(User)
+        .values(
+            login=user.login,
+            email=user.email,
+            password=hashed,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            birth_date=user.birth_date,
+            role=user.role.value
+        )
+        .returning(User)
+    ).scalar_one()
+    commit_keep_loaded(db)
     return db_user
 
 def authenticate_user(db: Session, login: str, password: str) -> Optional[User]:
@@ -63,8 +67,8 @@ def authenticate_user(db: Session, login: str, password: str) -> Optional[User]:
         Zwraca:
             Obiekt User, jeśli dane są poprawne, w przeciwnym razie None.
     """
-    user = db.query(User).filter(literal_column("login") == login).first()
-    if not user or not pwd.verify(password, user.password):
+    user = db.scalars(select(User).where(User.login == login)).first()
+    if not user or not verify_password(password, user.password):
         return None
     return user
 
@@ -76,7 +80,7 @@ def get_users(db: Session) -> list[type[User]]:
         Zwraca:
             Lista obiektów User.
     """
-    return db.query(User).all()
+    return db.scalars(select(User)).all()
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
     """
@@ -87,16 +91,16 @@ def get_user(db: Session, user_id: int) -> Optional[User]:
         Zwraca:
             Obiekt User, jeśli istnieje, w przeciwnym razie None.
     """
-    return db.query(User).get(user_id)
+    return db.get(User, user_id)
 
 def update_user(db: Session, user_id: int, data: UserUpdate) -> Optional[User]:
     """
         Aktualizuje dane istniejącego użytkownika.
         Mechanizm:
-        - pobiera użytkownika z bazy,
-        - jeśli nie istnieje - zwraca None,
-        - aktualizuje tylko pola przekazane w `data` (exclude_unset=True),
-        - zapisuje zmiany i odświeża obiekt.
+        - aktualizuje tylko pola przekazane w `data` (data.model_fields_set)
+          jednym zapytaniem UPDATE ... RETURNING (bez wcześniejszego SELECT),
+        - jeśli użytkownik nie istnieje - zwraca None,
+        - zapisuje zmiany bez ponownego odczytu obiektu.
         Parametry:
             db: Sesja SQLAlchemy.
             user_id: Identyfikator użytkownika do aktualizacji.
@@ -104,20 +108,16 @@ def update_user(db: Session, user_id: int, data: UserUpdate) -> Optional[User]:
         Zwraca:
             Zaktualizowany obiekt User lub None, jeśli użytkownik nie istnieje.
     """
-    user = get_user(db, user_id)
-    if not user:
-        return None
-
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(user, key, value)
-
-    db.commit()
-    db.refresh(user)
+    user = update_by_id(db, User, user_id, data)
     return user
 
 def delete_user(db: Session, user_id: int) -> bool:
     """
         Usuwa użytkownika z bazy danych.
+        Mechanizm:
+        - usuwa powiązania playlist użytkownika z utworami (tabela `playlist_track`),
+        - usuwa playlisty użytkownika (kolumna `owner_id` nie dopuszcza NULL),
+        - usuwa użytkownika zapytaniem DELETE ... WHERE id = ? (bez wcześniejszego SELECT).
         Parametry:
             db: Sesja SQLAlchemy.
             user_id: Identyfikator użytkownika do usunięcia.
@@ -125,9 +125,14 @@ def delete_user(db: Session, user_id: int) -> bool:
             True jeśli użytkownik został usunięty,
             False jeśli użytkownik o podanym ID nie istnieje.
     """
-    user = db.get(User, user_id)
-    if not user:
+    owned = select(Playlist.id).where(Playlist.owner_id == user_id).scalar_subquery()
+    db.execute(delete(playlist_track).where(playlist_track.c.playlist_id.in_(owned)))
+    db.execute(delete(Playlist).where(Playlist.owner_id == user_id))
+    result = db.execute(delete(User).where(User.id == user_id))
+    if not result.rowcount:
+        db.rollback()
         return False
-    db.delete(user)
+
     db.commit()
+    cache.invalidate(cache.PLAYLISTS_KEY)
     return True
@@ -6,13 +6,18 @@ Zawiera:
 - konfigurację silnika bazy danych (`engine`),
 - fabrykę sesji (`SessionLocal`),
 - bazową klasę modeli (`Base`),
+- funkcję `init_db()` tworzącą brakujące tabele i uzupełniającą klucze
+  oraz indeksy w bazach utworzonych przez starszą wersję schematu,
+- przełącznik `STRICT_LOADING` (tryb ścisłego ładowania relacji),
 - zależność FastAPI `get_db()` zwracającą sesję w kontekście żądania.
 
 Moduł korzysta z SQLite jako lokalnej bazy danych, jednak konfiguracja jest
 łatwa do rozszerzenia na inne silniki (PostgreSQL, MySQL, itp.).
 """
-from sqlalchemy import create_engine
+import os
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 
 """
 Ścieżka połączenia z bazą danych.
@@ -21,12 +26,64 @@ Format:
 """
 DATABASE_URL: str = "sqlite:///./playlist.db"
 
+"""
+Tryb ścisłego ładowania relacji (zmienna środowiskowa STRICT_LOADING=1).
+Przeznaczony dla środowiska deweloperskiego i testów: obiekty zwracane przez
+funkcje CRUD pobierające pojedynczy rekord (np. get_playlist, get_track) mają
+wtedy ustawione raiseload("*"), więc leniwe ładowanie relacji przy budowie
+odpowiedzi zgłasza wyjątek zamiast wykonywać dodatkowe zapytanie.
+"""
+STRICT_LOADING: bool = os.getenv("STRICT_LOADING") == "1"
+
 """
 Silnik bazy danych SQLAlchemy.
 Parametr `check_same_thread=False` jest wymagany przez SQLite,
 aby umożliwić korzystanie z bazy w wielu wątkach (np. w FastAPI).
+Pula połączeń (QueuePool):
+- pool_size=20 - liczba stale utrzymywanych połączeń,
+- max_overflow=10 - dodatkowe połączenia tworzone przy chwilowym przeciążeniu,
+- pool_timeout=30 - maksymalny czas oczekiwania na wolne połączenie (s),
+- pool_pre_ping=True - wykrywanie zerwanych połączeń przed ich użyciem,
+- pool_recycle=3600 - okresowa wymiana połączeń (s),
+- pool_use_lifo=True - ponowne użycie ostatnio zwolnionego połączenia,
+  dzięki czemu w użyciu pozostaje niewielki zestaw "rozgrzanych" połączeń.
+Łączna liczba połączeń (POOL_SIZE + MAX_OVERFLOW) wyznacza też rozmiar puli
+wątków obsługującej synchroniczne endpointy (zob. `app.main.lifespan`).
 """
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+POOL_SIZE: int = 20
+MAX_OVERFLOW: int = 10
+
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    pool_use_lifo=True,
+)
+
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_connection, _connection_record):
+    """
+    Ustawia parametry SQLite dla każdego nowego połączenia z puli:
+    - journal_mode=WAL - odczyty nie blokują zapisu (i odwrotnie),
+    - synchronous=NORMAL - mniej wywołań fsync przy zatwierdzaniu transakcji
+      (w trybie WAL bezpieczne przy awarii aplikacji),
+    - temp_store=MEMORY - tabele tymczasowe w pamięci RAM,
+    - mmap_size=256 MB - odczyt pliku bazy przez mapowanie pamięci,
+    - cache_size=-65536 - cache stron o rozmiarze 64 MB.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
 """
 Fabryka sesji SQLAlchemy.
 Ustawienia:
@@ -42,6 +99,57 @@ automatycznie tworzyć tabele i mapować obiekty na rekordy.
 """
 Base = declarative_base()
 
+def init_db() -> None:
+    """
+    Tworzy w bazie danych tabele, które jeszcze nie istnieją, i uzupełnia
+    schemat istniejącej bazy (upgrade_schema).
+    Wywoływana jednorazowo przy starcie aplikacji (lifespan FastAPI)
+    oraz przez skrypt seed.py - nie przy imporcie modułów.
+    """
+    import app.models  # noqa: F401 - rejestracja modeli w Base.metadata
+
+    with engine.begin() as connection:
+        Base.metadata.create_all(bind=connection)
+        upgrade_schema(connection)
+
+def upgrade_schema(connection) -> None:
+    """
+    Dostosowuje bazę utworzoną przez starszą wersję schematu do modeli.
+    create_all nie modyfikuje istniejących tabel, więc:
+    - tabele asocjacyjne bez złożonego klucza głównego (playlist_track,
+      track_artist) są przebudowywane: stara tabela zmienia nazwę, nowa
+      tworzona jest z modelu, a powiązania kopiowane są bez duplikatów
+      (INSERT OR IGNORE) - bez klucza wstawianie z ON CONFLICT DO NOTHING
+      kończy się błędem,
+    - brakujące indeksy zdefiniowane w modelach są tworzone.
+    Inne ograniczenia (np. CHECK) dotyczą tylko nowych baz - starą bazę
+    należy utworzyć ponownie (zob. README).
+    Dla bazy zgodnej z modelami funkcja nic nie zmienia.
+    Parametry:
+        connection: Połączenie SQLAlchemy w otwartej transakcji.
+    """
+    from app.models import playlist_track, track_artist
+
+    inspector = inspect(connection)
+    for table in (playlist_track, track_artist):
+        if inspector.get_pk_constraint(table.name)["constrained_columns"]:
+            continue
+
+        legacy = f"{table.name}_legacy"
+        columns = ", ".join(column.name for column in table.columns)
+        connection.exec_driver_sql(f"ALTER TABLE {table.name} RENAME TO {legacy}")
+        for index in inspect(connection).get_indexes(legacy):
+            connection.exec_driver_sql(f"DROP INDEX {index['name']}")
+        table.create(connection)
+        connection.exec_driver_sql(
+            f"INSERT OR IGNORE INTO {table.name} ({columns}) SELECT {columns} FROM {legacy}"
+        )
+        connection.exec_driver_sql(f"DROP TABLE {legacy}")
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
 def get_db():
     """
     Zależność FastAPI zwracająca sesję bazy danych.
@@ -1,6 +1,6 @@
 """
 Moduł odpowiedzialny za uwierzytelnianie i autoryzację użytkowników w aplikacji.
-Zawiera dwie główne zależności FastAPI:
+Zawiera następujące zależności FastAPI (oraz fabrykę zależności playlist):
 1. get_current_user
    - pobiera identyfikator użytkownika z ciasteczka `session_id`,
    - weryfikuje ważność sesji,
@@ -10,11 +10,24 @@ Zawiera dwie główne zależności FastAPI:
    - rozszerza get_current_user,
    - sprawdza, czy użytkownik ma rolę administratora,
    - w przeciwnym razie zgłasza błąd HTTP 403.
+3. require_playlist_owner(forbidden_detail)
+   - tworzy zależność rozszerzającą get_current_user o sprawdzenie uprawnień
+     do playlisty `playlist_id` (parametr ścieżki),
+   - jednym zapytaniem pobiera ID właściciela playlisty (404, jeśli nie istnieje),
+   - zgłasza błąd HTTP 403 z podaną treścią, jeśli użytkownik nie jest
+     właścicielem ani administratorem.
+4. Zależności utworzone przez require_playlist_owner:
+   - playlist_owner_or_admin - operacje modyfikujące playlistę
+     ("You are not allowed to modify this playlist"),
+   - playlist_delete_owner_or_admin - usuwanie playlisty
+     ("You are not allowed to delete this playlist").
 Mechanizm ten pozwala na łatwe zabezpieczanie endpointów FastAPI
-poprzez dodanie Depends(get_current_user) lub Depends(admin_required).
+poprzez dodanie Depends(get_current_user), Depends(admin_required)
+lub Depends(playlist_owner_or_admin).
 """
 from fastapi import Depends, Cookie, HTTPException
 from sqlalchemy.orm import Session
+from . import crud
 from .database import get_db
 from .session import get_user_id
 from .models import User
@@ -70,4 +83,50 @@ def admin_required(user: User = Depends(get_current_user)):
     """
     if user.role != "admin":
         raise HTTPException(status_code=403, detail="Administrator access required")
-    return user
\ No newline at end of file
+    return user
+
+def require_playlist_owner(forbidden_detail: str):
+    """
+        Tworzy zależność wymagającą, aby aktualnie zalogowany użytkownik był
+        właścicielem playlisty `playlist_id` (parametr ścieżki) lub administratorem.
+        Parametry:
+            forbidden_detail: Treść błędu HTTP 403 (zależna od operacji).
+        Zwraca:
+            Funkcję zależności FastAPI zwracającą ID właściciela playlisty.
+    """
+    def dependency(
+        playlist_id: int,
+        db: Session = Depends(get_db),
+        user: User = Depends(get_current_user),
+    ) -> int:
+        """
+            Mechanizm:
+            - pobiera tylko ID właściciela playlisty (bez ładowania obiektu),
+            - jeśli playlista nie istnieje - błąd HTTP 404,
+            - jeśli użytkownik nie jest właścicielem ani administratorem - błąd HTTP 403.
+            Parametry:
+                playlist_id: Identyfikator playlisty z parametru ścieżki.
+                db: Sesja bazy danych wstrzyknięta przez FastAPI.
+                user: Obiekt User pobrany automatycznie przez FastAPI.
+            Zwraca:
+                ID właściciela playlisty.
+            Wyjątki:
+                HTTPException(404): jeśli playlista nie istnieje.
+                HTTPException(403): jeśli użytkownik nie ma uprawnień do playlisty.
+        """
+        owner_id = crud.get_playlist_owner_id(db, playlist_id)
+        if owner_id is None:
+            raise HTTPException(status_code=404, detail="Playlist not found")
+
+        if owner_id != user.id and user.role != "admin":
+            raise HTTPException(status_code=403, detail=forbidden_detail)
+
+        return owner_id
+
+    return dependency
+
+# Zależność dla operacji modyfikujących playlistę (edycja, usuwanie utworów).
+playlist_owner_or_admin = require_playlist_owner("You are not allowed to modify this playlist")
+
+# Zależność dla usuwania playlisty.
+playlist_delete_owner_or_admin = require_playlist_owner("You are not allowed to delete this playlist")
\ No newline at end of file
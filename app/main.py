@@ -1,10 +1,24 @@
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
-from app.database import Base, engine
+from app.database import init_db, POOL_SIZE, MAX_OVERFLOW
 from app.routers import auth, users, artists, albums, tracks, playlists, websocket
 
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+        Tworzy brakujące tabele jednorazowo przy starcie aplikacji,
+        zamiast przy każdym imporcie modułu.
+        Ustawia też liczbę wątków puli, w której FastAPI wykonuje synchroniczne
+        endpointy, na liczbę połączeń puli bazy danych. Każdy wątek może wtedy
+        od razu pobrać połączenie, a nadmiarowe żądania czekają na wolny wątek
+        zamiast blokować wątki w oczekiwaniu na połączenie (pool_timeout).
+    """
+    init_db()
+    to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE + MAX_OVERFLOW
+    yield
 
-app = FastAPI(title="Playlist Manager", version="1.0.0")
+app = FastAPI(title="Playlist Manager", version="1.0.0", lifespan=lifespan)
 
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -19,10 +19,19 @@ w jednym miejscu, umożliwiając wygodny import:
 
 Dzięki temu warstwa modeli jest uporządkowana, modularna i łatwa w użyciu
 w pozostałych częściach aplikacji.
+
+Po zaimportowaniu wszystkich modeli wywoływane jest `configure_mappers()`,
+aby konfiguracja mapperów (relacje, back_populates) odbyła się przy imporcie,
+a nie leniwie podczas pierwszego żądania.
 """
+from sqlalchemy.orm import configure_mappers
 from .user import User, UserRole
 from .artist import Artist
 from .album import Album
 from .track import Track
 from .playlist import Playlist
-from .associations import playlist_track, track_artist
+from .associations import (
+    playlist_track, track_artist, TRACK_ARTIST_INSERT
+)
+
+configure_mappers()
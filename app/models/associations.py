@@ -14,22 +14,40 @@ track_artist
 
 Struktura:
 Każda tabela składa się wyłącznie z dwóch kolumn będących kluczami obcymi
-do odpowiednich tabel głównych. Nie posiadają one własnych kluczy głównych,
-ponieważ kombinacja dwóch kluczy obcych pełni rolę unikalnego powiązania.
+do odpowiednich tabel głównych. Kombinacja dwóch kluczy obcych stanowi
+złożony klucz główny, dzięki czemu powiązanie jest unikalne, a wyszukiwanie
+po pierwszej kolumnie klucza korzysta z indeksu. Klucze obce deklarują
+ON DELETE CASCADE, ale SQLite egzekwuje takie akcje tylko przy włączonym
+PRAGMA foreign_keys=ON, którego database._sqlite_pragmas nie ustawia -
+powiązania usuwają jawnie funkcje CRUD delete_* (np. delete_track,
+delete_playlist, delete_artist, delete_user).
+Druga kolumna klucza ma osobny indeks, wykorzystywany przy wyszukiwaniu
+powiązań od drugiej strony (np. usuwanie utworu ze wszystkich playlist).
+
+Instrukcje INSERT:
+TRACK_ARTIST_INSERT jest budowany jednorazowo przy imporcie modułu
+i współdzielony przez warstwę CRUD (powiązania playlist z utworami wstawia
+crud.add_tracks_to_playlist własnym INSERT ... ON CONFLICT DO NOTHING).
+Wartości przekazywane są jako parametry wykonania (lista słowników -
+executemany), więc ten sam obiekt instrukcji trafia do cache kompilacji SQLAlchemy przy każdym wywołaniu.
 """
-from sqlalchemy import Table, Column, ForeignKey
+from sqlalchemy import Table, Column, ForeignKey, Index, insert
 from app.database import Base
 
 playlist_track = Table(
     "playlist_track",
     Base.metadata,
-    Column("playlist_id", ForeignKey("playlists.id")),
-    Column("track_id", ForeignKey("tracks.id")),
+    Column("playlist_id", ForeignKey("playlists.id", ondelete="CASCADE"), primary_key=True),
+    Column("track_id", ForeignKey("tracks.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_playlist_track_track_id", "track_id"),
 )
 
 track_artist = Table(
     "track_artist",
     Base.metadata,
-    Column("track_id", ForeignKey("tracks.id")),
-    Column("artist_id", ForeignKey("artists.id")),
+    Column("track_id", ForeignKey("tracks.id", ondelete="CASCADE"), primary_key=True),
+    Column("artist_id", ForeignKey("artists.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_track_artist_artist_id", "artist_id"),
 )
+
+TRACK_ARTIST_INSERT = insert(track_artist)
@@ -11,10 +11,14 @@ name : str
     Nazwa playlisty. Musi mieć od 1 do 100 znaków (walidowane przez CheckConstraint).
 owner_id : int
     Klucz obcy wskazujący na użytkownika będącego właścicielem playlisty.
+    Indeksowany (liczenie i wyszukiwanie playlist danego użytkownika).
 owner : User
     Relacja ORM do modelu User (wiele playlist - jeden użytkownik).
 tracks : list[Track]
     Relacja many‑to‑many do modelu Track poprzez tabelę pośrednią `playlist_track`.
+track_ids : list[int]
+    Właściwość tylko do odczytu — identyfikatory utworów playlisty
+    (pozwala budować PlaylistOut przez model_validate bez ręcznego mapowania).
 
 Ograniczenia:
 playlist_name_length :
@@ -43,7 +47,11 @@ class Playlist(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
 
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     owner = relationship("User", back_populates="playlists")
 
     tracks = relationship("Track", secondary=playlist_track)
+
+    @property
+    def track_ids(self) -> list[int]:
+        return [t.id for t in self.tracks]
@@ -13,10 +13,15 @@ duration : int
     Czas trwania utworu w sekundach. Musi być większy od 0 i mniejszy niż 86400.
 album_id : int | None
     Klucz obcy wskazujący na album, do którego należy utwór. Pole opcjonalne.
+    Indeksowany (pobieranie utworów albumu). Po usunięciu albumu
+    ustawiany na NULL (ON DELETE SET NULL).
 album : Album | None
     Relacja ORM do modelu Album (wiele utworów - jeden album).
 artists : list[Artist]
     Relacja many‑to‑many do modelu Artist poprzez tabelę pośrednią `track_artist`.
+artist_ids : list[int]
+    Właściwość tylko do odczytu — identyfikatory artystów utworu
+    (pozwala budować TrackOut przez model_validate bez ręcznego mapowania).
 
 Ograniczenia:
 duration_range :
@@ -51,7 +56,11 @@ class Track(Base):
 
     file_path = Column(String, nullable=True)
 
-    album_id = Column(Integer, ForeignKey("albums.id"))
+    album_id = Column(Integer, ForeignKey("albums.id", ondelete="SET NULL"), index=True)
     album = relationship("Album", back_populates="tracks")
 
     artists = relationship("Artist", secondary=track_artist)
+
+    @property
+    def artist_ids(self) -> list[int]:
+        return [a.id for a in self.artists]
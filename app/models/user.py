@@ -16,8 +16,9 @@ id : int
     Klucz główny użytkownika.
 login : str
     Login użytkownika. Musi mieć od 3 do 30 znaków i być unikalny.
+    Objęty unikalnym indeksem `ix_users_login` (wyszukiwanie przy logowaniu).
 email : str
-    Adres e‑mail użytkownika. Musi być unikalny.
+    Adres e‑mail użytkownika. Musi być unikalny (unikalny indeks `ix_users_email`).
 password : str
     Zahashowane hasło użytkownika. Minimalna długość 60 znaków (hash bcrypt).
 first_name : str | None
@@ -26,8 +27,17 @@ last_name : str | None
     Nazwisko użytkownika. Pole opcjonalne.
 birth_date : date | None
     Data urodzenia użytkownika. Pole opcjonalne.
-role : UserRole
-    Rola użytkownika w systemie. Domyślnie "user".
+role : str
+    Rola użytkownika w systemie (wartość UserRole). Domyślnie "user".
+    Przechowywana jako tekst; dozwolone wartości pilnuje CheckConstraint.
+
+Ograniczenia:
+login_length :
+    Zapewnia, że login ma od 3 do 30 znaków.
+password_hash_length :
+    Zapewnia, że hash hasła ma co najmniej 60 znaków.
+role_check :
+    Zapewnia, że rola ma jedną z wartości UserRole ("admin", "user").
 
 Relacje:
 playlists :
@@ -35,7 +45,7 @@ playlists :
     Powiązanie z modelem Playlist poprzez `owner` (back_populates).
 """
 import enum
-from sqlalchemy import Column, Integer, String, Date, Enum
+from sqlalchemy import Column, Integer, String, Date
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.schema import CheckConstraint
 from app.database import Base
@@ -50,16 +60,17 @@ class User(Base):
     __table_args__ = (
         CheckConstraint("length(login) >= 3 AND length(login) <= 30", name="login_length"),
         CheckConstraint("length(password) >= 60", name="password_hash_length"),
+        CheckConstraint("role IN ('admin', 'user')", name="role_check"),
     )
 
     id = Column(Integer, primary_key=True)
-    login = Column(String(30), unique=True, nullable=False)
-    email = Column(String(255), unique=True, nullable=False)
+    login = Column(String(30), unique=True, index=True, nullable=False)
+    email = Column(String(255), unique=True, index=True, nullable=False)
     password = Column(String(255), nullable=False)
     first_name = Column(String(50))
     last_name = Column(String(50))
     birth_date = Column(Date, nullable=False)
 
-    role = Column(Enum(UserRole), default=UserRole.user, nullable=False)
+    role = Column(String(16), default=UserRole.user.value, nullable=False)
 
     playlists = relationship("Playlist", back_populates="owner")
@@ -0,0 +1,58 @@
+"""
+Moduł implementujący stronicowanie (keyset pagination) list zasobów
+zwracanych przez endpointy `GET /artists`, `GET /tracks` oraz `GET /playlists`.
+
+Klient przekazuje parametry zapytania:
+- `limit` — maksymalna liczba rekordów na stronie,
+- `cursor` — ID ostatniego rekordu poprzedniej strony (zwracane są rekordy
+  o większym ID, posortowane rosnąco po ID).
+
+Zapytanie do bazy ma postać `WHERE id > :cursor ORDER BY id LIMIT :limit`,
+więc koszt pobrania strony nie zależy od jej położenia w tabeli (w odróżnieniu
+od OFFSET). Jeśli strona jest pełna, odpowiedź zawiera nagłówek
+`X-Next-Cursor` z kursorem następnej strony.
+
+Bez parametrów `limit` i `cursor` endpointy zwracają pełną listę z cache
+(zachowanie zgodne wstecz).
+
+Zmienne globalne:
+DEFAULT_PAGE_SIZE: int
+    Rozmiar strony, gdy podano tylko `cursor`.
+
+MAX_PAGE_SIZE: int
+    Największa dopuszczalna wartość `limit`.
+"""
+from typing import Any, Optional, Tuple
+from fastapi import Query, Response
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def page_params(
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[int] = Query(default=None, ge=0)
+) -> Optional[Tuple[int, int]]:
+    """
+        Zależność FastAPI odczytująca parametry stronicowania.
+        Parametry:
+            limit: Maksymalna liczba rekordów na stronie (lub None).
+            cursor: ID ostatniego rekordu poprzedniej strony (lub None).
+        Zwraca:
+            Krotka (limit, cursor) lub None, jeśli klient nie żąda stronicowania.
+    """
+    if limit is None and cursor is None:
+        return None
+    return limit or DEFAULT_PAGE_SIZE, cursor or 0
+
+def set_next_cursor(response: Response, items: list[dict[str, Any]], limit: int) -> None:
+    """
+        Ustawia nagłówek X-Next-Cursor, jeśli po tej stronie mogą istnieć kolejne rekordy.
+        Parametry:
+            response: Odpowiedź HTTP.
+            items: Zserializowane rekordy bieżącej strony.
+            limit: Rozmiar strony.
+    """
+    if len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(items[-1]["id"])
@@ -7,35 +7,226 @@ Zawiera:
 - obsługę czasu odtwarzania,
 - tryby pętli (loop track / loop playlist),
 - tryb playlisty/albumu,
-- funkcje sterujące (play, stop, skip, tick, select_*).
+- funkcje sterujące (play, stop, skip, tick, fast_forward, select_*).
 
-Moduł działa w trybie globalnego stanu – wszystkie funkcje operują na wspólnych
-zmiennych globalnych, co pozwala na prostą integrację z WebSocketem.
+Stan odtwarzacza przechowywany jest w pojedynczym obiekcie `state`
+(klasa PlayerState), na którym operują wszystkie funkcje modułu,
+co pozwala na prostą integrację z WebSocketem.
+
+Operacje wymagające bazy danych rozdzielone są na odczyt (`load_*`,
+bez zmiany stanu - bezpieczny w puli wątków) oraz zastosowanie wyniku
+(`play_track`, `enqueue`, `play_playlist`, `play_album`), które zmienia
+`state` i musi być wywoływane w wątku pętli zdarzeń, tak jak tick().
+Funkcje `select_*` i `add_to_queue` łączą oba kroki.
 """
 from collections import deque
-from typing import Deque, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Deque, Iterator, NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session, scoped_session, selectinload
 from app.database import SessionLocal
 from app.models import Track, Playlist, Album
 
-# Kolejka utworów oczekujących na odtworzenie.
-# FIFO – pierwszy dodany utwór zostanie odtworzony jako pierwszy.
-queue: Deque[Track] = deque()
-# Aktualnie odtwarzany utwór. None oznacza brak aktywnego odtwarzania.
-current: Optional[Track] = None
-# Liczba sekund od początku aktualnie odtwarzanego utworu.
-elapsed: int = 0
-# Flaga informująca, czy odtwarzanie jest wstrzymane.
-is_paused: bool = False
-# Czy aktualny utwór ma być zapętlany po zakończeniu.
-loop_track: bool = False
-# Czy cała playlista/album ma być zapętlany po zakończeniu.
-loop_playlist: bool = False
-# Czy odtwarzacz działa w trybie playlisty/albumu (True) czy kolejki (False).
-playlist_mode: bool = False
-# Lista utworów aktualnie wybranej playlisty lub albumu.
-playlist_tracks: list[Track] = []
-# Indeks aktualnie odtwarzanego utworu w playliście/albumie.
-playlist_index: int = 0
+# Sesje bazy danych przypisane do wątków (scoped_session).
+# Wykorzystywane, gdy funkcje odtwarzacza wywoływane są poza połączeniem
+# WebSocket (np. w testach lub skryptach).
+_db = scoped_session(SessionLocal)
+# Sesja bazy danych przypisana do bieżącego połączenia WebSocket.
+# run_in_threadpool kopiuje kontekst, więc sesja jest widoczna także
+# w wątkach puli wykonujących operacje odtwarzacza.
+_connection_db: ContextVar[Optional[Session]] = ContextVar("player_db", default=None)
+
+class TrackSnap(NamedTuple):
+    """
+        Lekka, niezależna od sesji kopia danych utworu wykorzystywana
+        przez kolejkę odtwarzania i wybór pojedynczego utworu.
+    """
+    id: int
+    title: str
+    duration: int
+    file_path: Optional[str]
+
+@dataclass(slots=True)
+class PlayerState:
+    """
+        Stan odtwarzacza.
+        Atrybuty:
+            queue: Kolejka utworów oczekujących na odtworzenie (FIFO).
+            queue_index: Indeks kolejki: ID utworu -> wpisy tego utworu
+                w kolejności dodania; pozwala sprawdzić obecność utworu
+                w kolejce bez przeglądania całej kolejki.
+            queue_titles: Zapamiętana lista tytułów utworów w kolejce
+                (None - do ponownego zbudowania po zmianie kolejki).
+            current: Aktualnie odtwarzany utwór (None - brak odtwarzania).
+            current_duration: Długość aktualnego utworu w sekundach,
+                zapamiętana przy jego ustawieniu (0 - brak utworu).
+            elapsed: Liczba sekund od początku aktualnego utworu.
+            is_paused: Czy odtwarzanie jest wstrzymane.
+            loop_track: Czy aktualny utwór ma być zapętlany.
+            loop_playlist: Czy cała playlista/album ma być zapętlany.
+            playlist_mode: Czy odtwarzacz działa w trybie playlisty/albumu
+                (True) czy kolejki (False).
+            advance: Funkcja przejścia do następnego utworu odpowiadająca
+                trybowi odtwarzania (_advance_playlist lub _advance_queue),
+                ustawiana razem z playlist_mode.
+            playlist_tracks: Utwory aktualnie wybranej playlisty lub albumu.
+            playlist_len: Liczba utworów w playlist_tracks.
+            playlist_index: Indeks aktualnego utworu w playliście/albumie.
+    """
+    queue: Deque[TrackSnap] = field(default_factory=deque)
+    queue_index: dict[int, list[TrackSnap]] = field(default_factory=dict)
+    queue_titles: Optional[list[str]] = None
+    current: Optional[Track | TrackSnap] = None
+    current_duration: int = 0
+    elapsed: int = 0
+    is_paused: bool = False
+    loop_track: bool = False
+    loop_playlist: bool = False
+    playlist_mode: bool = False
+    advance: Callable[[], Optional[Track | TrackSnap]] = field(
+        default_factory=lambda: _advance_queue
+    )
+    playlist_tracks: list[Track] = field(default_factory=list)
+    playlist_len: int = 0
+    playlist_index: int = 0
+
+def _advance_playlist() -> Optional[Track]:
+    """
+        Przechodzi do kolejnego utworu playlisty/albumu.
+        Po ostatnim utworze restartuje playlistę (loop_playlist=True)
+        lub zatrzymuje odtwarzanie.
+        Zwraca:
+            Nowy aktualny utwór lub None.
+    """
+    state.playlist_index += 1
+
+    if state.playlist_index >= state.playlist_len:
+        if not state.loop_playlist:
+            stop_all()
+            return None
+        state.playlist_index = 0
+
+    return _set_current(state.playlist_tracks[state.playlist_index])
+
+def _advance_queue() -> Optional[TrackSnap]:
+    """
+        Pobiera kolejny utwór z kolejki lub zatrzymuje odtwarzanie,
+        jeśli kolejka jest pusta.
+        Zwraca:
+            Nowy aktualny utwór lub None.
+    """
+    if state.queue:
+        return _set_current(_pop_queue())
+
+    stop_all()
+    return None
+
+# Jedyny, współdzielony stan odtwarzacza.
+state = PlayerState()
+
+@contextmanager
+def connection_session() -> Iterator[Session]:
+    """
+        Tworzy sesję bazy danych na czas połączenia WebSocket.
+        Wszystkie operacje odtwarzacza wykonywane w ramach połączenia
+        korzystają z tej samej sesji; po rozłączeniu sesja jest zamykana.
+    """
+    db = SessionLocal()
+    token = _connection_db.set(db)
+    try:
+        yield db
+    finally:
+        _connection_db.reset(token)
+        db.close()
+
+@contextmanager
+def _session() -> Iterator[Session]:
+    """
+        Udostępnia sesję bieżącego połączenia WebSocket (a poza połączeniem -
+        sesję bieżącego wątku) i zamyka ją po użyciu. Zamknięcie kończy
+        transakcję i zwalnia połączenie z puli, więc kolejne odczyty widzą
+        aktualne dane, a sam obiekt Session może być użyty ponownie.
+        Pobrane obiekty pozostają dostępne (odłączone od sesji) z już
+        załadowanymi kolumnami, więc odtwarzacz może je dalej przechowywać.
+    """
+    db = _connection_db.get() or _db()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@lru_cache(maxsize=4096)
+def _get_track_snapshot(track_id: int) -> Optional[TrackSnap]:
+    """
+        Pobiera dane utworu potrzebne odtwarzaczowi (id, tytuł, czas trwania,
+        ścieżka pliku). Wynik jest zapamiętywany, więc ponowny wybór tego samego
+        utworu nie wymaga zapytania do bazy danych.
+        Parametry:
+            track_id: ID utworu.
+        Zwraca:
+            TrackSnap lub None, jeśli utwór nie istnieje.
+    """
+    with _session() as db:
+        row = db.execute(
+            select(Track.id, Track.title, Track.duration, Track.file_path)
+            .where(Track.id == track_id)
+        ).first()
+    return TrackSnap(*row) if row else None
+
+def invalidate_track_cache() -> None:
+    """
+        Czyści zapamiętane dane utworów.
+        Wywoływane przez warstwę CRUD po utworzeniu, zmianie lub usunięciu utworu.
+    """
+    _get_track_snapshot.cache_clear()
+
+def _set_current(track: Optional[Track | TrackSnap]) -> Optional[Track | TrackSnap]:
+    """
+        Ustawia aktualny utwór i zapamiętuje jego długość,
+        dzięki czemu tick() nie odczytuje atrybutu utworu co sekundę.
+        Parametry:
+            track: Nowy aktualny utwór lub None.
+        Zwraca:
+            Ustawiony utwór.
+    """
+    state.current = track
+    state.current_duration = track.duration if track is not None else 0
+    return track
+
+def _set_playlist_tracks(tracks: list[Track]) -> None:
+    """
+        Ustawia utwory playlisty/albumu wraz z ich liczbą.
+        Parametry:
+            tracks: Lista utworów.
+    """
+    state.playlist_tracks = tracks
+    state.playlist_len = len(tracks)
+
+def _clear_queue():
+    """
+        Czyści kolejkę odtwarzania wraz z jej indeksem.
+    """
+    state.queue.clear()
+    state.queue_index.clear()
+    state.queue_titles = None
+
+def _pop_queue() -> TrackSnap:
+    """
+        Pobiera pierwszy utwór z kolejki i usuwa go z indeksu.
+        Zwraca:
+            Pierwszy utwór z kolejki.
+    """
+    track = state.queue.popleft()
+    state.queue_titles = None
+    entries = state.queue_index.get(track.id)
+    if entries and entries[0] is track:
+        entries.pop(0)
+        if not entries:
+            del state.queue_index[track.id]
+    return track
 
 def reset():
     """
@@ -47,18 +238,15 @@ def reset():
         - czas odtwarzania na 0,
         - wyłącza pauzę i tryby loop.
     """
-    global queue, current, elapsed, loop_track, loop_playlist
-    global playlist_mode, playlist_tracks, playlist_index, is_paused
-
-    queue.clear()
-    current = None
-    elapsed = 0
-    loop_track = False
-    loop_playlist = False
-    playlist_mode = False
-    playlist_tracks = []
-    playlist_index = 0
-    is_paused = False
+    _clear_queue()
+    _set_current(None)
+    state.elapsed = 0
+    state.loop_track = False
+    state.loop_playlist = False
+    _set_playlist_mode(False)
+    _set_playlist_tracks([])
+    state.playlist_index = 0
+    state.is_paused = False
 
 def is_stopped() -> bool:
     """
@@ -66,7 +254,7 @@ def is_stopped() -> bool:
         Zwraca:
             True jeśli nie ma aktualnie uruchomionego utworu, False w przeciwnym razie.
     """
-    return current is None
+    return state.current is None
 
 def reset_loops():
     """
@@ -74,9 +262,19 @@ def reset_loops():
         - loop_track,
         - loop_playlist.
     """
-    global loop_track, loop_playlist
-    loop_track = False
-    loop_playlist = False
+    state.loop_track = False
+    state.loop_playlist = False
+
+def load_track(track_id: int) -> Optional[TrackSnap]:
+    """
+        Odczytuje z bazy dane utworu dla odtwarzacza (bez zmiany stanu
+        odtwarzacza - może być wywoływana w puli wątków).
+        Parametry:
+            track_id: ID utworu w bazie danych.
+        Zwraca:
+            TrackSnap lub None, jeśli utwór nie istnieje.
+    """
+    return _get_track_snapshot(track_id)
 
 def add_to_queue(track_id: int) -> None:
     """
@@ -85,14 +283,23 @@ def add_to_queue(track_id: int) -> None:
         Parametry:
             track_id: ID utworu w bazie danych.
     """
-    db = SessionLocal()
-    track = db.get(Track, track_id)
+    enqueue(load_track(track_id))
+
+def enqueue(track: Optional[TrackSnap]) -> None:
+    """
+        Dodaje wczytany utwór (load_track) do kolejki odtwarzania.
+        Jeśli odtwarzacz jest zatrzymany, automatycznie rozpoczyna odtwarzanie.
+        Parametry:
+            track: Utwór do dodania lub None (nic nie jest zmieniane).
+    """
     if not track:
         return
 
-    queue.append(track)
+    state.queue_index.setdefault(track.id, []).append(track)
+    state.queue.append(track)
+    state.queue_titles = None
 
-    if current is None:
+    if state.current is None:
         play()
 
 def remove_from_queue(track_id: int) -> bool:
@@ -103,19 +310,56 @@ def remove_from_queue(track_id: int) -> bool:
         Zwraca:
             True jeśli utwór został usunięty, False jeśli nie znaleziono.
     """
-    for t in list(queue):
-        if t.id == track_id:
-            queue.remove(t)
-            return True
-    return False
+    entries = state.queue_index.get(track_id)
+    if not entries:
+        return False
 
-def get_queue():
+    track = entries.pop(0)
+    if not entries:
+        del state.queue_index[track_id]
+    state.queue.remove(track)
+    state.queue_titles = None
+    return True
+
+def remove_many_from_queue(track_ids: set[int]) -> int:
+    """
+        Usuwa z kolejki wszystkie wystąpienia utworów o podanych ID.
+        Kolejka i jej indeks przebudowywane są w jednym przejściu,
+        zamiast wywoływać remove_from_queue osobno dla każdego utworu.
+        Parametry:
+            track_ids: Zbiór ID utworów do usunięcia.
+        Zwraca:
+            Liczba usuniętych wpisów kolejki.
+    """
+    if not track_ids.intersection(state.queue_index):
+        return 0
+
+    before = len(state.queue)
+    state.queue = deque(t for t in state.queue if t.id not in track_ids)
+    for track_id in track_ids:
+        state.queue_index.pop(track_id, None)
+    state.queue_titles = None
+    return before - len(state.queue)
+
+def get_queue() -> tuple[TrackSnap, ...]:
+    """
+        Zwraca aktualną kolejkę odtwarzania.
+        Zwraca:
+            Krotka utworów w kolejce.
     """
-        Zwraca aktualną kolejkę odtwarzania jako listę Track.
+    return tuple(state.queue)
+
+def get_queue_titles() -> list[str]:
+    """
+        Zwraca tytuły utworów w kolejce (wysyłane w statusie WebSocket).
+        Lista budowana jest tylko po zmianie kolejki, a między zmianami
+        zwracany jest ten sam obiekt - wywołujący nie powinien go modyfikować.
         Zwraca:
-            Lista utworów w kolejce.
+            Lista tytułów utworów w kolejce.
     """
-    return list(queue)
+    if state.queue_titles is None:
+        state.queue_titles = [track.title for track in state.queue]
+    return state.queue_titles
 
 def play() -> Optional[Track]:
     """
@@ -124,21 +368,18 @@ def play() -> Optional[Track]:
         Zwraca:
             Aktualny utwór lub None, jeśli nie ma co odtwarzać.
     """
-    global is_paused
-
-    if current is None:
+    if state.current is None:
         return next_track()
 
-    is_paused = False
-    return current
+    state.is_paused = False
+    return state.current
 
 def stop() -> None:
     """
         Wstrzymuje odtwarzanie (pauza).
     """
-    global is_paused
-    if current is not None:
-        is_paused = True
+    if state.current is not None:
+        state.is_paused = True
 
 def skip() -> Optional[Track]:
     """
@@ -163,30 +404,20 @@ def next_track() -> Optional[Track]:
         Zwraca:
             Nowy aktualny utwór lub None.
     """
-    global current, elapsed, playlist_index, playlist_mode, is_paused
-
-    elapsed = 0
-    is_paused = False
-
-    if playlist_mode:
-        playlist_index += 1
-
-        if playlist_index >= len(playlist_tracks):
-            if loop_playlist:
-                playlist_index = 0
-            else:
-                stop_all()
-                return None
-
-        current = playlist_tracks[playlist_index]
-        return current
+    state.elapsed = 0
+    state.is_paused = False
+    return state.advance()
 
-    if queue:
-        current = queue.popleft()
-        return current
-
-    stop_all()
-    return None
+def _set_playlist_mode(enabled: bool) -> None:
+    """
+        Przełącza tryb odtwarzania i ustawia odpowiadającą mu funkcję
+        przejścia do następnego utworu, dzięki czemu next_track()
+        nie sprawdza trybu przy każdym wywołaniu.
+        Parametry:
+            enabled: True - tryb playlisty/albumu, False - tryb kolejki.
+    """
+    state.playlist_mode = enabled
+    state.advance = _advance_playlist if enabled else _advance_queue
 
 def stop_all():
     """
@@ -197,11 +428,10 @@ def stop_all():
         - wyłącza pauzę,
         - wyłącza tryby loop.
     """
-    global current, elapsed, playlist_mode, is_paused
-    current = None
-    elapsed = 0
-    playlist_mode = False
-    is_paused = False
+    _set_current(None)
+    state.elapsed = 0
+    _set_playlist_mode(False)
+    state.is_paused = False
     reset_loops()
 
 def tick() -> Optional[Track]:
@@ -214,23 +444,36 @@ def tick() -> Optional[Track]:
         Zwraca:
             Aktualny utwór lub None.
     """
-    global elapsed
-
-    if current is None or is_paused:
+    current = state.current
+    if current is None or state.is_paused:
         return current
 
-    elapsed += 1
+    elapsed = state.elapsed + 1
+    state.elapsed = elapsed
 
-    if elapsed < current.duration:
+    if elapsed < state.current_duration:
         return current
 
-    if loop_track:
-        elapsed = 0
+    if state.loop_track:
+        state.elapsed = 0
         return current
 
     return next_track()
 
-def select_track(track_id: int) -> Optional[Track]:
+def fast_forward(seconds: int) -> Optional[Track]:
+    """
+        Wykonuje podaną liczbę kroków czasowych (tick) naraz.
+        Parametry:
+            seconds: Liczba sekund odtwarzania do przewinięcia.
+        Zwraca:
+            Aktualny utwór lub None.
+    """
+    current = state.current
+    for _ in range(seconds):
+        current = tick()
+    return current
+
+def select_track(track_id: int) -> Optional[TrackSnap]:
     """
         Ustawia wskazany utwór jako aktualny i rozpoczyna jego odtwarzanie.
         Wyłącza tryb playlisty i wszystkie tryby loop.
@@ -240,21 +483,78 @@ def select_track(track_id: int) -> Optional[Track]:
         Zwraca:
             Wybrany utwór lub None jeśli nie istnieje.
     """
-    global current, elapsed, playlist_mode, is_paused
-
-    db = SessionLocal()
-    track = db.get(Track, track_id)
+    return play_track(load_track(track_id))
 
+def play_track(track: Optional[TrackSnap]) -> Optional[TrackSnap]:
+    """
+        Ustawia wczytany utwór (load_track) jako aktualny i rozpoczyna jego
+        odtwarzanie. Wyłącza tryb playlisty i wszystkie tryby loop.
+        Parametry:
+            track: Utwór do odtworzenia lub None (nic nie jest zmieniane).
+        Zwraca:
+            Wybrany utwór lub None.
+    """
     if not track:
         return None
 
-    playlist_mode = False
+    _set_playlist_mode(False)
     reset_loops()
 
-    current = track
-    elapsed = 0
-    is_paused = False
-    return current
+    _set_current(track)
+    state.elapsed = 0
+    state.is_paused = False
+    return state.current
+
+def load_playlist_tracks_by_id(playlist_id: int) -> list[Track]:
+    """
+        Odczytuje z bazy utwory playlisty o podanym ID (bez zmiany stanu
+        odtwarzacza - może być wywoływana w puli wątków).
+        Parametry:
+            playlist_id: ID playlisty.
+        Zwraca:
+            Lista utworów (pusta, jeśli playlista nie istnieje).
+    """
+    with _session() as db:
+        playlist = db.scalars(
+            select(Playlist)
+            .options(selectinload(Playlist.tracks))
+            .where(Playlist.id == playlist_id)
+        ).one_or_none()
+        return playlist.tracks if playlist else []
+
+def load_playlist_tracks_by_name(name: str) -> list[Track]:
+    """
+        Odczytuje z bazy utwory playlisty o podanej nazwie (bez zmiany stanu
+        odtwarzacza - może być wywoływana w puli wątków).
+        Parametry:
+            name: Nazwa playlisty.
+        Zwraca:
+            Lista utworów (pusta, jeśli playlista nie istnieje).
+    """
+    with _session() as db:
+        playlist = db.scalars(
+            select(Playlist)
+            .options(selectinload(Playlist.tracks))
+            .where(Playlist.name == name)
+        ).first()
+        return playlist.tracks if playlist else []
+
+def load_album_tracks(album_id: int) -> list[Track]:
+    """
+        Odczytuje z bazy utwory albumu o podanym ID (bez zmiany stanu
+        odtwarzacza - może być wywoływana w puli wątków).
+        Parametry:
+            album_id: ID albumu.
+        Zwraca:
+            Lista utworów (pusta, jeśli album nie istnieje).
+    """
+    with _session() as db:
+        album = db.scalars(
+            select(Album)
+            .options(selectinload(Album.tracks))
+            .where(Album.id == album_id)
+        ).one_or_none()
+        return album.tracks if album else []
 
 def select_playlist_by_id(playlist_id: int, loop: bool = False):
     """
@@ -265,13 +565,7 @@ def select_playlist_by_id(playlist_id: int, loop: bool = False):
         Zwraca:
             Pierwszy utwór playlisty lub None.
     """
-    db = SessionLocal()
-    playlist = db.get(Playlist, playlist_id)
-
-    if not playlist or not playlist.tracks:
-        return None
-
-    return _select_playlist(playlist.tracks, loop)
+    return play_playlist(load_playlist_tracks_by_id(playlist_id), loop)
 
 def select_playlist_by_name(name: str, loop: bool = False):
     """
@@ -283,47 +577,62 @@ def select_playlist_by_name(name: str, loop: bool = False):
         Zwraca:
             Pierwszy utwór playlisty lub None.
     """
-    db = SessionLocal()
-    playlist = db.query(Playlist).filter_by(name=name).first()
+    return play_playlist(load_playlist_tracks_by_name(name), loop)
+
+def select_album_by_id(album_id: int, loop: bool = False):
+    """
+        Wybiera album po ID i rozpoczyna jego odtwarzanie.
+        Parametry:
+            album_id: ID albumu.
+            loop: Czy zapętlać album.
+        Zwraca:
+            Pierwszy utwór albumu lub None.
+    """
+    return play_album(load_album_tracks(album_id), loop)
 
-    if not playlist or not playlist.tracks:
+def play_playlist(tracks: list[Track], loop: bool = False):
+    """
+        Rozpoczyna odtwarzanie wczytanych utworów playlisty
+        (load_playlist_tracks_by_id / load_playlist_tracks_by_name).
+        Parametry:
+            tracks: Lista utworów playlisty.
+            loop: Czy zapętlać playlistę.
+        Zwraca:
+            Pierwszy utwór playlisty lub None, jeśli lista jest pusta.
+    """
+    if not tracks:
         return None
 
-    return _select_playlist(playlist.tracks, loop)
+    return _select_playlist(tracks, loop)
 
-def select_album_by_id(album_id: int, loop: bool = False):
+def play_album(tracks: list[Track], loop: bool = False):
     """
-        Wybiera album po ID i rozpoczyna jego odtwarzanie.
+        Rozpoczyna odtwarzanie wczytanych utworów albumu (load_album_tracks).
         Album traktowany jest jak playlista:
         - playlist_mode = True
         - playlist_tracks = lista utworów albumu
         - playlist_index = 0
         Parametry:
-            album_id: ID albumu.
+            tracks: Lista utworów albumu.
             loop: Czy zapętlać album.
         Zwraca:
-            Pierwszy utwór albumu lub None.
+            Pierwszy utwór albumu lub None, jeśli lista jest pusta.
     """
-    global playlist_mode, playlist_tracks, playlist_index
-    global loop_playlist, loop_track, current, elapsed, queue
-
-    db = SessionLocal()
-    album = db.query(Album).get(album_id)
-    if not album or not album.tracks:
+    if not tracks:
         return None
 
-    playlist_mode = True
-    playlist_tracks = list(album.tracks)
-    playlist_index = 0
+    _set_playlist_mode(True)
+    _set_playlist_tracks(tracks)
+    state.playlist_index = 0
 
-    loop_playlist = loop
-    loop_track = False
+    state.loop_playlist = loop
+    state.loop_track = False
 
-    queue.clear()
-    current = playlist_tracks[0]
-    elapsed = 0
+    _clear_queue()
+    _set_current(tracks[0])
+    state.elapsed = 0
 
-    return current
+    return state.current
 
 def _select_playlist(tracks: list[Track], loop: bool):
     """
@@ -334,20 +643,17 @@ def _select_playlist(tracks: list[Track], loop: bool):
         Zwraca:
             Pierwszy utwór playlisty.
     """
-    global playlist_mode, playlist_tracks, playlist_index
-    global current, elapsed, loop_playlist, is_paused
+    _set_playlist_mode(True)
+    _set_playlist_tracks(tracks)
+    state.playlist_index = 0
+    state.loop_playlist = loop
 
-    playlist_mode = True
-    playlist_tracks = tracks
-    playlist_index = 0
-    loop_playlist = loop
+    _clear_queue()
 
-    queue.clear()
-
-    current = tracks[0]
-    elapsed = 0
-    is_paused = False
-    return current
+    _set_current(tracks[0])
+    state.elapsed = 0
+    state.is_paused = False
+    return state.current
 
 def set_loop_track(enabled: bool):
     """
@@ -356,14 +662,12 @@ def set_loop_track(enabled: bool):
         Parametry:
             enabled: True aby włączyć, False aby wyłączyć.
     """
-    global loop_track, loop_playlist
-
-    if current is None:
+    if state.current is None:
         return
 
-    loop_track = enabled
+    state.loop_track = enabled
     if enabled:
-        loop_playlist = False
+        state.loop_playlist = False
 
 
 def set_loop_playlist(enabled: bool):
@@ -373,9 +677,7 @@ def set_loop_playlist(enabled: bool):
         Parametry:
             enabled: True aby włączyć, False aby wyłączyć.
     """
-    global loop_playlist
-
-    if not playlist_mode:
+    if not state.playlist_mode:
         return
 
-    loop_playlist = enabled
+    state.loop_playlist = enabled
@@ -13,10 +13,11 @@ Operacje tworzenia i modyfikacji albumów są zabezpieczone wymogiem posiadania
 uprawnień administratora.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app import crud, schemas, models
+from app import cache, crud, schemas
 from app.dependencies import admin_required
 from app.models import User
 
@@ -44,15 +45,28 @@ def create_album(
     return crud.create_album(db, album)
 
 @router.get("")
-def get_albums(db: Session = Depends(get_db)):
+def get_albums(
+    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None)
+):
     """
         Zwraca listę wszystkich albumów zapisanych w bazie danych.
+        Mechanizm:
+        - wynik jest pobierany z cache (klucz "albums:all"), jeśli wpis jest aktualny,
+        - w przeciwnym razie lista jest pobierana z bazy, serializowana
+          i zapisywana w cache na CACHE_TTL sekund,
+        - odpowiedź zawiera nagłówek ETag; jeśli klient przesłał ten sam ETag
+          w If-None-Match, zwracana jest odpowiedź 304 bez treści.
         Parametry:
             db: Sesja bazy danych SQLAlchemy.
+            if_none_match: Wartość nagłówka If-None-Match (lub None).
         Zwraca:
-            Lista obiektów Album.
+            Odpowiedź z listą albumów zakodowaną w cache do JSON (lub 304).
     """
-    return db.query(models.Album).all()
+    entry = cache.get_entry(cache.ALBUMS_KEY)
+    if entry is None:
+        entry = cache.set_cached(cache.ALBUMS_KEY, jsonable_encoder(crud.get_albums(db)))
+    return cache.to_response(entry, if_none_match)
 
 @router.get("/{album_id}")
 def get_album(album_id: int, db: Session = Depends(get_db)):
@@ -66,7 +80,7 @@ def get_album(album_id: int, db: Session = Depends(get_db)):
         Wyjątki:
             HTTPException 404: jeśli album o podanym ID nie istnieje.
     """
-    album = db.query(models.Album).get(album_id)
+    album = crud.get_album(db, album_id)
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
     return album
@@ -79,10 +93,10 @@ def update_album(album_id: int, data: schemas.AlbumCreate,
         Aktualizuje dane istniejącego albumu.
         Mechanizm:
         - endpoint dostępny wyłącznie dla administratorów,
-        - pobiera album z bazy,
-        - jeśli nie istnieje - zwraca błąd 404,
-        - aktualizuje tylko pola przekazane w żądaniu (exclude_unset=True),
-        - zapisuje zmiany i odświeża obiekt.
+        - aktualizuje tylko pola przekazane w żądaniu (model_fields_set)
+          pojedynczym zapytaniem UPDATE ... RETURNING (update_by_id),
+          bez wcześniejszego SELECT i bez odświeżania obiektu po zapisie,
+        - jeśli rekord nie istnieje (brak zwróconego wiersza) - zwraca błąd 404.
         Parametry:
             album_id: Identyfikator albumu do aktualizacji.
             data: Dane aktualizacyjne albumu.
@@ -93,15 +107,9 @@ def update_album(album_id: int, data: schemas.AlbumCreate,
         Wyjątki:
             HTTPException 404: jeśli album nie istnieje.
     """
-    album = db.query(models.Album).get(album_id)
+    album = crud.update_album(db, album_id, data)
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
-
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(album, key, value)
-
-    db.commit()
-    db.refresh(album)
     return album
 
 @router.delete("/{album_id}")
@@ -123,10 +131,6 @@ def delete_album(album_id: int, db: Session = Depends(get_db),
         Wyjątki:
             HTTPException 404: jeśli album nie istnieje.
     """
-    album = db.query(models.Album).get(album_id)
-    if not album:
+    if not crud.delete_album(db, album_id):
         raise HTTPException(status_code=404, detail="Album not found")
-
-    db.delete(album)
-    db.commit()
     return {"message": "Album deleted successfully"}
\ No newline at end of file
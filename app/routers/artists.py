@@ -12,10 +12,11 @@ Router korzysta z warstwy CRUD, modeli SQLAlchemy oraz schematów Pydantic.
 Operacje tworzenia i modyfikacji artystów są zabezpieczone wymogiem posiadania
 uprawnień administratora.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app import crud, schemas, models
+from app import cache, crud, pagination, schemas, models
 from app.dependencies import admin_required
 from app.models import User
 
@@ -43,32 +44,73 @@ def create_artist(
     return crud.create_artist(db, artist)
 
 @router.get("")
-def get_artists(db: Session = Depends(get_db)):
+def get_artists(
+    response: Response,
+    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+    page: tuple[int, int] | None = Depends(pagination.page_params)
+):
     """
         Zwraca listę wszystkich artystów zapisanych w bazie danych.
+        Mechanizm:
+        - wynik jest pobierany z cache (klucz "artists:all"), jeśli wpis jest aktualny,
+        - w przeciwnym razie lista jest pobierana z bazy, serializowana
+          i zapisywana w cache na CACHE_TTL sekund,
+        - odpowiedź zawiera nagłówek ETag; jeśli klient przesłał ten sam ETag
+          w If-None-Match, zwracana jest odpowiedź 304 bez treści,
+        - z parametrami `limit`/`cursor` zwracana jest tylko jedna strona,
+          pobierana z bazy z pominięciem cache (nagłówek X-Next-Cursor
+          wskazuje kolejną stronę).
         Parametry:
+            response: Odpowiedź HTTP, w której ustawiany jest nagłówek X-Next-Cursor.
             db: Sesja bazy danych SQLAlchemy.
+            if_none_match: Wartość nagłówka If-None-Match (lub None).
+            page: Parametry stronicowania (limit, cursor) lub None.
         Zwraca:
-            Lista obiektów Artist.
+            Lista artystów: strona z bazy danych lub odpowiedź z treścią JSON
+            zapamiętaną w cache (albo 304).
     """
-    return db.query(models.Artist).all()
+    if page is not None:
+        limit, cursor = page
+        items = jsonable_encoder(crud.get_artists(db, limit, cursor))
+        pagination.set_next_cursor(response, items, limit)
+        return items
+
+    entry = cache.get_entry(cache.ARTISTS_KEY)
+    if entry is None:
+        entry = cache.set_cached(cache.ARTISTS_KEY, jsonable_encoder(crud.get_artists(db)))
+    return cache.to_response(entry, if_none_match)
 
 @router.get("/{artist_id}")
-def get_artist(artist_id: int, db: Session = Depends(get_db)):
+def get_artist(
+    artist_id: int,
+    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None)
+):
     """
         Pobiera pojedynczego artystę na podstawie jego identyfikatora.
+        Zserializowany artysta jest zapamiętywany w cache (klucz "artist:<id>")
+        na CACHE_TTL sekund; zmiana lub usunięcie artysty unieważnia wpis.
+        Odpowiedź zawiera nagłówek ETag; jeśli klient przesłał ten sam ETag
+        w If-None-Match, zwracana jest odpowiedź 304 bez treści.
         Parametry:
             artist_id: Identyfikator artysty.
             db: Sesja bazy danych SQLAlchemy.
+            if_none_match: Wartość nagłówka If-None-Match (lub None).
         Zwraca:
-            Obiekt Artist, jeśli istnieje.
+            Odpowiedź z danymi artysty zakodowanymi w cache do JSON (albo 304).
         Wyjątki:
             HTTPException 404: jeśli artysta o podanym ID nie istnieje.
     """
-    artist = db.query(models.Artist).get(artist_id)
+    key = cache.item_key(cache.ARTIST_PREFIX, artist_id)
+    entry = cache.get_entry(key)
+    if entry is not None:
+        return cache.to_response(entry, if_none_match)
+
+    artist = db.get(models.Artist, artist_id)
     if not artist:
         raise HTTPException(status_code=404, detail="Artist not found")
-    return artist
+    return cache.to_response(cache.set_cached(key, jsonable_encoder(artist)), if_none_match)
 
 @router.patch("/{artist_id}")
 def update_artist(artist_id: int, data: schemas.ArtistCreate,
@@ -78,10 +120,10 @@ def update_artist(artist_id: int, data: schemas.ArtistCreate,
         Aktualizuje dane istniejącego artysty.
         Mechanizm:
         - endpoint dostępny wyłącznie dla administratorów,
-        - pobiera artystę z bazy,
-        - jeśli nie istnieje - zwraca błąd 404,
-        - aktualizuje tylko pola przekazane w żądaniu (exclude_unset=True),
-        - zapisuje zmiany i odświeża obiekt.
+        - aktualizuje tylko pola przekazane w żądaniu (model_fields_set)
+          pojedynczym zapytaniem UPDATE ... RETURNING (update_by_id),
+          bez wcześniejszego SELECT i bez odświeżania obiektu po zapisie,
+        - jeśli rekord nie istnieje (brak zwróconego wiersza) - zwraca błąd 404.
         Parametry:
             artist_id: Identyfikator artysty do aktualizacji.
             data: Dane aktualizacyjne artysty.
@@ -92,15 +134,9 @@ def update_artist(artist_id: int, data: schemas.ArtistCreate,
         Wyjątki:
             HTTPException 404: jeśli artysta nie istnieje.
     """
-    artist = db.query(models.Artist).get(artist_id)
+    artist = crud.update_artist(db, artist_id, data)
     if not artist:
         raise HTTPException(status_code=404, detail="Artist not found")
-
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(artist, key, value)
-
-    db.commit()
-    db.refresh(artist)
     return artist
 
 @router.delete("/{artist_id}")
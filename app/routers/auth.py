@@ -11,21 +11,32 @@ identyfikator aktywnej sesji użytkownika. Router wykorzystuje warstwę CRUD
 do operacji na użytkownikach oraz walidację danych poprzez schematy Pydantic.
 """
 from fastapi import APIRouter, Depends, Response, Cookie, HTTPException
+from sqlalchemy import or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app import crud, schemas, models
-from app.session import create_session, delete_session
+from app.session import create_session, delete_session, SESSION_TTL
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
+"""
+Gotowe nagłówki Set-Cookie dla ciasteczka `session_id`.
+Zmienny jest tylko identyfikator sesji, więc szablon jest formatowany
+bezpośrednio, bez budowania SimpleCookie przy każdym logowaniu/wylogowaniu.
+"""
+_SESSION_COOKIE_TEMPLATE = (
+    "session_id={}; HttpOnly; Max-Age=" + str(SESSION_TTL) + "; Path=/; SameSite=lax"
+)
+_SESSION_COOKIE_CLEAR = b"session_id=; HttpOnly; Max-Age=0; Path=/; SameSite=lax"
+
 @router.post("/register", response_model=schemas.UserOut)
 def register(user: schemas.UserRegister, db: Session = Depends(get_db)):
     """
         Rejestruje nowego użytkownika w systemie.
         Mechanizm:
-        - sprawdza, czy login nie jest już zajęty,
-        - sprawdza, czy adres e‑mail nie jest już zarejestrowany,
+        - jednym zapytaniem sprawdza, czy login lub adres e‑mail nie są już
+          zajęte (przed kosztownym hashowaniem hasła),
         - wywołuje funkcję CRUD odpowiedzialną za utworzenie użytkownika,
         - obsługuje wyjątek IntegrityError (np. konflikt unikalności),
         - zwraca dane nowo utworzonego użytkownika.
@@ -37,12 +48,14 @@ def register(user: schemas.UserRegister, db: Session = Depends(get_db)):
         Wyjątki:
             HTTPException 400: jeśli login lub email są już zajęte.
     """
-    existing_login = db.query(models.User).filter_by(login=user.login).first()
-    if existing_login:
-        raise HTTPException(status_code=400, detail="Login already registered")
-
-    existing_email = db.query(models.User).filter_by(email=user.email).first()
-    if existing_email:
+    taken_logins = db.scalars(
+        select(models.User.login)
+        .where(or_(models.User.login == user.login, models.User.email == user.email))
+        .limit(2)
+    ).all()
+    if taken_logins:
+        if user.login in taken_logins:
+            raise HTTPException(status_code=400, detail="Login already registered")
         raise HTTPException(status_code=400, detail="Email already registered")
 
     try:
@@ -51,15 +64,7 @@ def register(user: schemas.UserRegister, db: Session = Depends(get_db)):
         db.rollback()
         raise HTTPException(status_code=400, detail="Email or login already registered")
 
-    return schemas.UserOut(
-        id=new_user.id,
-        login=new_user.login,
-        email=new_user.email,
-        first_name=new_user.first_name,
-        last_name=new_user.last_name,
-        birth_date=new_user.birth_date,
-        role=new_user.role
-    )
+    return new_user
 
 @router.post("/login")
 def login(data: schemas.UserLogin, response: Response, db: Session = Depends(get_db)):
@@ -69,7 +74,8 @@ def login(data: schemas.UserLogin, response: Response, db: Session = Depends(get
         - weryfikuje login i hasło użytkownika,
         - jeśli dane są poprawne, generuje identyfikator sesji,
         - zapisuje identyfikator sesji w ciasteczku HTTP-only,
-        - ciasteczko ma ograniczony czas życia (max_age=180 sekund).
+        - ciasteczko ma ograniczony czas życia (Max-Age=SESSION_TTL, 180 sekund),
+        - nagłówek Set-Cookie powstaje z gotowego szablonu.
         Parametry:
             data: Dane logowania (login i hasło).
             response: Obiekt odpowiedzi HTTP, używany do ustawienia ciasteczka.
@@ -85,12 +91,8 @@ def login(data: schemas.UserLogin, response: Response, db: Session = Depends(get
 
     session_id = create_session(user.id)
 
-    response.set_cookie(
-        key="session_id",
-        value=session_id,
-        httponly=True,
-        max_age=180,
-        samesite="lax",
+    response.raw_headers.append(
+        (b"set-cookie", _SESSION_COOKIE_TEMPLATE.format(session_id).encode("latin-1"))
     )
 
     return {"message": "Logged in successfully"}
@@ -109,5 +111,5 @@ def logout(response: Response, session_id: str | None = Cookie(default=None)):
             Słownik z komunikatem o poprawnym wylogowaniu.
     """
     delete_session(session_id)
-    response.delete_cookie("session_id")
+    response.raw_headers.append((b"set-cookie", _SESSION_COOKIE_CLEAR))
     return {"message": "Logged out"}
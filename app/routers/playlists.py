@@ -16,15 +16,20 @@ Dostęp do niektórych operacji jest ograniczony:
 Router korzysta z warstwy CRUD, modeli SQLAlchemy oraz schematów Pydantic.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import exists, select
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app import crud, schemas, models
-from app.dependencies import get_current_user
+from app import cache, crud, pagination, schemas, models
+from app.dependencies import get_current_user, playlist_delete_owner_or_admin, playlist_owner_or_admin
 from app.models import User
 
 router = APIRouter(prefix="/playlists", tags=["Playlists"])
 
+# Maksymalna liczba playlist zwykłego użytkownika.
+MAX_USER_PLAYLISTS = 10
+
 @router.post("", response_model=schemas.PlaylistOut)
 def create_playlist(
     playlist: schemas.PlaylistCreate,
@@ -34,7 +39,8 @@ def create_playlist(
     """
         Tworzy nową playlistę.
         Mechanizm:
-        - jeśli użytkownik nie jest administratorem, sprawdzany jest limit 10 playlist,
+        - jeśli użytkownik nie jest administratorem, sprawdzany jest limit 10 playlist
+          (zapytanie o 10. playlistę użytkownika zamiast zliczania wszystkich),
         - dane wejściowe walidowane są przez schemat PlaylistCreate,
         - wywoływana jest funkcja CRUD odpowiedzialna za utworzenie playlisty,
         - zwracany jest obiekt PlaylistOut z listą ID utworów.
@@ -49,8 +55,13 @@ def create_playlist(
             HTTPException 403: jeśli użytkownik przekroczył limit playlist.
     """
     if current_user.role != "admin":
-        count = db.query(models.Playlist).filter_by(owner_id=current_user.id).count()
-        if count >= 10:
+        limit_reached = db.scalar(
+            select(models.Playlist.id)
+            .where(models.Playlist.owner_id == current_user.id)
+            .offset(MAX_USER_PLAYLISTS - 1)
+            .limit(1)
+        )
+        if limit_reached is not None:
             raise HTTPException(status_code=403, detail="You cannot have more than 10 playlists")
         playlist.owner_id = current_user.id
 
@@ -58,18 +69,13 @@ def create_playlist(
         if playlist.owner_id is None:
             playlist.owner_id = current_user.id
         else:
-            owner = db.query(models.User).filter_by(id=playlist.owner_id).first()
-            if not owner:
+            owner_exists = db.scalar(select(exists().where(models.User.id == playlist.owner_id)))
+            if not owner_exists:
                 raise HTTPException(status_code=400, detail="Owner with given ID does not exist")
 
     db_playlist = crud.create_playlist(db, playlist)
 
-    return schemas.PlaylistOut(
-        id=db_playlist.id,
-        name=db_playlist.name,
-        owner_id=db_playlist.owner_id,
-        track_ids=[t.id for t in db_playlist.tracks]
-    )
+    return db_playlist
 
 @router.post("/{playlist_id}/tracks/{track_id}")
 def add_track(
@@ -81,10 +87,11 @@ def add_track(
     """
         Dodaje utwór do playlisty.
         Mechanizm:
-        - pobiera playlistę i utwór z bazy,
-        - jeśli któryś nie istnieje - błąd 404,
+        - jednym zapytaniem sprawdza istnienie playlisty i utworu, pobiera
+          właściciela playlisty i informację, czy utwór już na niej jest,
+        - jeśli playlista lub utwór nie istnieje - błąd 404,
         - jeśli użytkownik nie jest administratorem ani właścicielem playlisty - błąd 403,
-        - wywołuje funkcję CRUD dodającą utwór do playlisty.
+        - jeśli utworu nie ma jeszcze na playliście - wstawia powiązanie.
         Parametry:
             playlist_id: Identyfikator playlisty.
             track_id: Identyfikator utworu.
@@ -93,16 +100,16 @@ def add_track(
         Zwraca:
             Słownik {"status": "ok"} po pomyślnym dodaniu.
     """
-    playlist = crud.get_playlist(db, playlist_id)
-    track = crud.get_track(db, track_id)
-
-    if not playlist or not track:
+    link = crud.get_playlist_track_link(db, playlist_id, track_id)
+    if link is None:
         raise HTTPException(status_code=404, detail="Playlist or track not found")
 
-    if current_user.role != "admin" and playlist.owner_id != current_user.id:
+    owner_id, already_linked = link
+    if current_user.role != "admin" and owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="You can only modify your own playlists")
 
-    crud.add_track_to_playlist(db, playlist_id, track_id)
+    if not already_linked:
+        crud.add_tracks_to_playlist(db, playlist_id, [track_id])
     return {"status": "ok"}
 
 @router.delete("/{playlist_id}/tracks/{track_id}")
@@ -110,32 +117,24 @@ def remove_track_from_playlist(
     playlist_id: int,
     track_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    _owner_id: int = Depends(playlist_owner_or_admin)
 ):
     """
     Usuwa utwór z playlisty.
     Mechanizm:
-    - pobiera playlistę,
-    - jeśli nie istnieje → błąd 404,
-    - sprawdza, czy użytkownik jest właścicielem lub administratorem,
-    - usuwa powiązanie utworu z playlistą.
+    - zależność playlist_owner_or_admin sprawdza istnienie playlisty (404)
+      oraz uprawnienia właściciela lub administratora (403),
+    - usuwa powiązanie utworu z playlistą jednym zapytaniem DELETE.
     Parametry:
         playlist_id: Identyfikator playlisty.
         track_id: Identyfikator utworu.
         db: Sesja bazy danych SQLAlchemy.
-        current_user: Aktualnie zalogowany użytkownik.
+        _owner_id: ID właściciela playlisty (sprawdzone uprawnienia).
     Zwraca:
         Słownik z komunikatem o pomyślnym usunięciu utworu.
     Wyjątki:
         HTTPException 403: jeśli użytkownik nie ma uprawnień.
     """
-    playlist = crud.get_playlist(db, playlist_id)
-    if not playlist:
-        raise HTTPException(status_code=404, detail="Playlist not found")
-
-    if playlist.owner_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="You are not allowed to modify this playlist")
-
     if not crud.remove_track_from_playlist(db, playlist_id, track_id):
         raise HTTPException(status_code=404, detail="Track not found in playlist")
 
@@ -159,15 +158,42 @@ def get_tracks_from_playlist(playlist_id: int, db: Session = Depends(get_db)):
     return tracks
 
 @router.get("")
-def get_playlists(db: Session = Depends(get_db)):
+def get_playlists(
+    response: Response,
+    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+    page: tuple[int, int] | None = Depends(pagination.page_params)
+):
     """
         Zwraca listę wszystkich playlist w systemie.
+        Mechanizm:
+        - wynik jest pobierany z cache (klucz "playlists:all"), jeśli wpis jest aktualny,
+        - w przeciwnym razie lista jest pobierana z bazy, serializowana
+          i zapisywana w cache na CACHE_TTL sekund,
+        - odpowiedź zawiera nagłówek ETag; jeśli klient przesłał ten sam ETag
+          w If-None-Match, zwracana jest odpowiedź 304 bez treści,
+        - z parametrami `limit`/`cursor` zwracana jest tylko jedna strona,
+          pobierana z bazy z pominięciem cache (nagłówek X-Next-Cursor
+          wskazuje kolejną stronę).
         Parametry:
+            response: Odpowiedź HTTP, w której ustawiany jest nagłówek X-Next-Cursor.
             db: Sesja bazy danych SQLAlchemy.
+            if_none_match: Wartość nagłówka If-None-Match (lub None).
+            page: Parametry stronicowania (limit, cursor) lub None.
         Zwraca:
-            Lista obiektów Playlist.
+            Lista playlist: strona z bazy danych lub odpowiedź z treścią JSON
+            zapamiętaną w cache (albo 304).
     """
-    return crud.get_playlists(db)
+    if page is not None:
+        limit, cursor = page
+        items = jsonable_encoder(crud.get_playlists(db, limit, cursor))
+        pagination.set_next_cursor(response, items, limit)
+        return items
+
+    entry = cache.get_entry(cache.PLAYLISTS_KEY)
+    if entry is None:
+        entry = cache.set_cached(cache.PLAYLISTS_KEY, jsonable_encoder(crud.get_playlists(db)))
+    return cache.to_response(entry, if_none_match)
 
 @router.get("/{playlist_id}")
 def get_playlist(playlist_id: int, db: Session = Depends(get_db)):
@@ -191,81 +217,59 @@ def update_playlist(
     playlist_id: int,
     data: schemas.PlaylistCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    owner_id: int = Depends(playlist_owner_or_admin)
 ):
     """
     Aktualizuje dane istniejącej playlisty.
     Mechanizm:
-    - pobiera playlistę z bazy,
-    - jeśli nie istnieje → błąd 404,
-    - sprawdza, czy użytkownik jest właścicielem lub administratorem,
-    - aktualizuje tylko pola przekazane w żądaniu (exclude_unset=True),
-    - zapisuje zmiany i odświeża obiekt.
+    - zależność playlist_owner_or_admin sprawdza istnienie playlisty (404)
+      oraz uprawnienia właściciela lub administratora (403),
+    - zwykły użytkownik nie może zmienić właściciela playlisty,
+    - aktualizuje tylko pola przekazane w żądaniu (model_fields_set)
+      pojedynczym zapytaniem UPDATE ... RETURNING (update_by_id),
+      od razu ładując utwory playlisty (selectinload), bez odświeżania
+      obiektu po zapisie.
     Parametry:
         playlist_id: Identyfikator playlisty.
         data: Dane aktualizacyjne playlisty.
         db: Sesja bazy danych SQLAlchemy.
         current_user: Aktualnie zalogowany użytkownik.
+        owner_id: ID właściciela playlisty (sprawdzone uprawnienia).
     Zwraca:
         Zaktualizowany obiekt PlaylistOut.
     Wyjątki:
         HTTPException 403: jeśli użytkownik nie ma uprawnień.
         HTTPException 404: jeśli nie znaleziono playlisty.
     """
-    playlist = crud.get_playlist(db, playlist_id)
-    if not playlist:
-        raise HTTPException(status_code=404, detail="Playlist not found")
-
-    if playlist.owner_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="You are not allowed to modify this playlist")
-
-    update_data = data.model_dump(exclude_unset=True)
-
-    if current_user.role != "admin" and "owner_id" in update_data:
-        if update_data["owner_id"] != playlist.owner_id:
+    if current_user.role != "admin" and "owner_id" in data.model_fields_set:
+        if data.owner_id != owner_id:
             raise HTTPException(status_code=403, detail="You cannot change playlist owner")
 
-    for key, value in update_data.items():
-        setattr(playlist, key, value)
+    playlist = crud.update_playlist(db, playlist_id, data)
 
-    db.commit()
-    db.refresh(playlist)
-
-    return schemas.PlaylistOut(
-        id=playlist.id,
-        name=playlist.name,
-        owner_id=playlist.owner_id,
-        track_ids=[t.id for t in playlist.tracks]
-    )
+    return playlist
 
 @router.delete("/{playlist_id}")
 def delete_playlist(
     playlist_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    _owner_id: int = Depends(playlist_delete_owner_or_admin)
 ):
     """
     Usuwa playlistę z bazy danych.
     Mechanizm:
-    - pobiera playlistę,
-    - jeśli nie istnieje → błąd 404,
-    - sprawdza, czy użytkownik jest właścicielem lub administratorem,
+    - zależność playlist_delete_owner_or_admin sprawdza istnienie playlisty (404)
+      oraz uprawnienia właściciela lub administratora (403),
     - usuwa playlistę.
     Parametry:
         playlist_id: Identyfikator playlisty.
         db: Sesja bazy danych SQLAlchemy.
-        current_user: Aktualnie zalogowany użytkownik.
+        _owner_id: ID właściciela playlisty (sprawdzone uprawnienia).
     Zwraca:
         Słownik z komunikatem o pomyślnym usunięciu playlisty.
     Wyjątki:
         HTTPException 403: jeśli użytkownik nie ma uprawnień.
     """
-    playlist = crud.get_playlist(db, playlist_id)
-    if not playlist:
-        raise HTTPException(status_code=404, detail="Playlist not found")
-
-    if playlist.owner_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="You are not allowed to delete this playlist")
-
     crud.delete_playlist(db, playlist_id)
     return {"message": "Playlist deleted successfully"}
\ No newline at end of file
@@ -11,10 +11,11 @@ Udostępnia następujące funkcjonalności:
 Router korzysta z warstwy CRUD, modeli SQLAlchemy oraz schematów Pydantic.
 Tworzenie i modyfikacja utworów wymaga uprawnień administratora.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app import crud, schemas
+from app import cache, crud, pagination, schemas
 from app.schemas import TrackOut
 from app.dependencies import admin_required
 from app.models import User
@@ -47,44 +48,78 @@ def create_track(
         db_track = crud.create_track(db, track)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    return TrackOut(
-        id=db_track.id,
-        title=db_track.title,
-        duration=db_track.duration,
-        album_id=db_track.album_id,
-        artist_ids=[a.id for a in db_track.artists],
-        file_path=db_track.file_path
-    )
+    return db_track
 
 @router.get("")
-def get_tracks(db: Session = Depends(get_db)):
+def get_tracks(
+    response: Response,
+    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+    page: tuple[int, int] | None = Depends(pagination.page_params)
+):
     """
         Zwraca listę wszystkich utworów zapisanych w bazie danych.
+        Mechanizm:
+        - wynik jest pobierany z cache (klucz "tracks:all"), jeśli wpis jest aktualny,
+        - w przeciwnym razie lista jest pobierana z bazy, serializowana
+          i zapisywana w cache na CACHE_TTL sekund,
+        - odpowiedź zawiera nagłówek ETag; jeśli klient przesłał ten sam ETag
+          w If-None-Match, zwracana jest odpowiedź 304 bez treści,
+        - z parametrami `limit`/`cursor` zwracana jest tylko jedna strona,
+          pobierana z bazy z pominięciem cache (nagłówek X-Next-Cursor
+          wskazuje kolejną stronę).
         Parametry:
+            response: Odpowiedź HTTP, w której ustawiany jest nagłówek X-Next-Cursor.
             db: Sesja bazy danych SQLAlchemy.
+            if_none_match: Wartość nagłówka If-None-Match (lub None).
+            page: Parametry stronicowania (limit, cursor) lub None.
         Zwraca:
-            Lista obiektów Track.
+            Lista utworów: strona z bazy danych lub odpowiedź z treścią JSON
+            zapamiętaną w cache (albo 304).
     """
-    return crud.get_tracks(db)
+    if page is not None:
+        limit, cursor = page
+        items = jsonable_encoder(crud.get_tracks(db, limit, cursor))
+        pagination.set_next_cursor(response, items, limit)
+        return items
+
+    entry = cache.get_entry(cache.TRACKS_KEY)
+    if entry is None:
+        entry = cache.set_cached(cache.TRACKS_KEY, jsonable_encoder(crud.get_tracks(db)))
+    return cache.to_response(entry, if_none_match)
 
 @router.get("/{track_id}")
-def get_track(track_id: int, db: Session = Depends(get_db)):
+def get_track(
+    track_id: int,
+    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None)
+):
     """
         Pobiera pojedynczy utwór na podstawie jego identyfikatora.
+        Zserializowany utwór jest zapamiętywany w cache (klucz "track:<id>")
+        na CACHE_TTL sekund; zmiana lub usunięcie utworu unieważnia wpis.
+        Odpowiedź zawiera nagłówek ETag; jeśli klient przesłał ten sam ETag
+        w If-None-Match, zwracana jest odpowiedź 304 bez treści.
         Parametry:
             track_id: Identyfikator utworu.
             db: Sesja bazy danych SQLAlchemy.
+            if_none_match: Wartość nagłówka If-None-Match (lub None).
         Zwraca:
-            Obiekt Track, jeśli istnieje.
+            Odpowiedź z danymi utworu zakodowanymi w cache do JSON (albo 304).
         Wyjątki:
             HTTPException 404: jeśli utwór o podanym ID nie istnieje.
     """
+    key = cache.item_key(cache.TRACK_PREFIX, track_id)
+    entry = cache.get_entry(key)
+    if entry is not None:
+        return cache.to_response(entry, if_none_match)
+
     track = crud.get_track(db, track_id)
     if not track:
         raise HTTPException(status_code=404, detail="Track not found")
-    return track
+    return cache.to_response(cache.set_cached(key, jsonable_encoder(track)), if_none_match)
 
-@router.patch("/{track_id}")
+@router.patch("/{track_id}", response_model=TrackOut)
 def update_track(track_id: int, data: schemas.TrackUpdate,
                  db: Session = Depends(get_db),
                  _current_user: User = Depends(admin_required)):
@@ -92,12 +127,14 @@ def update_track(track_id: int, data: schemas.TrackUpdate,
         Aktualizuje dane istniejącego utworu.
         Mechanizm:
         - endpoint dostępny wyłącznie dla administratorów,
-        - pobiera utwór z bazy,
-        - jeśli nie istnieje - błąd 404,
-        - zapisuje ścieżkę do pliku,
-        - jeśli plik nie istnieje - błąd 400,
-        - aktualizuje tylko pola przekazane w żądaniu (exclude_unset=True),
-        - zapisuje zmiany i odświeża obiekt.
+        - crud.update_track pobiera utwór z bazy (get_track); jeśli nie
+          istnieje - błąd 404,
+        - jeśli podano nazwę pliku, a plik nie istnieje - błąd 400,
+        - tylko pola przekazane w żądaniu (model_fields_set) przepisywane są
+          na obiekt funkcją wygenerowaną przez make_updater (bez update_by_id,
+          bo zmiana artystów wymaga osobnych zapytań do tabeli `track_artist`),
+        - zmiana artystów zapisuje tylko różnicę powiązań,
+        - zatwierdza transakcję i odświeża obiekt (db.refresh).
         Parametry:
             track_id: Identyfikator utworu do aktualizacji.
             data: Dane aktualizacyjne utworu.
@@ -117,14 +154,7 @@ def update_track(track_id: int, data: schemas.TrackUpdate,
     if not updated:
         raise HTTPException(status_code=404, detail="Track not found")
 
-    return TrackOut(
-        id=updated.id,
-        title=updated.title,
-        duration=updated.duration,
-        album_id=updated.album_id,
-        artist_ids=[a.id for a in updated.artists],
-        file_path=updated.file_path
-    )
+    return updated
 
 @router.delete("/{track_id}")
 def delete_track(track_id: int, db: Session = Depends(get_db),
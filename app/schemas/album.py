@@ -13,6 +13,7 @@ AlbumUpdate:
 from pydantic import BaseModel, Field
 from datetime import date
 from typing import Optional
+from .types import PositiveId
 
 class AlbumCreate(BaseModel):
     """
@@ -32,14 +33,17 @@ class AlbumCreate(BaseModel):
     """
     title: str = Field(..., min_length=1, max_length=150)
     release_date: Optional[date] = None
-    artist_id: int = Field(..., gt=0)
+    artist_id: PositiveId
 
 class AlbumUpdate(BaseModel):
     """
         Schemat danych używany do aktualizacji istniejącego albumu.
         Wszystkie pola są opcjonalne — aktualizowane są tylko te,
-        które zostały przekazane (exclude_unset=True w CRUD).
+        które zostały przekazane (model_fields_set; update_by_id w CRUD).
+        Ograniczenia pól odpowiadają ograniczeniom tabeli `albums`
+        (album_title_length, kolumna typu Date), więc niepoprawne dane
+        są odrzucane przed wysłaniem zapytania do bazy.
     """
     title: Optional[str] = Field(None, min_length=1, max_length=150)
-    release_date: Optional[str] = Field(None, max_length=50)
-    artist_id: Optional[int] = Field(None, gt=0)
\ No newline at end of file
+    release_date: Optional[date] = None
+    artist_id: Optional[PositiveId] = None
\ No newline at end of file
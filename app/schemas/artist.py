@@ -12,7 +12,7 @@ ArtistOut:
     Schemat wyjściowy używany do zwracania danych artysty w odpowiedziach API.
     Wspiera konwersję z modeli ORM dzięki `from_attributes = True`.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 class ArtistCreate(BaseModel):
@@ -36,7 +36,7 @@ class ArtistUpdate(BaseModel):
     """
         Schemat danych używany do aktualizacji istniejącego artysty.
         Wszystkie pola są opcjonalne — aktualizowane są tylko te,
-        które zostały przekazane (exclude_unset=True w CRUD).
+        które zostały przekazane (model_fields_set; update_by_id w CRUD).
     """
     name: Optional[str] = Field(None, min_length=2, max_length=100)
     country: Optional[str] = Field(None, max_length=50)
@@ -49,9 +49,8 @@ class ArtistOut(BaseModel):
             Pozwala na automatyczne tworzenie obiektu ArtistOut
             bezpośrednio z modelu ORM (SQLAlchemy).
     """
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     country: Optional[str] = None
-
-    class Config:
-        from_attributes = True
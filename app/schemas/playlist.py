@@ -12,8 +12,9 @@ PlaylistOut:
     Zawiera listę identyfikatorów utworów oraz wspiera konwersję z modeli ORM.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
+from .types import PositiveId
 
 class PlaylistCreate(BaseModel):
     """
@@ -31,14 +32,14 @@ class PlaylistCreate(BaseModel):
         - owner_id: gt=0
     """
     name: str = Field(..., min_length=1, max_length=100)
-    owner_id: int = Field(..., gt=0)
+    owner_id: PositiveId
 
 class PlaylistUpdate(BaseModel):
     """
         Schemat danych używany do aktualizacji istniejącej playlisty.
 
         Wszystkie pola są opcjonalne — aktualizowane są tylko te,
-        które zostały przekazane (exclude_unset=True w CRUD).
+        które zostały przekazane (model_fields_set; update_by_id w CRUD).
 
         Pola:
         name : str | None
@@ -51,7 +52,7 @@ class PlaylistUpdate(BaseModel):
         - owner_id: gt=0
     """
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    owner_id: Optional[int] = Field(None, gt=0)
+    owner_id: Optional[PositiveId] = None
 
 class PlaylistOut(BaseModel):
     """
@@ -61,10 +62,9 @@ class PlaylistOut(BaseModel):
             Pozwala na automatyczne tworzenie obiektu PlaylistOut
             bezpośrednio z modelu ORM (SQLAlchemy).
     """
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     owner_id: int
     track_ids: List[int] = []
-
-    class Config:
-        from_attributes = True
@@ -12,8 +12,9 @@ TrackOut:
     Schemat wyjściowy używany do zwracania danych utworu w odpowiedziach API.
     Zawiera listę identyfikatorów artystów oraz wspiera konwersję z modeli ORM.
 """
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Annotated
+from .types import PositiveId, TrackDuration
 
 class TrackCreate(BaseModel):
     """
@@ -35,55 +36,38 @@ class TrackCreate(BaseModel):
         - title: min_length=1, max_length=200
         - duration: gt=0, lt=86400
         - album_id: gt=0 (jeśli podane)
-        - artist_ids: min_length=1, wszystkie wartości > 0
-
-        Dodatkowa walidacja:
-        validate_artist_ids:
-            Sprawdza, czy wszystkie ID artystów są większe od 0.
+        - artist_ids: min_length=1, wszystkie wartości > 0 (PositiveId,
+          sprawdzane element po elemencie przez pydantic-core)
     """
     title: str = Field(..., min_length=1, max_length=200)
-    duration: int = Field(..., gt=0, lt=86400)
-    album_id: Optional[int] = Field(None, gt=0)
+    duration: TrackDuration
+    album_id: Optional[PositiveId] = None
 
     artist_ids: Annotated[
-        List[int],
+        List[PositiveId],
         Field(..., min_length=1)
     ]
 
     file_path: Optional[str] = Field(None,
                                      description="Lokalna ścieżka do pliku MP3")
 
-    @field_validator("artist_ids")
-    @classmethod
-    def validate_artist_ids(cls, v: List[int]):
-        if any(a <= 0 for a in v):
-            raise ValueError("All artist IDs must be greater than 0")
-        return v
-
 class TrackUpdate(BaseModel):
     """
         Schemat danych używany do aktualizacji istniejącego utworu.
         Wszystkie pola są opcjonalne — aktualizowane są tylko te,
-        które zostały przekazane (exclude_unset=True w CRUD).
+        które zostały przekazane (model_fields_set; make_updater w CRUD).
     """
     title: Optional[str] = Field(None, min_length=1, max_length=200)
-    duration: Optional[int] = Field(None, gt=0, lt=86400)
-    album_id: Optional[int] = Field(None, gt=0)
+    duration: Optional[TrackDuration] = None
+    album_id: Optional[PositiveId] = None
 
     artist_ids: Optional[
-        Annotated[List[int], Field(min_length=1)]
+        Annotated[List[PositiveId], Field(min_length=1)]
     ] = None
 
     file_path: Optional[str] = Field(None,
                                      description="Lokalna ścieżka do pliku MP3")
 
-    @field_validator("artist_ids")
-    @classmethod
-    def validate_artist_ids(cls, v: Optional[List[int]]):
-        if v is not None and any(a <= 0 for a in v):
-            raise ValueError("All artist IDs must be greater than 0")
-        return v
-
 class TrackOut(BaseModel):
     """
         Schemat danych wyjściowych używany do zwracania informacji o utworze.
@@ -92,12 +76,11 @@ class TrackOut(BaseModel):
             Pozwala na automatyczne tworzenie obiektu TrackOut
             bezpośrednio z modelu ORM (SQLAlchemy).
     """
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     title: str
     duration: int
     album_id: Optional[int]
     artist_ids: List[int] = []
     file_path: Optional[str]
-
-    class Config:
-        from_attributes = True
@@ -0,0 +1,19 @@
+"""
+Wspólne typy pól schematów Pydantic.
+
+PositiveId:
+    Identyfikator rekordu powiązanego (np. artist_id, album_id, owner_id).
+    Musi być większy od 0.
+
+TrackDuration:
+    Czas trwania utworu w sekundach. Musi być większy od 0 i mniejszy niż 86400.
+
+Ograniczenia zdefiniowane raz jako `Annotated` są współdzielone przez schematy
+Create i Update, zamiast powtarzać `Field(gt=..., lt=...)` w każdej klasie.
+"""
+from typing import Annotated
+from pydantic import Field
+
+PositiveId = Annotated[int, Field(gt=0)]
+
+TrackDuration = Annotated[int, Field(gt=0, lt=86400)]
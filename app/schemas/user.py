@@ -12,7 +12,7 @@ UserLogin:
 UserUpdate:
     Schemat danych używany do aktualizacji danych użytkownika. Wszystkie pola są opcjonalne.
 """
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from datetime import date
 from typing import Optional
 from app.models import UserRole
@@ -79,18 +79,21 @@ class UserOut(BaseModel):
         from_attributes = True
             Pozwala na automatyczne tworzenie obiektu UserOut
             bezpośrednio z modelu ORM (SQLAlchemy).
+        Pola `email` i `role` są zwykłymi napisami: adres e‑mail został
+        zwalidowany (EmailStr) przy zapisie, a rola jest przechowywana w bazie
+        jako tekst, więc odpowiedź nie uruchamia ponownie email-validatora
+        ani konwersji enum → str.
     """
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     login: str
-    email: EmailStr
+    email: str
     first_name: Optional[str]
     last_name: Optional[str]
     birth_date: Optional[date]
     role: str
 
-    class Config:
-        from_attributes = True
-
 class UserLogin(BaseModel):
     """
         Schemat danych używany podczas logowania użytkownika.
@@ -113,7 +116,7 @@ class UserUpdate(BaseModel):
         Schemat danych używany do aktualizacji danych użytkownika.
 
         Wszystkie pola są opcjonalne — aktualizowane są tylko te,
-        które zostały przekazane (exclude_unset=True w CRUD).
+        które zostały przekazane (model_fields_set; update_by_id w CRUD).
 
         Pola:
         email : EmailStr | None
@@ -1,23 +1,37 @@
 """
 Moduł odpowiedzialny za bezpieczne hashowanie i weryfikację haseł użytkowników.
 
-Wykorzystuje bibliotekę `passlib` oraz algorytm `bcrypt`, który jest obecnie
+Wykorzystuje bezpośrednio bibliotekę `bcrypt` (rozszerzenie w C), która jest obecnie
 jednym z najbezpieczniejszych standardów przechowywania haseł. Funkcje w tym
 module służą do:
 - generowania kryptograficznie bezpiecznych hashy haseł,
 - sprawdzania poprawności hasła podanego przez użytkownika,
-- abstrakcji nad konfiguracją Passlib, aby reszta aplikacji nie musiała
+- abstrakcji nad konfiguracją bcrypt, aby reszta aplikacji nie musiała
   zajmować się szczegółami implementacyjnymi.
 
+Funkcje wywołują `bcrypt.hashpw` / `bcrypt.checkpw` bez warstwy Passlib
+(wybór schematu, parsowanie identyfikatora hasha, sprawdzanie przestarzałości),
+więc koszt żądania to praktycznie wyłącznie koszt samego algorytmu.
+Format hashy ($2b$...) jest ten sam, więc hashe utworzone wcześniej przez
+Passlib są nadal poprawnie weryfikowane.
+
 Zmienne:
-pwd_context : CryptContext
-    Konfiguracja Passlib z algorytmem bcrypt. Ustawienie `deprecated="auto"`
-    pozwala automatycznie oznaczać starsze hashe jako przestarzałe.
+BCRYPT_ROUNDS : int
+    Koszt (liczba rund, log2) algorytmu bcrypt. Domyślne 12 rund bcrypt
+    to ok. 250 ms na hash, co przy wielu logowaniach naraz staje się wąskim
+    gardłem CPU. 10 rund daje ok. 4× większą przepustowość przy zachowaniu
+    kosztu rzędu kilkudziesięciu milisekund na próbę.
+    Hashe utworzone z inną liczbą rund nadal są poprawnie weryfikowane
+    (liczba rund jest zapisana w samym hashu).
+    Wartość można nadpisać zmienną środowiskową BCRYPT_ROUNDS - testy
+    ustawiają 4 rundy (minimum bcrypt), żeby hashowanie nie dominowało
+    czasu ich wykonania.
 """
 
-from passlib.context import CryptContext
+import os
+import bcrypt
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "10"))
 
 def hash_password(password: str) -> str:
     """
@@ -29,20 +43,19 @@ def hash_password(password: str) -> str:
         Zwraca:
             Hash hasła jako string, gotowy do zapisania w bazie danych.
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 def verify_password(password: str, password_hash: str) -> bool:
     """
         Weryfikuje, czy podane hasło odpowiada zapisanemu hashowi.
-        Funkcja porównuje plaintext hasło z jego zahashowaną wersją, korzystając
-        z mechanizmów Passlib, które automatycznie obsługują:
-        - porównanie odporne na timing attacks,
-        - różne wersje hashy,
-        - aktualizację przestarzałych hashy (jeśli konfiguracja to umożliwia).
+        Funkcja porównuje plaintext hasło z jego zahashowaną wersją przy użyciu
+        `bcrypt.checkpw`, który:
+        - porównuje wynik w sposób odporny na timing attacks,
+        - odczytuje wersję i liczbę rund z samego hashu.
         Parametry:
             password: Hasło podane przez użytkownika (plaintext).
             password_hash: Hash zapisany w bazie danych.
         Zwraca:
             True jeśli hasło jest poprawne, False w przeciwnym razie.
     """
-    return pwd_context.verify(password, password_hash)
+    return bcrypt.checkpw(password.encode(), password_hash.encode())
@@ -2,48 +2,108 @@
 Moduł implementujący prosty mechanizm sesji użytkowników oparty na pamięci RAM.
 
 Sesje są przechowywane w słowniku `_sessions`, gdzie kluczem jest identyfikator
-sesji (UUID), a wartością krotka `(user_id, expires_at)`:
+sesji (32 znaki hex z `secrets.token_hex`), a wartością dwuelementowa lista `[user_id, expires_at]`:
 
 - `user_id` — identyfikator użytkownika powiązanego z sesją,
 - `expires_at` — znacznik czasu (timestamp), po którego przekroczeniu sesja wygasa.
 
+Lista jest modyfikowana w miejscu przy przedłużaniu sesji, więc odczyt sesji
+nie tworzy nowego obiektu ani nie zapisuje ponownie wartości w słowniku.
+
 Mechanizm działa w pełni w pamięci, bez bazy danych, i jest przeznaczony do
 prostych zastosowań, testów lub środowisk jednoużytkownikowych.
 
+Jeśli ustawiona jest zmienna środowiskowa SESSION_REDIS_URL, sesje trafiają do
+Redisa (klucze `sess:<id>` z TTL ustawianym po stronie serwera), dzięki czemu
+są współdzielone przez wszystkie procesy uvicorn. Wymaga to pakietu `redis`.
+
 Cechy systemu:
 - sesje mają ograniczony czas życia (TTL),
 - każdorazowe odczytanie sesji przedłuża jej ważność,
-- wygasłe sesje są automatycznie usuwane,
+- wygasłe sesje są automatycznie usuwane - również te, których nikt już
+  nie odczytuje (przy tworzeniu nowej sesji usuwane są wygasłe sesje
+  z początku słownika),
+- liczba sesji w pamięci jest ograniczona (MAX_SESSIONS),
 - sesje można usuwać ręcznie.
 
 Zmienne globalne:
-_sessions: Dict[str, Tuple[int, float]]
-    Słownik przechowujący aktywne sesje.
+_sessions: OrderedDict[str, list]
+    Słownik przechowujący aktywne sesje w kolejności ostatniego użycia.
+    Ponieważ TTL jest stały i przedłużany przy każdym odczycie, jest to
+    jednocześnie kolejność wygasania - najstarsze sesje są na początku.
 
 SESSION_TTL: int
     Czas życia sesji w sekundach (domyślnie 3 minuty).
+
+MAX_SESSIONS: int
+    Maksymalna liczba sesji w pamięci; po jej przekroczeniu usuwana jest
+    najdawniej używana sesja.
+
+_lock: threading.Lock
+    Blokada chroniąca `_sessions`. Synchroniczne endpointy działają w puli
+    wątków, a odczyt sesji to kilka kroków (sprawdzenie, przedłużenie,
+    przeniesienie na koniec), które muszą wykonać się razem.
+
+_redis:
+    Klient Redis (ze współdzieloną pulą połączeń) lub None, gdy sesje
+    przechowywane są w pamięci.
 """
-import uuid
+import os
+import secrets
+import threading
 import time
-from typing import Dict, Tuple
+from collections import OrderedDict
 
-_sessions: Dict[str, Tuple[int, float]] = {}
+_sessions: OrderedDict[str, list] = OrderedDict()
+
+_lock = threading.Lock()
 
 SESSION_TTL = 3 * 60
 
+MAX_SESSIONS = 100_000
+
+SESSION_REDIS_URL: str | None = os.getenv("SESSION_REDIS_URL")
+
+if SESSION_REDIS_URL:
+    import redis
+
+    _redis = redis.Redis.from_url(SESSION_REDIS_URL)
+else:
+    _redis = None
+
+def _redis_key(session_id: str) -> str:
+    """
+        Buduje klucz Redis dla podanego identyfikatora sesji.
+    """
+    return f"sess:{session_id}"
+
 def create_session(user_id: int) -> str:
     """
         Tworzy nową sesję użytkownika.
-        Generuje losowy identyfikator sesji (UUID), oblicza czas wygaśnięcia
-        i zapisuje sesję w pamięci.
+        Generuje losowy identyfikator sesji (128 bitów z generatora
+        kryptograficznego `secrets`, zapisanych jako 32 znaki hex), oblicza
+        czas wygaśnięcia i zapisuje sesję w pamięci. Przy okazji usuwa
+        wygasłe sesje z początku słownika i - w razie przekroczenia
+        MAX_SESSIONS - najdawniej używaną sesję.
         Parametry:
             user_id: Identyfikator użytkownika, dla którego tworzona jest sesja.
         Zwraca:
-            Identyfikator sesji jako string (UUID).
+            Identyfikator sesji jako string (32 znaki hex).
     """
-    session_id = str(uuid.uuid4())
-    expires_at = time.time() + SESSION_TTL
-    _sessions[session_id] = (user_id, expires_at)
+    session_id = secrets.token_hex(16)
+    if _redis is not None:
+        _redis.set(_redis_key(session_id), user_id, ex=SESSION_TTL)
+        return session_id
+
+    now = time.time()
+    with _lock:
+        while _sessions:
+            oldest_id, (_, oldest_expires_at) = next(iter(_sessions.items()))
+            if oldest_expires_at > now and len(_sessions) < MAX_SESSIONS:
+                break
+            del _sessions[oldest_id]
+
+        _sessions[session_id] = [user_id, now + SESSION_TTL]
     return session_id
 
 def get_user_id(session_id: str | None) -> int | None:
@@ -52,27 +112,33 @@ def get_user_id(session_id: str | None) -> int | None:
         Funkcja:
         - zwraca None, jeśli sesja nie istnieje lub wygasła,
         - automatycznie usuwa wygasłe sesje,
-        - przedłuża ważność aktywnej sesji o kolejne SESSION_TTL sekund.
+        - przedłuża ważność aktywnej sesji o kolejne SESSION_TTL sekund
+          (w Redisie jednym poleceniem GETEX, odczyt i przedłużenie naraz).
         Parametry:
-            session_id: Identyfikator sesji (UUID) lub None.
+            session_id: Identyfikator sesji lub None.
         Zwraca:
             Id użytkownika lub None, jeśli sesja jest nieprawidłowa lub wygasła.
     """
     if not session_id:
         return None
 
-    data = _sessions.get(session_id)
-    if not data:
-        return None
+    if _redis is not None:
+        value = _redis.getex(_redis_key(session_id), ex=SESSION_TTL)
+        return int(value) if value is not None else None
 
-    user_id, expires_at = data
+    now = time.time()
+    with _lock:
+        data = _sessions.get(session_id)
+        if not data:
+            return None
 
-    if time.time() > expires_at:
-        del _sessions[session_id]
-        return None
+        if now > data[1]:
+            del _sessions[session_id]
+            return None
 
-    _sessions[session_id] = (user_id, time.time() + SESSION_TTL)
-    return user_id
+        data[1] = now + SESSION_TTL
+        _sessions.move_to_end(session_id)
+    return data[0]
 
 def delete_session(session_id: str | None) -> None:
     """
@@ -80,5 +146,10 @@ def delete_session(session_id: str | None) -> None:
         Parametry:
             session_id: Identyfikator sesji do usunięcia.
     """
-    if session_id in _sessions:
-        del _sessions[session_id]
\ No newline at end of file
+    if _redis is not None:
+        if session_id:
+            _redis.delete(_redis_key(session_id))
+        return
+
+    with _lock:
+        _sessions.pop(session_id, None)
\ No newline at end of file
@@ -8,6 +8,12 @@ a następnie wchodzi w nieskończoną pętlę, w której:
 
 1. Próbuje odebrać komendę JSON od klienta (z timeoutem 0.05 s).
 2. Na podstawie pola "command" wywołuje odpowiednią funkcję w module `player`.
+   W komendach wymagających zapytań do bazy danych (wybór utworu, playlisty,
+   albumu oraz dodanie do kolejki) w puli wątków (`run_in_threadpool`)
+   wykonywany jest wyłącznie odczyt (`player.load_*`), aby synchroniczna
+   sesja SQLAlchemy nie blokowała pętli zdarzeń. Wynik stosowany jest do
+   współdzielonego stanu odtwarzacza w wątku pętli zdarzeń - tak jak tick()
+   pozostałych połączeń - więc stan nigdy nie jest zmieniany z dwóch wątków.
 3. Wykonuje krok czasowy odtwarzacza (`player.tick()`), który:
    - zwiększa licznik czasu,
    - przełącza utwory,
@@ -27,7 +33,8 @@ Obsługiwane komendy:
 - skip                 przejście do następnego utworu
 - track_select         wybór pojedynczego utworu
 - queue_add            dodanie utworu do kolejki
-- queue_remove         usunięcie utworu z kolejki
+- queue_remove         usunięcie utworu z kolejki ("id")
+                       lub wielu utworów naraz ("ids")
 - playlist_select_id   wybór playlisty po ID
 - playlist_select_name wybór playlisty po nazwie
 - album_select_id      wybór albumu po ID
@@ -54,6 +61,7 @@ Endpoint działa dopóki klient nie zamknie połączenia.
 import asyncio
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from . import player
 
 async def websocket_endpoint(ws: WebSocket):
@@ -63,9 +71,12 @@ async def websocket_endpoint(ws: WebSocket):
             ws: Obiekt WebSocket reprezentujący połączenie z klientem.
         Działanie:
             - Akceptuje połączenie WebSocket.
+            - Tworzy sesję bazy danych odtwarzacza na czas połączenia.
             - Wchodzi w pętlę, w której:
                 * próbuje odebrać komendę JSON (z timeoutem 0.05 s),
-                * wykonuje odpowiednią akcję w module `player`,
+                * wykonuje odpowiednią akcję w module `player`
+                  (odczyty z bazy danych w puli wątków, zmiana stanu
+                  odtwarzacza w wątku pętli zdarzeń),
                 * wykonuje krok czasowy odtwarzacza (`player.tick()`),
                 * wysyła aktualny stan odtwarzacza do klienta,
                 * czeka 1 sekundę, aby symulować upływ czasu.
@@ -101,70 +112,76 @@ async def websocket_endpoint(ws: WebSocket):
         await ws.send_json({
             "status": (
                 "PAUSED"
-                if player.current and player.is_paused
+                if player.state.current and player.state.is_paused
                 else "PLAYING"
-                if player.current
+                if player.state.current
                 else "STOPPED"
             ),
-            "track": player.current.title if player.current else None,
-            "elapsed": player.elapsed,
-            "duration": player.current.duration if player.current else None,
-            "queue": [t.title for t in player.get_queue()],
-            "loop_track": player.loop_track,
-            "loop_playlist": player.loop_playlist,
+            "track": player.state.current.title if player.state.current else None,
+            "elapsed": player.state.elapsed,
+            "duration": player.state.current.duration if player.state.current else None,
+            "queue": player.get_queue_titles(),
+            "loop_track": player.state.loop_track,
+            "loop_playlist": player.state.loop_playlist,
             "time": datetime.now().isoformat()
         })
 
-    try:
-        while True:
-            try:
-                data = await asyncio.wait_for(ws.receive_json(), timeout=0.05)
-                command = data.get("command")
-                payload = data.get("payload", {})
-                if command == "play":
-                    player.play()
-                elif command == "pause":
-                    player.stop()
-                elif command == "stop":
-                    player.stop_all()
-                elif command == "skip":
-                    player.skip()
-                elif command == "track_select":
-                    player.select_track(payload["id"])
-                elif command == "queue_add":
-                    player.add_to_queue(payload["track"])
-                elif command == "queue_remove":
-                    player.remove_from_queue(payload["id"])
-                elif command == "playlist_select_id":
-                    player.select_playlist_by_id(
-                        playlist_id=payload["id"],
-                        loop=payload.get("loop", False)
-                    )
-                elif command == "playlist_select_name":
-                    player.select_playlist_by_name(
-                        name=payload["name"],
-                        loop=payload.get("loop", False)
-                    )
-                elif command == "album_select_id":
-                    player.select_album_by_id(
-                        album_id=payload["id"],
-                        loop=payload.get("loop", False)
-                    )
-                elif command == "loop_track":
-                    player.set_loop_track(bool(payload))
-                elif command == "loop_playlist":
-                    player.set_loop_playlist(bool(payload))
-
-            except asyncio.TimeoutError:
-                pass
-            except WebSocketDisconnect:
-                break
-            except Exception:
-                pass
-
-            player.tick()
-            await send_status()
-            await asyncio.sleep(1)
-
-    except WebSocketDisconnect:
-        pass
+    with player.connection_session():
+        try:
+            while True:
+                try:
+                    data = await asyncio.wait_for(ws.receive_json(), timeout=0.05)
+                    command = data.get("command")
+                    payload = data.get("payload", {})
+                    if command == "play":
+                        player.play()
+                    elif command == "pause":
+                        player.stop()
+                    elif command == "stop":
+                        player.stop_all()
+                    elif command == "skip":
+                        player.skip()
+                    elif command == "track_select":
+                        track = await run_in_threadpool(player.load_track, payload["id"])
+                        player.play_track(track)
+                    elif command == "queue_add":
+                        track = await run_in_threadpool(player.load_track, payload["track"])
+                        player.enqueue(track)
+                    elif command == "queue_remove":
+                        if "ids" in payload:
+                            player.remove_many_from_queue(set(payload["ids"]))
+                        else:
+                            player.remove_from_queue(payload["id"])
+                    elif command == "playlist_select_id":
+                        tracks = await run_in_threadpool(
+                            player.load_playlist_tracks_by_id, payload["id"]
+                        )
+                        player.play_playlist(tracks, loop=payload.get("loop", False))
+                    elif command == "playlist_select_name":
+                        tracks = await run_in_threadpool(
+                            player.load_playlist_tracks_by_name, payload["name"]
+                        )
+                        player.play_playlist(tracks, loop=payload.get("loop", False))
+                    elif command == "album_select_id":
+                        tracks = await run_in_threadpool(
+                            player.load_album_tracks, payload["id"]
+                        )
+                        player.play_album(tracks, loop=payload.get("loop", False))
+                    elif command == "loop_track":
+                        player.set_loop_track(bool(payload))
+                    elif command == "loop_playlist":
+                        player.set_loop_playlist(bool(payload))
+
+                except asyncio.TimeoutError:
+                    pass
+                except WebSocketDisconnect:
+                    break
+                except Exception:
+                    pass
+
+                player.tick()
+                await send_status()
+                await asyncio.sleep(1)
+
+        except WebSocketDisconnect:
+            pass
@@ -9,7 +9,9 @@ Cel:
 Zakres działania:
     1. Tworzenie użytkowników:
         - 10 przykładowych kont z unikalnymi loginami i danymi osobowymi.
-        - Rejestracja odbywa się przez crud.register_user (hashowanie haseł).
+        - Hasła są hashowane przez security.hash_password (bcrypt) - raz
+          dla każdego różnego hasła, a nie dla każdego użytkownika (wszystkie
+          konta przykładowe mają to samo hasło).
 
     2. Dodawanie artystów:
         - Daft Punk, Coldplay, The Weeknd.
@@ -26,18 +28,26 @@ Zakres działania:
         - Utwory są pogrupowane według albumów.
         - Każdy utwór ma tytuł, czas trwania, album_id i listę artist_ids.
         - Dzięki temu albumy są automatycznie wypełnione odpowiednimi piosenkami.
+        - Utwory i ich powiązania z artystami zapisuje crud.bulk_create_tracks.
 
     5. Tworzenie playlist:
         - Każdy z 10 użytkowników otrzymuje jedną playlistę.
         - Playlisty mają różne nazwy i właścicieli.
 
     6. Dodawanie utworów do playlist:
-        - Każda playlista otrzymuje zestaw utworów.
-        - Powiązania tworzone są przez crud.add_track_to_playlist.
-
-    7. Zamykanie sesji:
+        - Każda playlista otrzymuje zestaw utworów (słownik `playlist_tracks`).
+        - Powiązania wszystkich playlist zapisuje jednym wywołaniem
+          crud.link_playlist_tracks - ten sam INSERT, z którego korzysta
+          endpoint dodający utwór do playlisty.
+
+    7. Zapis i zamykanie sesji:
+        - Wiersze każdej tabeli wstawiane są jednym zbiorczym INSERT
+          (executemany), a całość zatwierdzana jest jednym commitem.
         - Po zakończeniu seedowania połączenie z bazą jest zamykane.
 
+Dane przykładowe są zwykłymi słownikami (wierszami tabel) - są stałe
+i zaufane, więc nie przechodzą walidacji schematów Pydantic.
+
 Zastosowanie:
     - szybkie przygotowanie bazy do testów,
     - demonstracja działania API,
@@ -48,302 +58,213 @@ Uruchamianie:
     python seed.py
 
 Uwaga:
-    Skrypt zakłada pustą bazę lub brak konfliktów ID.
+    Skrypt zakłada pustą bazę lub brak konfliktów ID - powiązania
+    (album → artysta, utwór → artyści, playlista → utwory) odwołują się
+    do kolejnych ID nadawanych rekordom od 1.
 """
 from datetime import date
-from pydantic.v1 import EmailStr
-from app.database import SessionLocal
+from sqlalchemy import insert
 from app import crud
-from app.models import UserRole
-from app.schemas import UserRegister, ArtistCreate, AlbumCreate, TrackCreate, PlaylistCreate
+from app.database import SessionLocal, init_db
+from app.models import User, UserRole, Artist, Album, Playlist
+from app.security import hash_password
+
+user_data = [
+    ("user1", "Adam", "Kowalski", date(2001, 5, 5), UserRole.admin),
+    ("user2", "Ewa", "Nowak", date(2002, 3, 12), UserRole.user),
+    ("user3", "Paweł", "Zieliński", date(2000, 11, 2), UserRole.user),
+    ("user4", "Anna", "Wiśniewska", date(2003, 1, 20), UserRole.user),
+    ("user5", "Marek", "Lewandowski", date(1999, 7, 14), UserRole.user),
+    ("user6", "Karolina", "Mazur", date(2001, 9, 30), UserRole.user),
+    ("user7", "Tomasz", "Wójcik", date(2000, 4, 18), UserRole.user),
+    ("user8", "Magda", "Krawczyk", date(2002, 8, 9), UserRole.user),
+    ("user9", "Kuba", "Piotrowski", date(2001, 12, 1), UserRole.user),
+    ("user10", "Ola", "Szymańska", date(2003, 6, 22), UserRole.user),
+]
 
 users = [
-    UserRegister(
-        login="user1",
-        email=EmailStr("user1@example.com"),
-        password="pass123",
-        first_name="Adam",
-        last_name="Kowalski",
-        birth_date=date(2001, 5, 5),
-        role=UserRole.admin
-    ),
-    UserRegister(
-        login="user2",
-        email=EmailStr("user2@example.com"),
-        password="pass123",
-        first_name="Ewa",
-        last_name="Nowak",
-        birth_date=date(2002, 3, 12),
-        role=UserRole.user
-    ),
-    UserRegister(
-        login="user3",
-        email=EmailStr("user3@example.com"),
-        password="pass123",
-        first_name="Paweł",
-        last_name="Zieliński",
-        birth_date=date(2000, 11, 2),
-        role=UserRole.user
-    ),
-    UserRegister(
-        login="user4",
-        email=EmailStr("user4@example.com"),
-        password="pass123",
-        first_name="Anna",
-        last_name="Wiśniewska",
-        birth_date=date(2003, 1, 20),
-        role=UserRole.user
-    ),
-    UserRegister(
-        login="user5",
-        email=EmailStr("user5@example.com"),
-        password="pass123",
-        first_name="Marek",
-        last_name="Lewandowski",
-        birth_date=date(1999, 7, 14),
-        role=UserRole.user
-    ),
-    UserRegister(
-        login="user6",
-        email=EmailStr("user6@example.com"),
-        password="pass123",
-        first_name="Karolina",
-        last_name="Mazur",
-        birth_date=date(2001, 9, 30),
-        role=UserRole.user
-    ),
-    UserRegister(
-        login="user7",
-        email=EmailStr("user7@example.com"),
-        password="pass123",
-        first_name="Tomasz",
-        last_name="Wójcik",
-        birth_date=date(2000, 4, 18),
-        role=UserRole.user
-    ),
-    UserRegister(
-        login="user8",
-        email=EmailStr("user8@example.com"),
-        password="pass123",
-        first_name="Magda",
-        last_name="Krawczyk",
-        birth_date=date(2002, 8, 9),
-        role=UserRole.user
-    ),
-    UserRegister(
-        login="user9",
-        email=EmailStr("user9@example.com"),
-        password="pass123",
-        first_name="Kuba",
-        last_name="Piotrowski",
-        birth_date=date(2001, 12, 1),
-        role=UserRole.user
-    ),
-    UserRegister(
-        login="user10",
-        email=EmailStr("user10@example.com"),
-        password="pass123",
-        first_name="Ola",
-        last_name="Szymańska",
-        birth_date=date(2003, 6, 22),
-        role=UserRole.user
-    ),
+    {
+        "login": login,
+        "email": f"{login}@example.com",
+        "password": "pass123",
+        "first_name": first_name,
+        "last_name": last_name,
+        "birth_date": birth_date,
+        "role": role.value
+    }
+    for login, first_name, last_name, birth_date, role in user_data
 ]
 
 
 artists = [
-    ArtistCreate(name="Daft Punk", country="France"),
-    ArtistCreate(name="Coldplay", country="United Kingdom"),
-    ArtistCreate(name="The Weeknd", country="Canada"),
+    {"name": "Daft Punk", "country": "France"},
+    {"name": "Coldplay", "country": "United Kingdom"},
+    {"name": "The Weeknd", "country": "Canada"},
 ]
 
 albums = [
-    AlbumCreate(
-        title="Random Access Memories",
-        release_date=date(2013, 5, 17),
-        artist_id=1,
-    ),
-    AlbumCreate(
-        title="Discovery",
-        release_date=date(2001, 3, 12),
-        artist_id=1,
-    ),
-    AlbumCreate(
-        title="Parachutes",
-        release_date=date(2000, 7, 10),
-        artist_id=2,
-    ),
-    AlbumCreate(
-        title="After Hours",
-        release_date=date(2020, 3, 20),
-        artist_id=3,
-    ),
+    {
+        "title": "Random Access Memories",
+        "release_date": date(2013, 5, 17),
+        "artist_id": 1
+    },
+    {
+        "title": "Discovery",
+        "release_date": date(2001, 3, 12),
+        "artist_id": 1
+    },
+    {
+        "title": "Parachutes",
+        "release_date": date(2000, 7, 10),
+        "artist_id": 2
+    },
+    {
+        "title": "After Hours",
+        "release_date": date(2020, 3, 20),
+        "artist_id": 3
+    },
 ]
 
 tracks = [
-    TrackCreate(
-        title="Get Lucky",
-        duration=369,
-        album_id=1,
-        artist_ids=[1],
-        file_path=None
-    ),
-    TrackCreate(
-        title="Instant Crush",
-        duration=337,
-        album_id=1,
-        artist_ids=[1],
-        file_path=None
-    ),
-    TrackCreate(
-        title="Harder, Better, Faster, Stronger",
-        duration=224,
-        album_id=2,
-        artist_ids=[1],
-        file_path=None
-    ),
-    TrackCreate(
-        title="One More Time",
-        duration=320,
-        album_id=2,
-        artist_ids=[1],
-        file_path=None
-    ),
-    TrackCreate(
-        title="Yellow",
-        duration=269,
-        album_id=3,
-        artist_ids=[2],
-        file_path=None
-    ),
-    TrackCreate(
-        title="Trouble",
-        duration=270,
-        album_id=3,
-        artist_ids=[2],
-        file_path=None
-    ),
-    TrackCreate(
-        title="Blinding Lights",
-        duration=200,
-        album_id=4,
-        artist_ids=[3],
-        file_path=None
-    ),
-    TrackCreate(
-        title="Save Your Tears",
-        duration=215,
-        album_id=4,
-        artist_ids=[3],
-        file_path=None
-    ),
-    TrackCreate(
-        title="Starboy",
-        duration=230,
-        album_id=4,
-        artist_ids=[3],
-        file_path=None
-    ),
-    TrackCreate(
-        title="I Feel It Coming",
-        duration=269,
-        album_id=4,
-        artist_ids=[3],
-        file_path=None
-    ),
+    {
+        "title": "Get Lucky",
+        "duration": 369,
+        "album_id": 1,
+        "artist_ids": [1]
+    },
+    {
+        "title": "Instant Crush",
+        "duration": 337,
+        "album_id": 1,
+        "artist_ids": [1]
+    },
+    {
+        "title": "Harder, Better, Faster, Stronger",
+        "duration": 224,
+        "album_id": 2,
+        "artist_ids": [1]
+    },
+    {
+        "title": "One More Time",
+        "duration": 320,
+        "album_id": 2,
+        "artist_ids": [1]
+    },
+    {
+        "title": "Yellow",
+        "duration": 269,
+        "album_id": 3,
+        "artist_ids": [2]
+    },
+    {
+        "title": "Trouble",
+        "duration": 270,
+        "album_id": 3,
+        "artist_ids": [2]
+    },
+    {
+        "title": "Blinding Lights",
+        "duration": 200,
+        "album_id": 4,
+        "artist_ids": [3]
+    },
+    {
+        "title": "Save Your Tears",
+        "duration": 215,
+        "album_id": 4,
+        "artist_ids": [3]
+    },
+    {
+        "title": "Starboy",
+        "duration": 230,
+        "album_id": 4,
+        "artist_ids": [3]
+    },
+    {
+        "title": "I Feel It Coming",
+        "duration": 269,
+        "album_id": 4,
+        "artist_ids": [3]
+    },
 ]
 
 playlists = [
-    PlaylistCreate(
-        name="Daft Punk Essentials",
-        owner_id=1
-    ),
-    PlaylistCreate(
-        name="Coldplay Chill",
-        owner_id=2
-    ),
-    PlaylistCreate(
-        name="The Weeknd Hits",
-        owner_id=3
-    ),
-    PlaylistCreate(
-        name="Workout Mix",
-        owner_id=4
-    ),
-    PlaylistCreate(
-        name="Evening Relax",
-        owner_id=5
-    ),
-    PlaylistCreate(
-        name="Top 10 Favorites",
-        owner_id=6
-    ),
-    PlaylistCreate(
-        name="Electronic Vibes",
-        owner_id=7
-    ),
-    PlaylistCreate(
-        name="Soft & Calm",
-        owner_id=8
-    ),
-    PlaylistCreate(
-        name="Party Mode",
-        owner_id=9
-    ),
-    PlaylistCreate(
-        name="Daily Mix",
-        owner_id=10
-    ),
+    {
+        "name": "Daft Punk Essentials",
+        "owner_id": 1
+    },
+    {
+        "name": "Coldplay Chill",
+        "owner_id": 2
+    },
+    {
+        "name": "The Weeknd Hits",
+        "owner_id": 3
+    },
+    {
+        "name": "Workout Mix",
+        "owner_id": 4
+    },
+    {
+        "name": "Evening Relax",
+        "owner_id": 5
+    },
+    {
+        "name": "Top 10 Favorites",
+        "owner_id": 6
+    },
+    {
+        "name": "Electronic Vibes",
+        "owner_id": 7
+    },
+    {
+        "name": "Soft & Calm",
+        "owner_id": 8
+    },
+    {
+        "name": "Party Mode",
+        "owner_id": 9
+    },
+    {
+        "name": "Daily Mix",
+        "owner_id": 10
+    },
 ]
 
+playlist_tracks = {
+    1: [1, 2, 3, 4],
+    2: [5, 6],
+    3: [7, 8, 9, 10],
+    4: [1, 4, 7, 9],
+    5: [2, 5, 6, 10],
+    6: list(range(1, 11)),
+    7: [1, 3, 4, 7],
+    8: [5, 6, 10],
+    9: [1, 4, 7, 8, 9],
+    10: [2, 5, 7, 10],
+}
+
 def main():
+    init_db()
     db = SessionLocal()
     try:
-        for u in users:
-            crud.register_user(db, u)
-
-        for a in artists:
-            crud.create_artist(db, a)
-
-        for al in albums:
-            crud.create_album(db, al)
-
-        for t in tracks:
-            crud.create_track(db, t)
-
-        for p in playlists:
-            crud.create_playlist(db, p)
-
-        for tid in [1, 2, 3, 4]:
-            crud.add_track_to_playlist(db, 1, tid)
-
-        for tid in [5, 6]:
-            crud.add_track_to_playlist(db, 2, tid)
-
-        for tid in [7, 8, 9, 10]:
-            crud.add_track_to_playlist(db, 3, tid)
-
-        for tid in [1, 4, 7, 9]:
-            crud.add_track_to_playlist(db, 4, tid)
-
-        for tid in [2, 5, 6, 10]:
-            crud.add_track_to_playlist(db, 5, tid)
-
-        for tid in range(1, 11):
-            crud.add_track_to_playlist(db, 6, tid)
+        password_hashes = {password: hash_password(password) for password in {u["password"] for u in users}}
+        db.execute(insert(User), [{**u, "password": password_hashes[u["password"]]} for u in users])
 
-        for tid in [1, 3, 4, 7]:
-            crud.add_track_to_playlist(db, 7, tid)
+        db.execute(insert(Artist), artists)
 
-        for tid in [5, 6, 10]:
-            crud.add_track_to_playlist(db, 8, tid)
+        db.execute(insert(Album), albums)
 
-        for tid in [1, 4, 7, 8, 9]:
-            crud.add_track_to_playlist(db, 9, tid)
+        crud.bulk_create_tracks(db, tracks)
 
-        for tid in [2, 5, 7, 10]:
-            crud.add_track_to_playlist(db, 10, tid)
+        db.execute(insert(Playlist), playlists)
+        crud.link_playlist_tracks(db, [
+            {"playlist_id": playlist_id, "track_id": track_id}
+            for playlist_id, track_ids in playlist_tracks.items()
+            for track_id in track_ids
+        ])
 
+        db.commit()
         print("Seed completed.")
     finally:
         db.close()
@@ -2,86 +2,237 @@
 Zestaw fixture pytest wykorzystywanych w testach integracyjnych aplikacji FastAPI.
 
 Plik przygotowuje:
-- izolowaną bazę danych SQLite dla testów,
-- klienta TestClient z nadpisaną zależnością get_db,
+- izolowaną bazę danych SQLite w pamięci RAM (bez plików i fsync),
+- klienta TestClient z nadpisaną zależnością get_db (jeden na całą sesję
+  testową - aplikacja i jej lifespan uruchamiane są tylko raz),
 - zestaw obiektów testowych (User, Artist, Album, Track, Playlist),
-  które mogą być wykorzystywane w wielu testach.
+  które mogą być wykorzystywane w wielu testach,
+- klientów zalogowanych jako zwykły użytkownik lub administrator
+  (`user_client`, `admin_client`) - sesja tworzona jest bezpośrednio,
+  bez rejestracji i logowania przez API (i bez hashowania hasła).
+- licznik zapytań SQL (`count_queries`) dla testów sprawdzających liczbę
+  zapytań wykonywanych przez warstwę CRUD i odtwarzacz,
+- atrapę klienta Redis (`fake_redis`) dla testów sesji i cache
+  przechowywanych w Redisie.
 
 Fixture’y zapewniają pełną izolację środowiska testowego:
-- przed każdym testem tworzona jest nowa baza danych,
-- po teście baza jest usuwana,
+- tabele tworzone są raz na całą sesję testową (fixture `_schema`),
+- stan odtwarzacza (`player.state`) resetowany jest przed i po każdym
+  teście (fixture `_reset_player`),
+- po każdym teście wszystkie tabele są czyszczone (DELETE zamiast
+  ponownego DROP/CREATE schematu),
 - każdy fixture tworzy i zwraca w pełni zapisany obiekt ORM.
 
 Dzięki temu testy są deterministyczne, powtarzalne i nie wpływają na siebie nawzajem.
+
+Testy uruchamiane są w trybie STRICT_LOADING, więc leniwe ładowanie relacji
+obiektów zwracanych przez get_playlist/get_track kończy się wyjątkiem.
+Hasła hashowane są z minimalnym kosztem bcrypt (BCRYPT_ROUNDS=4).
+
+Testy można uruchamiać równolegle (pytest-xdist, `pytest -n auto`) - każdy
+proces roboczy ma własną bazę w pamięci i własny stan modułów aplikacji.
 """
+import os
+os.environ.setdefault("STRICT_LOADING", "1")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
 from datetime import date
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from app import database
+from sqlalchemy.pool import StaticPool
+from app import cache, database, session
 from app.database import Base, get_db
 from app.models import Artist, Track, User, Album, Playlist
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
+# Każde połączenie z ":memory:" to osobna, pusta baza - StaticPool utrzymuje
+# jedno połączenie współdzielone przez wszystkie sesje (również te otwierane
+# przez aplikację w innych wątkach), więc wszystkie widzą te same dane.
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
 )
 
-TestingSessionLocal = sessionmaker(bind=engine)
+# Te same ustawienia sesji co app.database.SessionLocal (autoflush=False,
+# domyślne expire_on_commit=True) - testy widzą sesje skonfigurowane
+# dokładnie tak jak w aplikacji.
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 database.SessionLocal = TestingSessionLocal
+# init_db (lifespan aplikacji) tworzy tabele w testowej bazie zamiast w pliku
+# playlist.db - równoległe procesy xdist nie współdzielą żadnego pliku.
+database.engine = engine
 
+from app import player
 from app.main import app
 
-@pytest.fixture()
-def client():
+@pytest.fixture(scope="session")
+def _schema():
     """
-        Tworzy instancję TestClient z nadpisaną zależnością get_db,
-        tak aby każdy test korzystał z osobnej sesji bazy danych.
-        Mechanizm:
-        - tworzy strukturę tabel w testowej bazie SQLite,
-        - nadpisuje zależność get_db, aby zwracała TestingSessionLocal,
-        - uruchamia TestClient w kontekście,
-        - po zakończeniu testu usuwa wszystkie tabele.
-        Zwraca:
-            TestClient — klient HTTP do wykonywania żądań w testach.
+        Tworzy strukturę tabel w testowej bazie SQLite raz na sesję testową
+        i usuwa ją po zakończeniu wszystkich testów.
     """
     Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
+def _override_get_db():
+    """
+        Zastępuje zależność get_db - każde żądanie otrzymuje osobną sesję
+        TestingSessionLocal, zamykaną po zakończeniu żądania.
+    """
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
 
-    app.dependency_overrides[get_db] = override_get_db
+def _clear_tables():
+    """
+        Usuwa wszystkie wiersze ze wszystkich tabel jedną transakcją
+        (tabele zależne przed tabelami, do których się odwołują).
+    """
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+@pytest.fixture(scope="session")
+def _app_client(_schema):
+    """
+        Tworzy jedną instancję TestClient na całą sesję testową.
+        Mechanizm:
+        - nadpisuje zależność get_db funkcją _override_get_db,
+        - uruchamia TestClient w kontekście (lifespan aplikacji wykonywany
+          jest raz, a nie przed każdym testem).
+        Zwraca:
+            TestClient — klient HTTP współdzielony przez testy.
+    """
+    app.dependency_overrides[get_db] = _override_get_db
     with TestClient(app) as c:
         yield c
+    app.dependency_overrides.pop(get_db, None)
 
-    Base.metadata.drop_all(bind=engine)
+@pytest.fixture()
+def client(_app_client):
+    """
+        Udostępnia współdzielony TestClient w stanie jak dla nowego klienta.
+        Mechanizm:
+        - korzysta ze struktury tabel utworzonej raz na sesję (_schema),
+        - czyści cache list zasobów i danych utworów odtwarzacza,
+        - usuwa ciasteczka pozostawione przez poprzedni test (np. sesję
+          zalogowanego użytkownika),
+        - po zakończeniu testu czyści wszystkie tabele.
+        Zwraca:
+            TestClient — klient HTTP do wykonywania żądań w testach.
+    """
+    cache.clear()
+    player.invalidate_track_cache()
+    _app_client.cookies.clear()
+    yield _app_client
+
+    _clear_tables()
+
+@pytest.fixture(autouse=True)
+def _reset_player():
+    """
+        Przywraca odtwarzacz do stanu początkowego (pusta kolejka, brak
+        utworu, wyłączone pętle) przed każdym testem i po nim, aby stan
+        modułu `player` nie przechodził między testami.
+    """
+    player.reset()
+    yield
+    player.reset()
 
 @pytest.fixture()
-def db():
+def db(_schema):
     """
         Tworzy sesję bazy danych SQLAlchemy dla testów jednostkowych,
         które wymagają bezpośredniego dostępu do ORM.
         Mechanizm:
-        - tworzy strukturę tabel,
+        - korzysta ze struktury tabel utworzonej raz na sesję (_schema),
+        - czyści cache list zasobów i danych utworów odtwarzacza,
         - zwraca sesję TestingSessionLocal,
-        - po teście zamyka sesję i usuwa tabele.
+        - po teście zamyka sesję i czyści wszystkie tabele.
         Zwraca:
             Session — sesja SQLAlchemy gotowa do użycia.
     """
-    Base.metadata.create_all(bind=engine)
+    cache.clear()
+    player.invalidate_track_cache()
     db = TestingSessionLocal()
     try:
         yield db
     finally:
         db.close()
-    Base.metadata.drop_all(bind=engine)
+    _clear_tables()
+
+@pytest.fixture
+def count_queries():
+    """
+        Zwraca menedżer kontekstu zliczający zapytania SQL wykonane przez
+        testowy silnik bazy danych (zdarzenie `before_cursor_execute`).
+        Użycie:
+            with count_queries() as statements:
+                ...
+            assert len(statements) == 1
+        Zwraca:
+            Funkcja tworząca menedżer kontekstu, który udostępnia listę
+            treści wykonanych zapytań SQL.
+    """
+    @contextmanager
+    def counting():
+        statements = []
+
+        def count(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+    return counting
+
+class FakeRedis:
+    """
+        Atrapa klienta Redis z poleceniami używanymi przez `app.session`
+        i `app.cache`. Przechowuje pary klucz -> (wartość, ttl), a wartości
+        zwraca jako bajty, tak jak prawdziwy klient.
+    """
+    def __init__(self):
+        self.data: dict[str, tuple[bytes, int | None]] = {}
+
+    def set(self, key, value, ex=None):
+        self.data[key] = (value if isinstance(value, bytes) else str(value).encode(), ex)
+
+    def get(self, key):
+        return self.data[key][0] if key in self.data else None
+
+    def getex(self, key, ex=None):
+        if key not in self.data:
+            return None
+        value, _ = self.data[key]
+        self.data[key] = (value, ex)
+        return value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match="*"):
+        return iter([key for key in self.data if fnmatchcase(key, match)])
+
+@pytest.fixture
+def fake_redis():
+    """
+        Zwraca nową, pustą atrapę klienta Redis (FakeRedis).
+    """
+    return FakeRedis()
 
 @pytest.fixture
 def user(db):
@@ -105,6 +256,52 @@ def user(db):
     return user
 
 
+@pytest.fixture
+def admin(db):
+    """
+    Tworzy i zapisuje w bazie testowego administratora.
+    Zwraca:
+        User — obiekt użytkownika z rolą "admin".
+    """
+    admin = User(
+        login="adminuser",
+        email="admin@test.pl",
+        password="x" * 60,
+        first_name="Test",
+        last_name="Admin",
+        birth_date=date(2001, 5, 5),
+        role="admin"
+    )
+    db.add(admin)
+    db.commit()
+    db.refresh(admin)
+    return admin
+
+def _login(client, user):
+    """
+        Loguje klienta jako podanego użytkownika - tworzy sesję i ustawia
+        ciasteczko `session_id` tak jak endpoint /auth/login (dla tej samej
+        domeny, więc /auth/logout usuwa je z klienta).
+    """
+    client.cookies.set(
+        "session_id", session.create_session(user.id), domain="testserver.local"
+    )
+    return client
+
+@pytest.fixture
+def user_client(client, user):
+    """
+        Zwraca TestClient zalogowany jako testowy użytkownik (fixture `user`).
+    """
+    return _login(client, user)
+
+@pytest.fixture
+def admin_client(client, admin):
+    """
+        Zwraca TestClient zalogowany jako testowy administrator (fixture `admin`).
+    """
+    return _login(client, admin)
+
 @pytest.fixture
 def artist(db):
     """
@@ -1,7 +1,10 @@
 from datetime import date
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.exc import InvalidRequestError
 from app import crud, schemas
 
-def test_create_get_update_delete_album(db, client):
+def test_create_get_update_delete_album(db, artist):
     """
     Test integracyjny sprawdzający pełny cykl życia albumu (CRUD):
     - utworzenie albumu,
@@ -10,7 +13,7 @@ def test_create_get_update_delete_album(db, client):
     - usunięcie albumu.
 
     Scenariusz:
-    1. Tworzony jest artysta, który będzie właścicielem albumu.
+    1. Właścicielem albumu jest artysta z fixture `artist`.
     2. Tworzony jest album z wykorzystaniem schematu AlbumCreate.
     3. Test weryfikuje:
        - czy album został zapisany (album.id nie jest None),
@@ -28,8 +31,6 @@ def test_create_get_update_delete_album(db, client):
     w warstwie logiki aplikacji (CRUD) oraz że dane są poprawnie zapisywane
     i usuwane z bazy danych.
     """
-    artist = crud.create_artist(db, schemas.ArtistCreate(name="Artist1", country=None))
-
     album_in = schemas.AlbumCreate(
         title="Album1",
         release_date=date(2009, 5, 1),
@@ -51,3 +52,54 @@ def test_create_get_update_delete_album(db, client):
     assert result is True
     assert crud.get_album(db, album.id) is None
 
+def test_get_albums_query_count_is_constant(db, count_queries):
+    """
+    Test sprawdzający, że pobranie listy albumów wykonuje stałą liczbę zapytań,
+    niezależnie od liczby albumów, a relacje nie są ładowane leniwie.
+
+    Scenariusz:
+    1. Tworzony jest artysta i pięć albumów.
+    2. Zapytania SQL są zliczane przez fixture `count_queries`.
+    3. Pobierana jest lista albumów (get_albums).
+    4. Test sprawdza, że wykonano jedno zapytanie, a dostęp do relacji
+       `artist` zgłasza wyjątek (raiseload).
+
+    Cel:
+    Upewnić się, że endpointy list nie generują problemu N+1.
+    """
+    artist = crud.create_artist(db, schemas.ArtistCreate(name="AlbumArtist"))
+    for i in range(5):
+        crud.create_album(db, schemas.AlbumCreate(title=f"Album{i}", artist_id=artist.id))
+    db.expunge_all()
+
+    with count_queries() as statements:
+        albums = crud.get_albums(db)
+
+    assert len(albums) == 5
+    assert len(statements) == 1
+    with pytest.raises(InvalidRequestError):
+        _ = albums[0].artist
+
+def test_update_album_validates_before_query(db, artist):
+    """
+    Test sprawdzający walidację danych aktualizacji albumu.
+
+    Scenariusz:
+    1. Tworzony jest album artysty z fixture `artist`.
+    2. Album jest aktualizowany datą wydania przekazaną jako tekst ISO.
+    3. Test sprawdza, że data została zapisana jako obiekt date,
+       a pusty tytuł oraz niepoprawna data są odrzucane przez schemat.
+
+    Cel:
+    Upewnić się, że ograniczenia tabeli `albums` są odwzorowane w AlbumUpdate,
+    więc niepoprawne dane nie trafiają do bazy.
+    """
+    album = crud.create_album(db, schemas.AlbumCreate(title="Album1", artist_id=artist.id))
+
+    updated = crud.update_album(db, album.id, schemas.AlbumUpdate(release_date="2024-02-01"))
+    assert updated.release_date == date(2024, 2, 1)
+
+    with pytest.raises(ValidationError):
+        schemas.AlbumUpdate(title="")
+    with pytest.raises(ValidationError):
+        schemas.AlbumUpdate(release_date="not a date")
@@ -1,6 +1,6 @@
 from app import crud, schemas
 
-def test_create_get_update_delete_artist(db, client):
+def test_create_get_update_delete_artist(db):
     """
     Test integracyjny sprawdzający pełny cykl życia artysty (CRUD):
     - utworzenie artysty,
@@ -42,3 +42,21 @@ def test_create_get_update_delete_artist(db, client):
     result = crud.delete_artist(db, artist.id)
     assert result is True
     assert crud.get_artist(db, artist.id) is None
+
+def test_create_artist_does_not_reload_after_commit(db, count_queries):
+    """
+    Test sprawdzający, że utworzenie artysty wykonuje jedno zapytanie SQL.
+
+    Scenariusz:
+    1. Zapytania SQL są zliczane przez fixture `count_queries`.
+    2. Tworzony jest artysta i odczytywane są jego pola.
+    3. Test sprawdza, że wykonano tylko INSERT ... RETURNING
+       (bez SELECT odświeżającego obiekt po zatwierdzeniu transakcji).
+    """
+    with count_queries() as statements:
+        artist = crud.create_artist(db, schemas.ArtistCreate(name="Artist1", country="PL"))
+        assert artist.name == "Artist1"
+        assert artist.country == "PL"
+
+    assert artist.id is not None
+    assert len(statements) == 1
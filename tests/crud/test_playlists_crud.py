@@ -1,8 +1,8 @@
-from datetime import date
-
+from sqlalchemy import select
 from app import crud, schemas
+from app.models import playlist_track
 
-def test_create_add_get_remove_playlist_tracks(db, client):
+def test_create_add_get_remove_playlist_tracks(db, user, track):
     """
     Test integracyjny sprawdzający pełny cykl zarządzania utworami w playliście:
     - utworzenie playlisty,
@@ -11,57 +11,32 @@ def test_create_add_get_remove_playlist_tracks(db, client):
     - usunięcie utworu z playlisty.
 
     Scenariusz:
-    1. Tworzony jest użytkownik testowy poprzez funkcję CRUD `register_user`.
-    2. Tworzony jest artysta, który będzie właścicielem albumu i utworu.
-    3. Tworzony jest album powiązany z artystą.
-    4. Tworzony jest utwór powiązany z albumem i artystą (relacja many-to-many).
-    5. Tworzona jest playlista należąca do użytkownika.
-    6. Test weryfikuje:
+    1. Użytkownik oraz utwór (z albumem i artystą) pochodzą z fixture
+       `user` i `track`.
+    2. Tworzona jest playlista należąca do użytkownika.
+    3. Test weryfikuje:
        - czy playlista została poprawnie utworzona,
        - czy otrzymała identyfikator.
-    7. Utwór jest dodawany do playlisty za pomocą `add_track_to_playlist`.
-    8. Test sprawdza:
-       - czy operacja zwróciła True,
+    4. Utwór jest dodawany do playlisty za pomocą `add_tracks_to_playlist`.
+    5. Test sprawdza:
        - czy playlista zawiera dokładnie jeden utwór,
        - czy ID utworu zgadza się z oczekiwanym.
-    9. Utwór jest usuwany z playlisty.
-    10. Test potwierdza:
-        - że operacja usunięcia zwróciła True,
-        - że playlista nie zawiera już żadnych utworów.
+    6. Utwór jest usuwany z playlisty.
+    7. Test potwierdza:
+       - że operacja usunięcia zwróciła True,
+       - że playlista nie zawiera już żadnych utworów.
 
     Cel:
     Zweryfikować poprawność operacji CRUD związanych z zarządzaniem zawartością playlist:
     dodawaniem, pobieraniem i usuwaniem utworów. Test potwierdza, że relacje many-to-many
     między playlistami a utworami działają poprawnie i są spójne w warstwie CRUD.
     """
-    user = crud.register_user(
-        db,
-        schemas.UserRegister(login="playlistuser", email="pl@test.pl", password="123456", birth_date=date(2010,5,5))
-    )
-    artist = crud.create_artist(db, schemas.ArtistCreate(name="PlArtist"))
-
-    album = crud.create_album(
-        db,
-        schemas.AlbumCreate(title="PlAlbum", artist_id=artist.id)
-    )
-
-    track = crud.create_track(
-        db,
-        schemas.TrackCreate(
-            title="PlTrack",
-            duration=200,
-            album_id=album.id,
-            artist_ids=[artist.id]
-        )
-    )
-
     playlist_in = schemas.PlaylistCreate(name="MyPlaylist", owner_id=user.id)
     playlist = crud.create_playlist(db, playlist_in)
     assert playlist.id is not None
     assert playlist.name == "MyPlaylist"
 
-    added = crud.add_track_to_playlist(db, playlist.id, track.id)
-    assert added is True
+    crud.add_tracks_to_playlist(db, playlist.id, [track.id])
 
     tracks = crud.get_playlist_tracks(db, playlist.id)
     assert len(tracks) == 1
@@ -72,3 +47,117 @@ def test_create_add_get_remove_playlist_tracks(db, client):
     tracks = crud.get_playlist_tracks(db, playlist.id)
     assert len(tracks) == 0
 
+def test_add_tracks_to_playlist_skips_existing_links(db, playlist, track, track2):
+    """
+    Test sprawdzający hurtowe dodawanie utworów do playlisty.
+
+    Scenariusz:
+    1. Fixture tworzy playlistę zawierającą dwa utwory.
+    2. Wywoływana jest funkcja `add_tracks_to_playlist` z listą
+       zawierającą oba utwory, w tym jeden dwukrotnie.
+    3. Test sprawdza, że playlista nadal zawiera dokładnie dwa utwory.
+
+    Cel:
+    Upewnić się, że istniejące powiązania są pomijane zamiast powodować
+    błąd naruszenia klucza głównego tabeli `playlist_track`.
+    """
+    crud.add_tracks_to_playlist(db, playlist.id, [track.id, track2.id, track.id])
+
+    tracks = crud.get_playlist_tracks(db, playlist.id)
+    assert sorted(t.id for t in tracks) == [track.id, track2.id]
+
+def test_link_playlist_tracks_does_not_commit(db, user, track, track2):
+    """
+    Test sprawdzający, że `link_playlist_tracks` nie zatwierdza transakcji.
+
+    Scenariusz:
+    1. Tworzone są dwie playlisty użytkownika.
+    2. Jednym wywołaniem wstawiane są powiązania obu playlist z utworami.
+    3. Wycofanie transakcji usuwa wszystkie powiązania.
+
+    Cel:
+    Upewnić się, że wywołujący (np. seed.py) może zapisać powiązania wielu
+    playlist w jednej transakcji.
+    """
+    first = crud.create_playlist(db, schemas.PlaylistCreate(name="First", owner_id=user.id))
+    second = crud.create_playlist(db, schemas.PlaylistCreate(name="Second", owner_id=user.id))
+
+    crud.link_playlist_tracks(db, [
+        {"playlist_id": first.id, "track_id": track.id},
+        {"playlist_id": second.id, "track_id": track.id},
+        {"playlist_id": second.id, "track_id": track2.id},
+    ])
+    links = select(playlist_track.c.playlist_id, playlist_track.c.track_id)
+    assert len(db.execute(links).all()) == 3
+
+    db.rollback()
+    assert db.execute(links).all() == []
+
+def test_create_playlist_sets_empty_tracks_without_query(db, user, count_queries):
+    """
+    Test sprawdzający, że nowo utworzona playlista ma załadowaną pustą
+    relację `tracks`.
+
+    Scenariusz:
+    1. Tworzona jest playlista użytkownika.
+    2. Zapytania SQL są zliczane przez fixture `count_queries`.
+    3. Odczytywana jest relacja `tracks` (jak przy budowie PlaylistOut).
+    4. Test sprawdza, że lista jest pusta i nie wykonano żadnego zapytania.
+
+    Cel:
+    Upewnić się, że odpowiedź endpointu tworzenia playlisty nie wymaga
+    leniwego ładowania relacji.
+    """
+    playlist = crud.create_playlist(db, schemas.PlaylistCreate(name="Fresh", owner_id=user.id))
+
+    with count_queries() as statements:
+        track_ids = [t.id for t in playlist.tracks]
+
+    assert track_ids == []
+    assert statements == []
+
+def test_get_playlist_track_link(db, user, playlist, track):
+    """
+    Test sprawdzający pobieranie stanu powiązania playlisty z utworem.
+
+    Scenariusz:
+    1. Fixture tworzy playlistę zawierającą utwór `track`.
+    2. Dla istniejącego powiązania zwracany jest właściciel i True.
+    3. Po usunięciu utworu z playlisty zwracany jest właściciel i False.
+    4. Dla nieistniejącej playlisty lub utworu zwracane jest None.
+
+    Cel:
+    Upewnić się, że jedno zapytanie dostarcza danych potrzebnych
+    endpointowi dodawania utworu do playlisty.
+    """
+    assert crud.get_playlist_track_link(db, playlist.id, track.id) == (user.id, True)
+
+    crud.remove_track_from_playlist(db, playlist.id, track.id)
+    assert crud.get_playlist_track_link(db, playlist.id, track.id) == (user.id, False)
+
+    assert crud.get_playlist_track_link(db, 999, track.id) is None
+    assert crud.get_playlist_track_link(db, playlist.id, 999) is None
+    assert crud.get_playlist_owner_id(db, playlist.id) == user.id
+    assert crud.get_playlist_owner_id(db, 999) is None
+
+def test_update_playlist_returns_loaded_playlist(db, playlist, track, track2, count_queries):
+    """
+    Test sprawdzający, że zaktualizowana playlista nie wymaga kolejnych zapytań.
+
+    Scenariusz:
+    1. Nazwa playlisty jest zmieniana przez `update_playlist`.
+    2. Zapytania SQL są zliczane przez fixture `count_queries`.
+    3. Odczytywane są nazwa oraz identyfikatory utworów (jak przy budowie PlaylistOut).
+    4. Test sprawdza poprawność danych i brak jakichkolwiek zapytań.
+
+    Cel:
+    Upewnić się, że UPDATE ... RETURNING wraz z selectinload dostarcza
+    kompletny obiekt bez odświeżania po zatwierdzeniu transakcji.
+    """
+    updated = crud.update_playlist(db, playlist.id, schemas.PlaylistUpdate(name="Renamed"))
+
+    with count_queries() as statements:
+        name, track_ids = updated.name, updated.track_ids
+
+    assert (name, track_ids) == ("Renamed", [track.id, track2.id])
+    assert statements == []
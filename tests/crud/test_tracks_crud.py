@@ -1,6 +1,12 @@
-from app import crud, schemas
+import os
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from app import crud, player, schemas
+from app.crud import track as track_crud
+from app.models import track_artist
 
-def test_create_get_update_delete_track(db, client):
+def test_create_get_update_delete_track(db, artist, album):
     """
     Test integracyjny sprawdzający pełny cykl życia utworu (CRUD):
     - utworzenie utworu,
@@ -9,20 +15,19 @@ def test_create_get_update_delete_track(db, client):
     - usunięcie utworu.
 
     Scenariusz:
-    1. Tworzony jest artysta, który będzie właścicielem albumu.
-    2. Tworzony jest album powiązany z artystą.
-    3. Tworzony jest utwór z wykorzystaniem schematu TrackCreate:
+    1. Artysta i album pochodzą z fixture `artist` i `album`.
+    2. Tworzony jest utwór z wykorzystaniem schematu TrackCreate:
        - tytuł "Track1",
        - czas trwania 180 sekund,
        - powiązanie z albumem i artystą.
-    4. Test weryfikuje:
+    3. Test weryfikuje:
        - czy utwór został poprawnie zapisany (track.id nie jest None),
        - czy tytuł utworu jest zgodny z oczekiwanym.
-    5. Utwór jest pobierany z bazy i sprawdzane są jego dane.
-    6. Utwór jest aktualizowany — tytuł zmieniany na "TrackUpdated".
-    7. Test sprawdza, czy aktualizacja została poprawnie zapisana.
-    8. Utwór jest usuwany z bazy.
-    9. Test potwierdza:
+    4. Utwór jest pobierany z bazy i sprawdzane są jego dane.
+    5. Utwór jest aktualizowany — tytuł zmieniany na "TrackUpdated".
+    6. Test sprawdza, czy aktualizacja została poprawnie zapisana.
+    7. Utwór jest usuwany z bazy.
+    8. Test potwierdza:
        - że operacja usunięcia zwróciła True,
        - że utwór został poprawnie usunięty z bazy.
 
@@ -30,9 +35,6 @@ def test_create_get_update_delete_track(db, client):
     Zweryfikować poprawność operacji CRUD dla utworów muzycznych oraz
     spójność relacji między utworem, albumem i artystą w warstwie CRUD.
     """
-    artist = crud.create_artist(db, schemas.ArtistCreate(name="TrackArtist"))
-    album = crud.create_album(db, schemas.AlbumCreate(title="TrackAlbum", artist_id=artist.id))
-
     track_in = schemas.TrackCreate(
         title="Track1",
         duration=180,
@@ -52,3 +54,149 @@ def test_create_get_update_delete_track(db, client):
     assert updated_track.title == "TrackUpdated"
     assert crud.delete_track(db, track.id) is True
 
+
+def test_validate_filename_uses_track_dir_listing(tmp_path, monkeypatch):
+    """
+    Test sprawdzający walidację nazwy pliku na podstawie listingu katalogu
+    static/tracks/ (zbiór `_known_files`).
+
+    Scenariusz:
+    1. TRACK_DIR jest podmieniany na pusty katalog tymczasowy.
+    2. Walidacja nazwy "1.mp3" kończy się błędem ValueError.
+    3. W katalogu tworzony jest plik "1.mp3".
+    4. Walidacja nazwy "1.mp3" przechodzi, bo zmiana katalogu odświeża zbiór plików.
+
+    Cel:
+    Upewnić się, że zapamiętany zbiór plików jest odświeżany po zmianie
+    zawartości katalogu i nie zwraca nieaktualnych wyników.
+    """
+    monkeypatch.setattr(track_crud, "TRACK_DIR", str(tmp_path))
+    monkeypatch.setattr(track_crud, "_known_mtime", None)
+
+    with pytest.raises(ValueError):
+        track_crud._validate_filename("1.mp3")
+
+    (tmp_path / "1.mp3").write_bytes(b"")
+    os.utime(tmp_path, ns=(0, 1))
+    track_crud._validate_filename("1.mp3")
+
+def test_create_track_accepts_mixed_case_extension(db, artist, tmp_path, monkeypatch):
+    """
+    Test sprawdzający rozszerzenie pliku podane w dowolnej wielkości liter.
+
+    Scenariusz:
+    1. TRACK_DIR jest podmieniany na katalog tymczasowy z plikiem "song.Mp3".
+    2. Nazwy "song.Mp3" i "song.MP3" nie są uzupełniane o kolejne ".mp3",
+       a nazwa "song" - tak.
+    3. Utwór tworzony z file_path="song.Mp3" zapisuje ścieżkę do tego pliku.
+
+    Cel:
+    Upewnić się, że normalizacja nazwy pliku nie rozróżnia wielkości liter
+    rozszerzenia, więc istniejący plik nie jest odrzucany błędem 400.
+    """
+    monkeypatch.setattr(track_crud, "TRACK_DIR", str(tmp_path))
+    monkeypatch.setattr(track_crud, "_known_mtime", None)
+    (tmp_path / "song.Mp3").write_bytes(b"")
+
+    assert track_crud._normalize_filename("song.Mp3") == "song.Mp3"
+    assert track_crud._normalize_filename("song.MP3") == "song.MP3"
+    assert track_crud._normalize_filename("song") == "song.mp3"
+
+    track = crud.create_track(db, schemas.TrackCreate(
+        title="Song", duration=180, artist_ids=[artist.id], file_path="song.Mp3"
+    ))
+    assert track.file_path == f"{tmp_path}/song.Mp3"
+
+def test_update_track_replaces_artists(db):
+    """
+    Test sprawdzający zmianę listy artystów utworu przez `update_track`.
+
+    Scenariusz:
+    1. Tworzonych jest trzech artystów i utwór przypisany do dwóch z nich.
+    2. Utwór jest aktualizowany listą artystów [drugi, trzeci, nieistniejące ID].
+    3. Test sprawdza, że utwór ma przypisanych dokładnie drugiego i trzeciego
+       artystę, a nieistniejące ID zostało pominięte.
+
+    Cel:
+    Upewnić się, że synchronizacja tabeli `track_artist` dodaje i usuwa
+    wyłącznie różnicę powiązań.
+    """
+    a1, a2, a3 = (
+        crud.create_artist(db, schemas.ArtistCreate(name=name))
+        for name in ("Artist One", "Artist Two", "Artist Three")
+    )
+    track = crud.create_track(
+        db, schemas.TrackCreate(title="Track1", duration=180, artist_ids=[a1.id, a2.id])
+    )
+
+    updated = crud.update_track(
+        db, track.id, schemas.TrackUpdate(artist_ids=[a2.id, a3.id, 999])
+    )
+
+    assert sorted(a.id for a in updated.artists) == [a2.id, a3.id]
+
+def test_update_track_invalidates_player_snapshot(db):
+    """
+    Test sprawdzający unieważnianie danych utworu zapamiętanych przez odtwarzacz.
+
+    Scenariusz:
+    1. Tworzony jest utwór, a odtwarzacz pobiera (i zapamiętuje) jego dane.
+    2. Tytuł utworu jest zmieniany przez `update_track`.
+    3. Test sprawdza, że odtwarzacz zwraca już nowy tytuł.
+
+    Cel:
+    Upewnić się, że cache danych utworów odtwarzacza nie zwraca
+    nieaktualnych danych po zmianie utworu.
+    """
+    artist = crud.create_artist(db, schemas.ArtistCreate(name="Artist One"))
+    track = crud.create_track(
+        db, schemas.TrackCreate(title="Track1", duration=180, artist_ids=[artist.id])
+    )
+    assert player._get_track_snapshot(track.id).title == "Track1"
+
+    crud.update_track(db, track.id, schemas.TrackUpdate(title="Track2"))
+
+    assert player._get_track_snapshot(track.id).title == "Track2"
+
+def test_get_track_forbids_lazy_loading_in_strict_mode(db, track):
+    """
+    Test sprawdzający tryb STRICT_LOADING (włączony w testach przez conftest).
+
+    Scenariusz:
+    1. Fixture tworzy utwór powiązany z artystą i albumem.
+    2. Sesja jest czyszczona, aby utwór został pobrany ponownie z bazy.
+    3. Utwór pobierany jest przez crud.get_track.
+    4. Test sprawdza, że kolumny są dostępne, a dostęp do relacji
+       `artists` zgłasza wyjątek zamiast leniwego ładowania.
+
+    Cel:
+    Upewnić się, że ukryte zapytania N+1 przy budowie odpowiedzi
+    są wykrywane w testach.
+    """
+    track_id = track.id
+    db.expunge_all()
+
+    fetched = crud.get_track(db, track_id)
+    assert fetched.title == track.title
+    with pytest.raises(InvalidRequestError):
+        _ = fetched.artists
+
+def test_bulk_create_tracks_links_artists(db, artist, album):
+    """
+    Test sprawdzający hurtowe tworzenie utworów.
+
+    Scenariusz:
+    1. Tworzone są dwa utwory przez `bulk_create_tracks` - pierwszy
+       z artystą z fixture `artist`, drugi bez artystów.
+    2. Test sprawdza, że zwrócone ID odpowiadają kolejności wierszy,
+       a powiązania z artystą zostały zapisane tylko dla pierwszego utworu.
+    """
+    track_ids = crud.bulk_create_tracks(db, [
+        {"title": "Bulk1", "duration": 100, "album_id": album.id, "artist_ids": [artist.id]},
+        {"title": "Bulk2", "duration": 200},
+    ])
+    db.commit()
+
+    assert [crud.get_track(db, track_id).title for track_id in track_ids] == ["Bulk1", "Bulk2"]
+    links = db.execute(select(track_artist.c.track_id, track_artist.c.artist_id)).all()
+    assert links == [(track_ids[0], artist.id)]
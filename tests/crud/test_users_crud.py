@@ -1,6 +1,9 @@
 from datetime import date
+import pytest
+from sqlalchemy.exc import IntegrityError
 from pydantic.v1 import EmailStr
 from app import crud, schemas
+from app.models import User
 
 def test_register_and_get_user(db):
     """
@@ -36,7 +39,7 @@ def test_register_and_get_user(db):
     fetched_user = crud.get_user(db, user.id)
     assert fetched_user.login == "testuser"
 
-def test_authenticate_user_success_and_fail(db, client):
+def test_authenticate_user_success_and_fail(db):
     """
     Test integracyjny sprawdzający działanie mechanizmu uwierzytelniania użytkownika.
 
@@ -67,7 +70,7 @@ def test_authenticate_user_success_and_fail(db, client):
     auth_fail = crud.authenticate_user(db, login, "wrongpass")
     assert auth_fail is None
 
-def test_update_and_delete_user(db, client):
+def test_update_and_delete_user(db):
     """
     Test integracyjny sprawdzający aktualizację oraz usuwanie użytkownika.
 
@@ -95,3 +98,52 @@ def test_update_and_delete_user(db, client):
     result = crud.delete_user(db, user.id)
     assert result is True
     assert crud.get_user(db, user.id) is None
+
+def test_user_role_is_checked_by_database(db):
+    """
+    Test sprawdzający przechowywanie roli użytkownika jako tekstu.
+
+    Scenariusz:
+    1. Rejestrowany jest administrator - rola zapisywana jest jako "admin".
+    2. Próba zapisania użytkownika z rolą spoza UserRole kończy się
+       błędem IntegrityError (ograniczenie role_check).
+
+    Cel:
+    Upewnić się, że kolumna `role` przyjmuje wyłącznie wartości UserRole.
+    """
+    admin = crud.register_user(db, schemas.UserRegister(
+        login="admin1",
+        email="admin1@test.pl",
+        password="secret123",
+        birth_date=date(2000, 1, 1),
+        role="admin"
+    ))
+    assert admin.role == "admin"
+
+    db.add(User(
+        login="guest1",
+        email="guest1@test.pl",
+        password="x" * 60,
+        birth_date=date(2000, 1, 1),
+        role="guest"
+    ))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+
+def test_delete_user_removes_owned_playlists(db):
+    """
+    Test sprawdzający usuwanie użytkownika posiadającego playlisty.
+
+    Scenariusz:
+    1. Rejestrowany jest użytkownik i tworzona jest jego playlista.
+    2. Funkcja CRUD `delete_user` usuwa użytkownika.
+    3. Test potwierdza, że playlista użytkownika również została usunięta,
+       a ponowne usunięcie zwraca False.
+    """
+    user = crud.register_user(db, schemas.UserRegister(login="owner", email=EmailStr("owner@test.pl"), password="123456", birth_date=date(2000, 1, 1)))
+    playlist = crud.create_playlist(db, schemas.PlaylistCreate(name="Moja", owner_id=user.id))
+
+    assert crud.delete_user(db, user.id) is True
+    assert crud.get_playlist(db, playlist.id) is None
+    assert crud.delete_user(db, user.id) is False
@@ -0,0 +1,28 @@
+"""
+Fixture pytest wspólne dla testów integracyjnych odtwarzacza WebSocket.
+
+Plik przygotowuje:
+- `ws` - połączenie WebSocket z endpointem `/ws`, z odebranym już
+  pakietem inicjalizacyjnym (testy zaczynają od wysłania komendy).
+
+Połączenie otwierane jest osobno dla każdego testu: endpoint wysyła stan
+odtwarzacza co sekundę niezależnie od komend klienta, więc połączenie
+współdzielone przez wiele testów przekazywałoby kolejnym testom
+nieodebrane komunikaty z poprzednich.
+"""
+import pytest
+
+@pytest.fixture()
+def ws(client):
+    """
+        Otwiera połączenie WebSocket z odtwarzaczem.
+        Mechanizm:
+        - łączy się z endpointem `/ws` współdzielonego TestClient,
+        - odbiera pierwszy pakiet stanu wysyłany po nawiązaniu połączenia,
+        - po zakończeniu testu zamyka połączenie.
+        Zwraca:
+            WebSocketTestSession — połączenie gotowe do wysyłania komend.
+    """
+    with client.websocket_connect("/ws") as w:
+        w.receive_json()
+        yield w
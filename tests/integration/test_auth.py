@@ -35,6 +35,35 @@ def test_register_user(client):
     assert response.json()["login"] == "testuser"
 
 
+def test_register_rejects_taken_login_or_email(client):
+    """
+        Testuje odrzucanie rejestracji z zajętym loginem lub adresem e-mail.
+
+        Scenariusz:
+        1. Rejestrowany jest użytkownik testowy.
+        2. Ponowna rejestracja z tym samym loginem zwraca 400 "Login already registered".
+        3. Rejestracja z nowym loginem i zajętym e-mailem zwraca 400 "Email already registered".
+
+        Cel:
+        Upewnić się, że sprawdzenie loginu i e-maila jednym zapytaniem
+        zwraca komunikat odpowiadający zajętemu polu.
+    """
+    payload = {
+        "login": "takenuser",
+        "email": "taken@test.pl",
+        "password": "secret123",
+        "birth_date": "2001-05-05"
+    }
+    assert client.post("/auth/register", json=payload).status_code == 200
+
+    response = client.post("/auth/register", json={**payload, "email": "other@test.pl"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Login already registered"
+
+    response = client.post("/auth/register", json={**payload, "login": "otheruser"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
 def test_login_and_cookie_set(client):
     """
         Testuje proces logowania oraz ustawianie ciasteczka sesyjnego.
@@ -62,92 +91,65 @@ def test_login_and_cookie_set(client):
     })
 
     assert response.status_code == 200
-    assert "session_id" in response.cookies
+    assert "session_id=" in response.headers.get("set-cookie", "")
 
 
-def test_logout(client):
+def test_logout(user_client):
     """
         Testuje proces wylogowania użytkownika.
 
         Scenariusz:
-        1. Rejestrowany jest użytkownik testowy.
-        2. Użytkownik loguje się, co ustawia ciasteczko sesyjne.
-        3. Wysyłane jest żądanie POST na /auth/logout.
-        4. Oczekiwany status odpowiedzi to 200.
+        1. Klient jest zalogowany jako użytkownik testowy
+           (fixture `user_client` - ustawione ciasteczko sesyjne).
+        2. Wysyłane jest żądanie POST na /auth/logout.
+        3. Oczekiwany status odpowiedzi to 200, a ciasteczko sesyjne
+        zostaje usunięte z klienta.
 
         Cel:
         Zweryfikować, że endpoint wylogowania działa poprawnie
         i nie zwraca błędów przy usuwaniu sesji.
     """
-    client.post("/auth/register", json={
-        "login": "logoutuser",
-        "email": "logout@test.pl",
-        "password": "secret123",
-        "birth_date": "2001-05-05"
-    })
-    client.post("/auth/login", json={
-        "login": "logoutuser",
-        "password": "secret123"
-    })
-
-    response = client.post("/auth/logout")
+    response = user_client.post("/auth/logout")
     assert response.status_code == 200
+    assert "session_id" not in user_client.cookies
 
-def test_get_user(client):
+def test_get_user(client, user):
     """
     Test integracyjny sprawdzający poprawność pobierania danych użytkownika
     na podstawie jego identyfikatora.
 
     Scenariusz:
-    1. Rejestrowany jest nowy użytkownik o loginie "user1".
-    2. Z odpowiedzi rejestracji pobierane jest ID użytkownika.
-    3. Wysyłane jest żądanie GET na endpoint /users/{user_id}.
-    4. Oczekiwany status odpowiedzi to 200.
-    5. Odpowiedź powinna zawierać poprawny login użytkownika.
+    1. Użytkownik testowy jest zapisany w bazie (fixture `user`).
+    2. Wysyłane jest żądanie GET na endpoint /users/{user_id}.
+    3. Oczekiwany status odpowiedzi to 200.
+    4. Odpowiedź powinna zawierać poprawny login użytkownika.
 
     Cel:
     Zweryfikować, że endpoint pobierania użytkownika działa poprawnie
     i zwraca właściwe dane na podstawie ID.
     """
-    reg = client.post("/auth/register", json={
-        "login": "user1",
-        "email": "u1@test.pl",
-        "password": "secret123",
-        "birth_date": "2001-05-05"
-    })
-    user_id = reg.json()["id"]
-
-    response = client.get(f"/users/{user_id}")
+    response = client.get(f"/users/{user.id}")
     assert response.status_code == 200
-    assert response.json()["login"] == "user1"
+    assert response.json()["login"] == user.login
 
 
-def test_update_user(client):
+def test_update_user(client, user):
     """
     Test integracyjny sprawdzający poprawność aktualizacji danych użytkownika.
 
     Scenariusz:
-    1. Rejestrowany jest użytkownik o loginie "user2".
-    2. Z odpowiedzi rejestracji pobierane jest ID użytkownika.
-    3. Wysyłane jest żądanie PATCH na endpoint /users/{user_id}
+    1. Użytkownik testowy jest zapisany w bazie (fixture `user`).
+    2. Wysyłane jest żądanie PATCH na endpoint /users/{user_id}
        z danymi aktualizacyjnymi: first_name i last_name.
-    4. Oczekiwany status odpowiedzi to 200.
-    5. Odpowiedź powinna zawierać zaktualizowane dane użytkownika,
+    3. Oczekiwany status odpowiedzi to 200.
+    4. Odpowiedź powinna zawierać zaktualizowane dane użytkownika,
        w szczególności first_name = "Jan".
 
     Cel:
     Zweryfikować, że endpoint aktualizacji użytkownika działa poprawnie,
     prawidłowo zapisuje zmiany i zwraca zaktualizowany obiekt użytkownika.
     """
-    reg = client.post("/auth/register", json={
-        "login": "user2",
-        "email": "u2@test.pl",
-        "password": "secret123",
-        "birth_date": "2001-05-05"
-    })
-    user_id = reg.json()["id"]
-
-    response = client.patch(f"/users/{user_id}", json={
+    response = client.patch(f"/users/{user.id}", json={
         "first_name": "Jan",
         "last_name": "Kowalski"
     })
@@ -0,0 +1,92 @@
+"""
+Zestaw testów integracyjnych weryfikujących cache odpowiedzi endpointów
+(`app.cache`): unieważnianie list i pojedynczych rekordów po zapisie
+w warstwie CRUD oraz odpowiedzi warunkowe (ETag / If-None-Match, status 304).
+"""
+import app.cache as cache
+from app import crud, schemas
+
+def test_list_endpoint_is_invalidated_after_create(client, db):
+    """
+        Test sprawdzający unieważnianie cache listy po utworzeniu zasobu.
+        Scenariusz:
+        1. Pobranie (i zapamiętanie w cache) pustej listy artystów.
+        2. Utworzenie artysty funkcją CRUD.
+        3. Ponowne pobranie listy artystów przez API.
+        Cel:
+        Zweryfikować, że operacje zapisu w warstwie CRUD unieważniają cache,
+        więc endpoint nie zwraca nieaktualnych danych.
+    """
+    assert client.get("/artists").json() == []
+    crud.create_artist(db, schemas.ArtistCreate(name="Test Artist", country="PL"))
+    assert [a["name"] for a in client.get("/artists").json()] == ["Test Artist"]
+
+def test_list_endpoint_returns_304_for_matching_etag(client, db):
+    """
+        Test sprawdzający warunkowe odpowiedzi listy zasobów (ETag / If-None-Match).
+        Scenariusz:
+        1. Pobranie listy artystów - odpowiedź zawiera nagłówek ETag.
+        2. Ponowne żądanie z tym ETagiem w If-None-Match zwraca 304 bez treści.
+        3. Utworzenie artysty zmienia zawartość listy, więc to samo żądanie
+           zwraca 200 i nowy ETag.
+        Cel:
+        Upewnić się, że klient z aktualną wersją listy nie pobiera jej ponownie,
+        a zmiana danych unieważnia ETag.
+    """
+    first = client.get("/artists")
+    etag = first.headers["ETag"]
+
+    not_modified = client.get("/artists", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    crud.create_artist(db, schemas.ArtistCreate(name="Test Artist", country="PL"))
+    changed = client.get("/artists", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+def test_single_row_endpoints_return_304_for_matching_etag(client, artist, track):
+    """
+        Test sprawdzający warunkowe odpowiedzi pojedynczych rekordów.
+        Scenariusz:
+        1. Pobranie artysty i utworu - odpowiedzi zawierają nagłówek ETag.
+        2. Ponowne żądanie z tym ETagiem w If-None-Match zwraca 304 bez treści.
+        3. Żądanie z innym ETagiem zwraca 200 i pełną treść.
+        Cel:
+        Upewnić się, że GET /artists/{id} i GET /tracks/{id} obsługują
+        rewalidację tak samo jak endpointy list.
+    """
+    for url in (f"/artists/{artist.id}", f"/tracks/{track.id}"):
+        first = client.get(url)
+        etag = first.headers["ETag"]
+
+        not_modified = client.get(url, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+        changed = client.get(url, headers={"If-None-Match": '"other"'})
+        assert changed.status_code == 200
+        assert changed.json() == first.json()
+
+def test_single_artist_is_cached_and_invalidated_after_update(client, db):
+    """
+        Test sprawdzający cache pojedynczego artysty (GET /artists/{id}).
+        Scenariusz:
+        1. Utworzenie artysty i pobranie go przez API - wpis trafia do cache.
+        2. Aktualizacja nazwy artysty funkcją CRUD.
+        3. Ponowne pobranie artysty przez API.
+        4. Usunięcie artysty i ponowne pobranie - odpowiedź 404.
+        Cel:
+        Upewnić się, że zapis i usunięcie unieważniają wpis pojedynczego
+        rekordu, więc endpoint nie zwraca nieaktualnych danych.
+    """
+    artist = crud.create_artist(db, schemas.ArtistCreate(name="Cached Artist", country="PL"))
+
+    assert client.get(f"/artists/{artist.id}").json()["name"] == "Cached Artist"
+    assert cache.get_cached(cache.item_key(cache.ARTIST_PREFIX, artist.id)) is not None
+
+    crud.update_artist(db, artist.id, schemas.ArtistUpdate(name="Renamed Artist"))
+    assert client.get(f"/artists/{artist.id}").json()["name"] == "Renamed Artist"
+
+    crud.delete_artist(db, artist.id)
+    assert client.get(f"/artists/{artist.id}").status_code == 404
@@ -0,0 +1,101 @@
+"""
+Zestaw testów integracyjnych weryfikujących stronicowanie (keyset pagination)
+list zasobów: `GET /artists`, `GET /tracks` oraz `GET /playlists`.
+
+Każdy test wykonywany jest dla wszystkich trzech endpointów i sprawdza
+parametry `limit` i `cursor`, nagłówek `X-Next-Cursor` oraz odrzucanie
+niepoprawnych wartości parametrów.
+"""
+import pytest
+from app import crud, pagination, schemas
+
+LIST_PATHS = ["/artists", "/tracks", "/playlists"]
+
+@pytest.fixture
+def listed_ids(db, user, artist, album):
+    """
+        Tworzy po trzy rekordy każdego stronicowanego zasobu.
+        Zwraca:
+            Słownik ścieżka endpointu -> lista ID rekordów (rosnąco).
+    """
+    artist_ids = [artist.id] + [
+        crud.create_artist(db, schemas.ArtistCreate(name=f"Artist{i}")).id for i in range(2)
+    ]
+    track_ids = crud.bulk_create_tracks(db, [
+        {"title": f"Track{i}", "duration": 5, "album_id": album.id, "artist_ids": [artist.id]}
+        for i in range(3)
+    ])
+    db.commit()
+    playlist_ids = [
+        crud.create_playlist(db, schemas.PlaylistCreate(name=f"Playlist{i}", owner_id=user.id)).id
+        for i in range(3)
+    ]
+    return {"/artists": artist_ids, "/tracks": list(track_ids), "/playlists": playlist_ids}
+
+@pytest.mark.parametrize("path", LIST_PATHS)
+def test_keyset_pagination_follows_next_cursor(client, listed_ids, path):
+    """
+    Test sprawdzający przechodzenie po kolejnych stronach listy.
+
+    Scenariusz:
+    1. `limit=2` zwraca dwa pierwsze rekordy oraz nagłówek X-Next-Cursor
+       z ID ostatniego z nich.
+    2. Żądanie z tym kursorem zwraca pozostały rekord bez nagłówka
+       X-Next-Cursor (ostatnia strona).
+    3. Strona o rozmiarze równym liczbie pozostałych rekordów ma nagłówek
+       X-Next-Cursor, a strona po niej jest pusta i nagłówka nie ma.
+    4. Żądanie bez parametrów nadal zwraca pełną listę.
+    """
+    ids = listed_ids[path]
+
+    first = client.get(path, params={"limit": 2})
+    assert [item["id"] for item in first.json()] == ids[:2]
+    assert first.headers[pagination.NEXT_CURSOR_HEADER] == str(ids[1])
+
+    last = client.get(path, params={"limit": 2, "cursor": first.headers[pagination.NEXT_CURSOR_HEADER]})
+    assert [item["id"] for item in last.json()] == ids[2:]
+    assert pagination.NEXT_CURSOR_HEADER not in last.headers
+
+    full_page = client.get(path, params={"limit": 3})
+    assert full_page.headers[pagination.NEXT_CURSOR_HEADER] == str(ids[2])
+    empty = client.get(path, params={"limit": 3, "cursor": ids[2]})
+    assert empty.json() == []
+    assert pagination.NEXT_CURSOR_HEADER not in empty.headers
+
+    assert [item["id"] for item in client.get(path).json()] == ids
+
+@pytest.mark.parametrize("path", LIST_PATHS)
+def test_cursor_without_limit_uses_default_page_size(client, listed_ids, path):
+    """
+    Test sprawdzający kursor podany bez parametru `limit`.
+
+    Scenariusz:
+    1. Żądanie z samym kursorem (ID pierwszego rekordu) zwraca rekordy
+       o większym ID - strona ma rozmiar DEFAULT_PAGE_SIZE.
+    2. Rekordów jest mniej niż DEFAULT_PAGE_SIZE, więc nagłówka
+       X-Next-Cursor nie ma.
+    """
+    ids = listed_ids[path]
+
+    response = client.get(path, params={"cursor": ids[0]})
+    assert [item["id"] for item in response.json()] == ids[1:]
+    assert pagination.NEXT_CURSOR_HEADER not in response.headers
+
+@pytest.mark.parametrize("path", LIST_PATHS)
+@pytest.mark.parametrize("params", [
+    {"cursor": "abc"},
+    {"cursor": -1},
+    {"limit": 0},
+    {"limit": pagination.MAX_PAGE_SIZE + 1},
+    {"limit": "many"},
+])
+def test_invalid_page_params_are_rejected(client, path, params):
+    """
+    Test sprawdzający walidację parametrów stronicowania.
+
+    Scenariusz:
+    1. Żądanie z niepoprawnym kursorem (nieliczbowym lub ujemnym) albo
+       z limitem spoza zakresu 1..MAX_PAGE_SIZE.
+    2. Odpowiedź ma status 422, a nie pełną listę ani błąd serwera.
+    """
+    assert client.get(path, params=params).status_code == 422
@@ -1,39 +1,54 @@
-def test_create_playlist(client):
+def test_create_playlist_limit_for_regular_user(user_client, user):
     """
-    Test integracyjny sprawdzający poprawne tworzenie playlisty przez użytkownika.
+    Test integracyjny sprawdzający limit playlist zwykłego użytkownika.
 
     Scenariusz:
-    1. Rejestrowany jest użytkownik testowy o loginie "playlistuser".
-    2. Użytkownik loguje się, co powoduje ustawienie ciasteczka sesyjnego.
-    3. Pobierana jest lista użytkowników, aby uzyskać ID nowo utworzonego użytkownika.
-    4. Wysyłane jest żądanie POST na endpoint /playlists z danymi nowej playlisty.
-    5. Oczekiwany status odpowiedzi to 200.
-    6. Odpowiedź powinna zawierać nazwę playlisty "My Playlist".
+    1. Klient jest zalogowany jako testowy użytkownik (fixture `user_client`).
+    2. Użytkownik tworzy 10 playlist - każda operacja kończy się statusem 200.
+    3. Próba utworzenia 11. playlisty kończy się statusem 403.
 
     Cel:
-    Zweryfikować, że:
-    - użytkownik może poprawnie utworzyć playlistę,
-    - endpoint /playlists działa zgodnie z oczekiwaniami,
-    - dane playlisty są poprawnie zwracane w odpowiedzi API.
+    Zweryfikować, że limit 10 playlist jest egzekwowany dokładnie
+    na granicy limitu.
     """
-    client.post("/auth/register", json={
-        "login": "playlistuser",
-        "email": "p@test.pl",
-        "password": "secret123",
-        "birth_date": "2001-05-05"
-    })
-    client.post("/auth/login", json={
-        "login": "playlistuser",
-        "password": "secret123"
-    })
-
-    user = client.get("/users").json()[0]
-    user_id = user["id"]
-
-    response = client.post("/playlists", json={
-        "name": "My Playlist",
-        "owner_id": user_id
-    })
-
-    assert response.status_code == 200
-    assert response.json()["name"] == "My Playlist"
+    for i in range(10):
+        response = user_client.post("/playlists", json={"name": f"Playlist {i}", "owner_id": user.id})
+        assert response.status_code == 200
+
+    response = user_client.post("/playlists", json={"name": "One too many", "owner_id": user.id})
+    assert response.status_code == 403
+
+def test_modify_playlist_requires_owner(client):
+    """
+    Test integracyjny sprawdzający uprawnienia do modyfikacji playlisty.
+
+    Scenariusz:
+    1. Pierwszy użytkownik tworzy playlistę.
+    2. Drugi użytkownik loguje się i próbuje zmienić nazwę oraz usunąć
+       cudzą playlistę - oba żądania kończą się statusem 403.
+    3. Żądania dotyczące nieistniejącej playlisty kończą się statusem 404.
+    4. Właściciel może zmienić nazwę i usunąć swoją playlistę.
+    """
+    for login in ("owneruser", "otheruser"):
+        client.post("/auth/register", json={
+            "login": login,
+            "email": f"{login}@test.pl",
+            "password": "secret123",
+            "birth_date": "2001-05-05"
+        })
+
+    client.post("/auth/login", json={"login": "owneruser", "password": "secret123"})
+    owner_id = next(u["id"] for u in client.get("/users").json() if u["login"] == "owneruser")
+    playlist_id = client.post("/playlists", json={"name": "Mine", "owner_id": owner_id}).json()["id"]
+
+    client.post("/auth/login", json={"login": "otheruser", "password": "secret123"})
+    assert client.patch(f"/playlists/{playlist_id}", json={"name": "Stolen", "owner_id": owner_id}).status_code == 403
+    response = client.delete(f"/playlists/{playlist_id}")
+    assert response.status_code == 403
+    assert response.json()["detail"] == "You are not allowed to delete this playlist"
+    assert client.delete("/playlists/999").status_code == 404
+
+    client.post("/auth/login", json={"login": "owneruser", "password": "secret123"})
+    response = client.patch(f"/playlists/{playlist_id}", json={"name": "Renamed", "owner_id": owner_id})
+    assert response.json()["name"] == "Renamed"
+    assert client.delete(f"/playlists/{playlist_id}").status_code == 200
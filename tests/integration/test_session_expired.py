@@ -1,18 +1,19 @@
-def test_cannot_create_playlist_after_session_expired(client):
+def test_cannot_create_playlist_after_session_expired(user_client, user):
     """
     Test integracyjny sprawdzający, czy użytkownik nie może tworzyć playlist
     po wygaśnięciu sesji (braku ciasteczka `session_id`).
 
     Scenariusz:
-    1. Rejestrowany jest użytkownik testowy.
-    2. Użytkownik loguje się, co ustawia ciasteczko sesyjne.
-    3. Użytkownik tworzy pierwszą playlistę — operacja powinna się powieść.
-    4. Ciasteczka klienta są ręcznie czyszczone, co symuluje wygaśnięcie sesji.
-    5. Użytkownik próbuje ponownie utworzyć playlistę.
-    6. Oczekiwany status odpowiedzi to 401 (brak autoryzacji) lub 403 (brak uprawnień).
+    1. Klient jest zalogowany jako testowy użytkownik (fixture `user_client`).
+    2. Użytkownik tworzy pierwszą playlistę — operacja powinna się powieść,
+       a odpowiedź zawierać nazwę playlisty "My playlist".
+    3. Ciasteczka klienta są ręcznie czyszczone, co symuluje wygaśnięcie sesji.
+    4. Użytkownik próbuje ponownie utworzyć playlistę.
+    5. Oczekiwany status odpowiedzi to 401 (brak autoryzacji) lub 403 (brak uprawnień).
 
     Cel:
     Zweryfikować, że:
+    - zalogowany użytkownik może poprawnie utworzyć playlistę,
     - mechanizm sesji działa poprawnie,
     - endpoint /playlists wymaga aktywnej sesji użytkownika,
     - po utracie ciasteczka sesyjnego użytkownik nie może wykonywać operacji,
@@ -20,32 +21,18 @@ def test_cannot_create_playlist_after_session_expired(client):
 
     Test potwierdza poprawność zabezpieczeń związanych z autoryzacją i sesjami.
     """
-    register_resp = client.post("/auth/register", json={
-        "login": "sessionuser",
-        "email": "session@test.pl",
-        "password": "secret123",
-        "birth_date": "2001-05-05"
-    })
-    assert register_resp.status_code == 200
-    user_id = register_resp.json()["id"]
-
-    login_resp = client.post("/auth/login", json={
-        "login": "sessionuser",
-        "password": "secret123"
-    })
-    assert login_resp.status_code == 200
-
-    ok_resp = client.post("/playlists", json={
+    ok_resp = user_client.post("/playlists", json={
         "name": "My playlist",
-        "owner_id": user_id
+        "owner_id": user.id
     })
     assert ok_resp.status_code == 200
+    assert ok_resp.json()["name"] == "My playlist"
 
-    client.cookies.clear()
+    user_client.cookies.clear()
 
-    forbidden_resp = client.post("/playlists", json={
+    forbidden_resp = user_client.post("/playlists", json={
         "name": "Should not work",
-        "owner_id": user_id
+        "owner_id": user.id
     })
 
     assert forbidden_resp.status_code in (401, 403)
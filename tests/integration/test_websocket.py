@@ -4,8 +4,9 @@ odtwarzacza muzyki (`player`). Testy symulują pełny cykl pracy odtwarzacza:
 kolejkowanie utworów, odtwarzanie, pauzowanie, przewijanie, pętle,
 obsługę playlist i albumów oraz automatyczne przełączanie utworów.
 
-Każdy test otwiera połączenie WebSocket z endpointem `/ws` i komunikuje się
-z odtwarzaczem poprzez wysyłanie komend JSON. Odtwarzacz zwraca cykliczne
+Każdy test otrzymuje połączenie WebSocket z endpointem `/ws` (fixture `ws`
+z `tests/integration/conftest.py`) i komunikuje się z odtwarzaczem poprzez
+wysyłanie komend JSON. Odtwarzacz zwraca cykliczne
 aktualizacje stanu, które są odbierane i analizowane w testach.
 
 Testy obejmują:
@@ -17,8 +18,10 @@ Testy obejmują:
 - obsługę playlist i albumów,
 - pauzowanie i wznawianie,
 - pomijanie utworów (skip),
-- przełączanie między utworami i listami.
+- przełączanie między utworami i listami,
+- liczbę zapytań SQL przy wyborze playlisty i albumu.
 """
+import threading
 from app import player
 
 def test_websocket_player(client):
@@ -41,7 +44,17 @@ def ws_recv(ws):
     """
     return ws.receive_json()
 
-def test_initial_state_no_loop(client):
+def fast_forward(ws, seconds):
+    """
+    Helper: przewija odtwarzacz o podaną liczbę sekund i odbiera stan.
+    Po wysłaniu stanu pętla endpointu czeka 1 sekundę, więc
+    player.fast_forward przewija odtwarzacz między jej krokami, a ostatnią
+    sekundę wykonuje tick() kolejnego kroku pętli.
+    """
+    player.fast_forward(seconds - 1)
+    return ws_recv(ws)
+
+def test_initial_state_no_loop(ws):
     """
     Test sprawdzający stan początkowy odtwarzacza.
 
@@ -54,25 +67,24 @@ def test_initial_state_no_loop(client):
     Zweryfikować, że odtwarzacz nie pozwala na aktywację pętli,
     gdy nie odtwarza żadnego utworu.
     """
-    with client.websocket_connect("/ws") as ws:
-        data = ws_recv(ws)
-        assert data["status"] == "STOPPED"
+    data = ws_recv(ws)
+    assert data["status"] == "STOPPED"
 
-        ws.send_json({"command": "loop_track", "payload": True})
-        data = ws_recv(ws)
-        assert data["loop_track"] is False
+    ws.send_json({"command": "loop_track", "payload": True})
+    data = ws_recv(ws)
+    assert data["loop_track"] is False
 
-        ws.send_json({"command": "loop_playlist", "payload": True})
-        data = ws_recv(ws)
-        assert data["loop_playlist"] is False
+    ws.send_json({"command": "loop_playlist", "payload": True})
+    data = ws_recv(ws)
+    assert data["loop_playlist"] is False
 
-def test_add_track_starts_playback(client, track):
+def test_add_track_starts_playback(track, ws):
     """
     Test sprawdzający, czy dodanie utworu do kolejki automatycznie
     rozpoczyna odtwarzanie.
 
     Scenariusz:
-    1. Reset odtwarzacza.
+    1. Reset odtwarzacza (fixture `_reset_player`).
     2. Dodanie utworu do kolejki.
     3. Odtwarzacz powinien przejść w stan PLAYING.
     4. Powinien zwrócić tytuł utworu oraz elapsed = 1.
@@ -81,43 +93,68 @@ def test_add_track_starts_playback(client, track):
     Zweryfikować, że kolejka działa poprawnie i automatycznie
     uruchamia odtwarzanie.
     """
-    player.reset()
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
+    ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
+    data = ws_recv(ws)
 
-        ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
-        data = ws_recv(ws)
+    assert data["status"] == "PLAYING"
+    assert data["track"] == track.title
+    assert data["elapsed"] == 1
 
-        assert data["status"] == "PLAYING"
-        assert data["track"] == track.title
-        assert data["elapsed"] == 1
+def test_queue_add_changes_state_on_loop_thread(monkeypatch, track, ws):
+    """
+    Test sprawdzający, w którym wątku zmieniany jest stan odtwarzacza.
 
-def test_tick_until_end_stops(client, track):
+    Scenariusz:
+    1. Funkcje player.enqueue i player.tick zapisują identyfikator wątku,
+       w którym zostały wywołane.
+    2. Dodanie utworu do kolejki.
+    3. Kolejka została zmieniona w tym samym wątku, w którym wykonywany
+       jest tick() (wątek pętli zdarzeń).
+
+    Cel:
+    Upewnić się, że w puli wątków wykonywany jest tylko odczyt z bazy,
+    a współdzielony stan odtwarzacza zmieniany jest w pętli zdarzeń.
+    """
+    threads = {}
+    enqueue, tick = player.enqueue, player.tick
+
+    def recording(name, func):
+        def wrapper(*args, **kwargs):
+            threads[name] = threading.get_ident()
+            return func(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(player, "enqueue", recording("enqueue", enqueue))
+    monkeypatch.setattr(player, "tick", recording("tick", tick))
+
+    ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
+    data = ws_recv(ws)
+
+    assert data["track"] == track.title
+    assert threads["enqueue"] == threads["tick"]
+
+def test_tick_until_end_stops(track, ws):
     """
     Test sprawdzający, czy odtwarzacz odlicza czas aż do końca utworu,
     a następnie przechodzi w stan STOPPED.
 
     Scenariusz:
     1. Dodanie utworu do kolejki.
-    2. Odbieranie kolejnych ticków aż do przekroczenia czasu trwania utworu.
+    2. Przewinięcie odtwarzacza (player.fast_forward) poza czas trwania utworu.
     3. Odtwarzacz powinien zatrzymać się i wyczyścić aktualny utwór.
 
     Cel:
     Zweryfikować poprawność mechanizmu tick() oraz zakończenia odtwarzania.
     """
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
+    ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
+    ws_recv(ws)
 
-        ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
-        ws_recv(ws)
+    data = fast_forward(ws, track.duration + 1)
 
-        for _ in range(track.duration + 1):
-            data = ws_recv(ws)
+    assert data["status"] == "STOPPED"
+    assert data["track"] is None
 
-        assert data["status"] == "STOPPED"
-        assert data["track"] is None
-
-def test_loop_track(client, track):
+def test_loop_track(track, ws):
     """
     Test sprawdzający działanie pętli pojedynczego utworu (loop_track).
 
@@ -130,22 +167,18 @@ def test_loop_track(client, track):
     Cel:
     Zweryfikować, że loop_track działa poprawnie i restartuje utwór.
     """
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
+    ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
+    ws_recv(ws)
 
-        ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
-        ws_recv(ws)
+    ws.send_json({"command": "loop_track", "payload": True})
+    ws_recv(ws)
 
-        ws.send_json({"command": "loop_track", "payload": True})
-        ws_recv(ws)
+    data = fast_forward(ws, track.duration - 2)
 
-        for _ in range(track.duration - 2):
-            data = ws_recv(ws)
+    assert data["track"] == track.title
+    assert data["elapsed"] == 0
 
-        assert data["track"] == track.title
-        assert data["elapsed"] == 0
-
-def test_two_tracks_queue(client, track, track2):
+def test_two_tracks_queue(track, track2, ws):
     """
     Test sprawdzający przełączanie między utworami w kolejce.
 
@@ -157,21 +190,17 @@ def test_two_tracks_queue(client, track, track2):
     Cel:
     Zweryfikować poprawność obsługi kolejki wielu utworów.
     """
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
-
-        ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
-        ws_recv(ws)
+    ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
+    ws_recv(ws)
 
-        ws.send_json({"command": "queue_add", "payload": {"track": track2.id}})
-        ws_recv(ws)
+    ws.send_json({"command": "queue_add", "payload": {"track": track2.id}})
+    ws_recv(ws)
 
-        for _ in range(track.duration + 1):
-            data = ws_recv(ws)
+    data = fast_forward(ws, track.duration + 1)
 
-        assert data["track"] == track2.title
+    assert data["track"] == track2.title
 
-def test_playlist_loop(client, playlist):
+def test_playlist_loop(playlist, ws):
     """
     Test sprawdzający odtwarzanie playlisty z włączoną pętlą.
 
@@ -184,24 +213,19 @@ def test_playlist_loop(client, playlist):
     Zweryfikować, że playlista działa jak kolejka oraz że pętla playlisty
     działa poprawnie.
     """
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
-
-        ws.send_json({
-            "command": "playlist_select_id",
-            "payload": {"id": playlist.id, "loop": True}
-        })
-        data = ws_recv(ws)
+    ws.send_json({
+        "command": "playlist_select_id",
+        "payload": {"id": playlist.id, "loop": True}
+    })
+    data = ws_recv(ws)
 
-        first = playlist.tracks[0].title
+    first = playlist.tracks[0].title
 
-        for t in playlist.tracks:
-            for _ in range(t.duration):
-                data = ws_recv(ws)
+    data = fast_forward(ws, sum(t.duration for t in playlist.tracks))
 
-        assert data["track"] == first
+    assert data["track"] == first
 
-def test_pause_and_resume(client, track):
+def test_pause_and_resume(track, ws):
     """
     Test sprawdzający działanie pauzy i wznawiania odtwarzania.
 
@@ -215,29 +239,26 @@ def test_pause_and_resume(client, track):
     Cel:
     Zweryfikować poprawność mechanizmu pauzy i wznowienia.
     """
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
-
-        ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
-        ws_recv(ws)
+    ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
+    ws_recv(ws)
 
-        ws.send_json({"command": "pause"})
-        data = ws_recv(ws)
-        assert data["status"] == "PAUSED"
+    ws.send_json({"command": "pause"})
+    data = ws_recv(ws)
+    assert data["status"] == "PAUSED"
 
-        elapsed_before = data["elapsed"]
+    elapsed_before = data["elapsed"]
 
-        data = ws_recv(ws)
-        assert data["elapsed"] == elapsed_before
+    data = ws_recv(ws)
+    assert data["elapsed"] == elapsed_before
 
-        ws.send_json({"command": "play"})
-        data = ws_recv(ws)
-        assert data["status"] == "PLAYING"
+    ws.send_json({"command": "play"})
+    data = ws_recv(ws)
+    assert data["status"] == "PLAYING"
 
-        data = ws_recv(ws)
-        assert data["elapsed"] == elapsed_before + 2
+    data = ws_recv(ws)
+    assert data["elapsed"] == elapsed_before + 2
 
-def test_skip(client, track, track2):
+def test_skip(track, track2, ws):
     """
     Test sprawdzający działanie komendy "skip".
 
@@ -249,21 +270,18 @@ def test_skip(client, track, track2):
     Cel:
     Zweryfikować poprawność pomijania utworów.
     """
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
-
-        ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
-        ws_recv(ws)
+    ws.send_json({"command": "queue_add", "payload": {"track": track.id}})
+    ws_recv(ws)
 
-        ws.send_json({"command": "queue_add", "payload": {"track": track2.id}})
-        ws_recv(ws)
+    ws.send_json({"command": "queue_add", "payload": {"track": track2.id}})
+    ws_recv(ws)
 
-        ws.send_json({"command": "skip"})
-        data = ws_recv(ws)
+    ws.send_json({"command": "skip"})
+    data = ws_recv(ws)
 
-        assert data["track"] == track2.title
+    assert data["track"] == track2.title
 
-def test_album_selection(client, album, track, track2):
+def test_album_selection(album, track, track2, ws):
     """
     Test sprawdzający odtwarzanie albumu po ID.
 
@@ -275,24 +293,19 @@ def test_album_selection(client, album, track, track2):
     Cel:
     Zweryfikować, że album działa jak playlista bez pętli.
     """
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
-
-        ws.send_json({
-            "command": "album_select_id",
-            "payload": {"id": album.id, "loop": False}
-        })
-        data = ws_recv(ws)
+    ws.send_json({
+        "command": "album_select_id",
+        "payload": {"id": album.id, "loop": False}
+    })
+    data = ws_recv(ws)
 
-        assert data["track"] == album.tracks[0].title
+    assert data["track"] == album.tracks[0].title
 
-        for t in album.tracks:
-            for _ in range(t.duration):
-                data = ws_recv(ws)
+    data = fast_forward(ws, sum(t.duration for t in album.tracks))
 
-        assert data["status"] == "STOPPED"
+    assert data["status"] == "STOPPED"
 
-def test_album_loop(client, album, track, track2):
+def test_album_loop(album, track, track2, ws):
     """
     Test sprawdzający odtwarzanie albumu w pętli.
 
@@ -304,19 +317,36 @@ def test_album_loop(client, album, track, track2):
     Cel:
     Zweryfikować poprawność pętli albumu.
     """
-    with client.websocket_connect("/ws") as ws:
-        ws_recv(ws)
+    ws.send_json({
+        "command": "album_select_id",
+        "payload": {"id": album.id, "loop": True}
+    })
+    data = ws_recv(ws)
 
-        ws.send_json({
-            "command": "album_select_id",
-            "payload": {"id": album.id, "loop": True}
-        })
-        data = ws_recv(ws)
+    first = album.tracks[0].title
 
-        first = album.tracks[0].title
+    data = fast_forward(ws, sum(t.duration for t in album.tracks))
 
-        for t in album.tracks:
-            for _ in range(t.duration):
-                data = ws_recv(ws)
+    assert data["track"] == first
+
+def test_select_playlist_and_album_query_count(playlist, album, count_queries):
+    """
+    Test sprawdzający liczbę zapytań SQL przy wyborze playlisty i albumu.
 
-        assert data["track"] == first
\ No newline at end of file
+    Scenariusz:
+    1. Zapytania SQL są zliczane przez fixture `count_queries`.
+    2. Wybierana jest playlista po ID, a następnie album po ID.
+    3. Dla każdej operacji test sprawdza, że wykonano dokładnie dwa zapytania
+       (rekord oraz jego utwory ładowane przez selectinload).
+
+    Cel:
+    Upewnić się, że wybór playlisty/albumu nie generuje osobnych zapytań
+    dla każdego utworu.
+    """
+    playlist_id, album_id = playlist.id, album.id
+    with count_queries() as statements:
+        assert player.select_playlist_by_id(playlist_id) is not None
+        assert len(statements) == 2
+        statements.clear()
+        assert player.select_album_by_id(album_id) is not None
+        assert len(statements) == 2
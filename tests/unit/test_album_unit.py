@@ -36,5 +36,4 @@ def test_album_add_track():
     album = Album(id=1, title="A")
     track = Track(id=1, title="T", duration=100)
     album.tracks.append(track)
-    assert len(album.tracks) == 1
-    assert album.tracks[0].title == "T"
+    assert album.tracks == [track]
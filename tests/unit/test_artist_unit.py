@@ -3,36 +3,31 @@ Testy jednostkowe modelu Artist.
 Sprawdzają poprawność tworzenia obiektu, aktualizacji pól
 oraz reprezentacji tekstowej.
 """
+import pytest
 from app.models import Artist, Track
 
-def test_artist_creation():
+@pytest.mark.parametrize("initial,updated", [
+    ("Artist1", None),
+    ("Old", "New"),
+])
+def test_artist_fields(initial, updated):
     """
-        Test sprawdzający poprawność tworzenia obiektu Artist.
+        Test sprawdzający tworzenie obiektu Artist i aktualizację jego pól.
         Scenariusz:
-        1. Utworzenie artysty z przykładowymi danymi (id, name, country).
+        1. Utworzenie artysty z nazwą `initial` i krajem "PL".
         2. Weryfikacja, że pola name oraz country zostały poprawnie zapisane.
+        3. Jeśli podano `updated` - zmiana nazwy i weryfikacja nowej wartości.
         Cel:
-        Upewnić się, że model Artist poprawnie przechowuje dane podstawowe
-        przekazane podczas inicjalizacji.
+        Upewnić się, że model Artist poprawnie przechowuje dane przekazane
+        podczas inicjalizacji i pozwala na ich modyfikację.
     """
-    artist = Artist(id=1, name="Artist1", country="PL")
-    assert artist.name == "Artist1"
+    artist = Artist(id=1, name=initial, country="PL")
+    assert artist.name == initial
     assert artist.country == "PL"
 
-def test_artist_update_fields():
-    """
-        Test sprawdzający możliwość aktualizacji pól obiektu Artist.
-        Scenariusz:
-        1. Utworzenie artysty z nazwą "Old".
-        2. Zmiana nazwy artysty na "New".
-        3. Weryfikacja, że pole name zostało poprawnie zaktualizowane.
-        Cel:
-        Zweryfikować, że obiekt Artist pozwala na modyfikację swoich pól
-        po utworzeniu instancji.
-    """
-    artist = Artist(id=1, name="Old", country="PL")
-    artist.name = "New"
-    assert artist.name == "New"
+    if updated is not None:
+        artist.name = updated
+        assert artist.name == updated
 
 def test_track_remove_artist():
     """
@@ -56,5 +51,4 @@ def test_track_remove_artist():
 
     track.artists.remove(a1)
 
-    assert len(track.artists) == 1
-    assert track.artists[0].name == "A2"
+    assert track.artists == [a2]
@@ -0,0 +1,132 @@
+"""
+Testy jednostkowe modułu cache (`app.cache`).
+Sprawdzają zapis i odczyt wpisów, wygasanie wpisów po upływie TTL,
+unieważnianie kluczy oraz budowę odpowiedzi z wpisu cache. Testy
+endpointów korzystających z cache znajdują się w
+`tests/integration/test_cache.py`.
+"""
+import app.cache as cache
+
+def test_set_and_get_cached():
+    """
+        Test sprawdzający zapis i odczyt wartości z cache.
+        Scenariusz:
+        1. Wyczyszczenie cache.
+        2. Zapisanie listy pod kluczem ALBUMS_KEY.
+        3. Weryfikacja, że odczyt zwraca tę samą wartość.
+        Cel:
+        Upewnić się, że cache zwraca zapamiętaną wartość przed upływem TTL.
+    """
+    cache.clear()
+    cache.set_cached(cache.ALBUMS_KEY, [{"id": 1}])
+    assert cache.get_cached(cache.ALBUMS_KEY) == [{"id": 1}]
+
+def test_expired_entry_is_removed(monkeypatch):
+    """
+        Test sprawdzający wygasanie wpisów.
+        Scenariusz:
+        1. Ustawienie CACHE_TTL na wartość ujemną.
+        2. Zapisanie wartości w cache.
+        3. Weryfikacja, że odczyt zwraca None, a wpis został usunięty.
+        Cel:
+        Zweryfikować, że wygasłe wpisy nie są zwracane i są usuwane z pamięci.
+    """
+    cache.clear()
+    monkeypatch.setattr(cache, "CACHE_TTL", -1)
+    cache.set_cached(cache.TRACKS_KEY, [])
+    assert cache.get_cached(cache.TRACKS_KEY) is None
+    assert cache.TRACKS_KEY not in cache._cache
+
+def test_invalidate_removes_only_given_keys():
+    """
+        Test sprawdzający unieważnianie wybranych kluczy.
+        Scenariusz:
+        1. Zapisanie wartości pod dwoma kluczami.
+        2. Unieważnienie jednego z nich.
+        3. Weryfikacja, że drugi wpis pozostał w cache.
+        Cel:
+        Upewnić się, że invalidate() usuwa wyłącznie wskazane wpisy.
+    """
+    cache.clear()
+    cache.set_cached(cache.ARTISTS_KEY, [])
+    cache.set_cached(cache.PLAYLISTS_KEY, [])
+    cache.invalidate(cache.ARTISTS_KEY)
+    assert cache.get_cached(cache.ARTISTS_KEY) is None
+    assert cache.get_cached(cache.PLAYLISTS_KEY) == []
+
+def test_invalidate_prefix_removes_only_matching_keys():
+    """
+        Test sprawdzający unieważnianie wpisów po prefiksie klucza.
+        Scenariusz:
+        1. Zapisanie dwóch pojedynczych utworów, artysty i listy utworów.
+        2. Unieważnienie prefiksu TRACK_PREFIX.
+        3. Weryfikacja, że usunięte zostały tylko wpisy utworów.
+        Cel:
+        Upewnić się, że invalidate_prefix() nie usuwa wpisów innych zasobów.
+    """
+    cache.clear()
+    for track_id in (1, 2):
+        cache.set_cached(cache.item_key(cache.TRACK_PREFIX, track_id), {"id": track_id})
+    cache.set_cached(cache.item_key(cache.ARTIST_PREFIX, 1), {"id": 1})
+    cache.set_cached(cache.TRACKS_KEY, [])
+
+    cache.invalidate_prefix(cache.TRACK_PREFIX)
+
+    assert sorted(cache._cache) == [cache.item_key(cache.ARTIST_PREFIX, 1), cache.TRACKS_KEY]
+
+def test_redis_backend_shares_entries_and_invalidation(monkeypatch, fake_redis):
+    """
+        Test sprawdzający przechowywanie cache w Redisie.
+        Scenariusz:
+        1. Podmiana klienta `_redis` na atrapę i zapisanie listy, dwóch
+           utworów oraz artysty.
+        2. Weryfikacja klucza `cache:<klucz>` z TTL i odczytu wpisu (wartość,
+           ETag, treść) bez użycia słownika w pamięci.
+        3. Unieważnienie klucza, prefiksu TRACK_PREFIX i wyczyszczenie cache.
+        Cel:
+        Zweryfikować gałąź CACHE_REDIS_URL - unieważnienie w jednym procesie
+        usuwa wpis widoczny dla wszystkich procesów.
+    """
+    monkeypatch.setattr(cache, "_redis", fake_redis)
+    monkeypatch.setattr(cache, "_cache", {})
+
+    entry = cache.set_cached(cache.ALBUMS_KEY, [{"id": 1, "title": "Żółć"}])
+    for track_id in (1, 2):
+        cache.set_cached(cache.item_key(cache.TRACK_PREFIX, track_id), {"id": track_id})
+    cache.set_cached(cache.item_key(cache.ARTIST_PREFIX, 1), {"id": 1})
+
+    assert fake_redis.data["cache:albums:all"][1] == cache.CACHE_TTL
+    assert cache.get_entry(cache.ALBUMS_KEY) == entry
+    assert cache._cache == {}
+
+    cache.invalidate(cache.ALBUMS_KEY)
+    assert cache.get_entry(cache.ALBUMS_KEY) is None
+
+    cache.invalidate_prefix(cache.TRACK_PREFIX)
+    assert sorted(fake_redis.data) == ["cache:artist:1"]
+
+    cache.clear()
+    assert fake_redis.data == {}
+
+def test_to_response_sends_encoded_body():
+    """
+        Test sprawdzający budowę odpowiedzi z wpisu cache.
+        Scenariusz:
+        1. Zapisanie listy zawierającej znaki spoza ASCII.
+        2. Odpowiedź zawiera zapamiętaną treść JSON, typ application/json i ETag.
+        3. Dla pasującego If-None-Match zwracana jest odpowiedź 304 bez treści.
+        Cel:
+        Upewnić się, że wpis jest kodowany do JSON raz, przy zapisie,
+        a odpowiedzi korzystają z gotowej treści.
+    """
+    cache.clear()
+    entry = cache.set_cached(cache.ALBUMS_KEY, [{"id": 1, "title": "Żółć"}])
+
+    response = cache.to_response(entry)
+    assert response.body == '[{"id":1,"title":"Żółć"}]'.encode()
+    assert response.media_type == "application/json"
+    assert response.headers["ETag"] == entry.etag
+
+    not_modified = cache.to_response(entry, entry.etag)
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
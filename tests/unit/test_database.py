@@ -0,0 +1,47 @@
+"""
+Testy jednostkowe modułu bazy danych (`app.database`).
+Sprawdzają uzupełnianie schematu bazy utworzonej przez starszą wersję
+aplikacji (tabele asocjacyjne bez klucza głównego, brak indeksów).
+"""
+from sqlalchemy import create_engine, inspect, text
+from app.crud.playlist import _PLAYLIST_TRACK_INSERT_IGNORE
+from app.database import Base, upgrade_schema
+
+def test_upgrade_schema_keys_legacy_association_tables():
+    """
+        Test sprawdzający przebudowę tabel asocjacyjnych starej bazy.
+        Scenariusz:
+        1. Utworzenie tabel `playlist_track` i `track_artist` bez klucza
+           głównego (jak w pierwotnym schemacie), z powtórzonym powiązaniem.
+        2. Utworzenie pozostałych tabel i wywołanie upgrade_schema.
+        3. Weryfikacja złożonych kluczy głównych, indeksów oraz usunięcia
+           duplikatu przy zachowaniu pozostałych powiązań.
+        4. Wstawienie powiązań przez INSERT ... ON CONFLICT DO NOTHING.
+        Cel:
+        Upewnić się, że dodawanie utworu do playlisty działa na bazie
+        utworzonej przed wprowadzeniem kluczy głównych.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE playlist_track (playlist_id INTEGER, track_id INTEGER)")
+        connection.exec_driver_sql("CREATE TABLE track_artist (track_id INTEGER, artist_id INTEGER)")
+        connection.exec_driver_sql("INSERT INTO playlist_track VALUES (1, 2), (1, 2), (1, 3)")
+        connection.exec_driver_sql("INSERT INTO track_artist VALUES (2, 1)")
+        Base.metadata.create_all(bind=connection)
+
+        upgrade_schema(connection)
+        upgrade_schema(connection)
+
+        inspector = inspect(connection)
+        assert inspector.get_pk_constraint("playlist_track")["constrained_columns"] == ["playlist_id", "track_id"]
+        assert inspector.get_pk_constraint("track_artist")["constrained_columns"] == ["track_id", "artist_id"]
+        assert "ix_playlist_track_track_id" in {i["name"] for i in inspector.get_indexes("playlist_track")}
+        assert "ix_tracks_album_id" in {i["name"] for i in inspector.get_indexes("tracks")}
+
+        connection.execute(_PLAYLIST_TRACK_INSERT_IGNORE, [
+            {"playlist_id": 1, "track_id": 2},
+            {"playlist_id": 1, "track_id": 5},
+        ])
+        rows = connection.execute(text("SELECT playlist_id, track_id FROM playlist_track ORDER BY track_id")).all()
+        assert rows == [(1, 2), (1, 3), (1, 5)]
+        assert connection.execute(text("SELECT * FROM track_artist")).all() == [(2, 1)]
@@ -1,6 +1,6 @@
 """
 Zestaw testów jednostkowych weryfikujących logikę modułu odtwarzacza audio
-(`player`), który działa w oparciu o globalny stan. Testy sprawdzają
+(`player`), który przechowuje stan w obiekcie `player.state`. Testy sprawdzają
 podstawowe operacje na stanie odtwarzacza, takie jak resetowanie,
 sprawdzanie stanu STOPPED, obsługę flag zapętlania, pauzowanie oraz
 uruchamianie odtwarzania z kolejki.
@@ -15,7 +15,10 @@ Testy obejmują:
 
 Celem testów jest potwierdzenie, że logika zarządzania stanem działa
 poprawnie w izolacji, bez udziału WebSocketów, FastAPI ani bazy danych.
+Stan odtwarzacza resetowany jest przed i po każdym teście przez fixture
+`_reset_player` z `tests/conftest.py`.
 """
+import pytest
 import app.player as player
 from app.models import Track
 
@@ -24,7 +27,7 @@ def test_reset_clears_state():
         Test sprawdzający, czy funkcja reset() poprawnie czyści cały stan
         odtwarzacza.
         Scenariusz:
-        1. Ustawienie przykładowych wartości globalnych (kolejka, current,
+        1. Ustawienie przykładowych wartości stanu (kolejka, current,
            elapsed, tryby loop, tryb playlisty, pauza).
         2. Wywołanie reset().
         3. Weryfikacja, że wszystkie pola wróciły do wartości początkowych.
@@ -32,48 +35,41 @@ def test_reset_clears_state():
         Upewnić się, że reset() przywraca odtwarzacz do stanu początkowego.
     """
     dummy_track = Track(id=1, title="track1", duration=180)
-    player.queue.append(dummy_track)
-    player.current = "track"
-    player.elapsed = 42
-    player.loop_track = True
-    player.loop_playlist = True
-    player.playlist_mode = True
-    player.playlist_tracks = ["t1", "t2"]
-    player.playlist_index = 1
-    player.is_paused = True
+    player.state.queue.append(dummy_track)
+    player.state.current = "track"
+    player.state.elapsed = 42
+    player.state.loop_track = True
+    player.state.loop_playlist = True
+    player.state.playlist_mode = True
+    player.state.playlist_tracks = ["t1", "t2"]
+    player.state.playlist_index = 1
+    player.state.is_paused = True
 
     player.reset()
 
-    assert list(player.queue) == []
-    assert player.current is None
-    assert player.elapsed == 0
-    assert player.loop_track is False
-    assert player.loop_playlist is False
-    assert player.playlist_mode is False
-    assert player.playlist_tracks == []
-    assert player.playlist_index == 0
-    assert player.is_paused is False
+    assert list(player.state.queue) == []
+    assert player.state.current is None
+    assert player.state.elapsed == 0
+    assert player.state.loop_track is False
+    assert player.state.loop_playlist is False
+    assert player.state.playlist_mode is False
+    assert player.state.playlist_tracks == []
+    assert player.state.playlist_index == 0
+    assert player.state.is_paused is False
 
-def test_is_stopped_true_when_no_track():
+@pytest.mark.parametrize("current,expected", [
+    (None, True),
+    ("track", False),
+])
+def test_is_stopped(current, expected):
     """
-        Test sprawdzający, że is_stopped() zwraca True, gdy nie ma
-        aktualnie odtwarzanego utworu.
+        Test sprawdzający, że is_stopped() zwraca True wyłącznie wtedy,
+        gdy nie ma aktualnie odtwarzanego utworu.
         Cel:
-        Potwierdzić poprawność wykrywania stanu STOPPED.
+        Potwierdzić poprawność wykrywania stanu STOPPED i aktywnego utworu.
     """
-    player.reset()
-    assert player.is_stopped() is True
-
-def test_is_stopped_false_when_track_active():
-    """
-        Test sprawdzający, że is_stopped() zwraca False, gdy current
-        jest ustawiony.
-        Cel:
-        Upewnić się, że odtwarzacz poprawnie rozpoznaje aktywny utwór.
-    """
-    player.reset()
-    player.current = "track"
-    assert player.is_stopped() is False
+    player.state.current = current
+    assert player.is_stopped() is expected
 
 def test_reset_loops_disables_both():
     """
@@ -82,11 +78,11 @@ def test_reset_loops_disables_both():
         Cel:
         Zweryfikować poprawność czyszczenia flag zapętlania.
     """
-    player.loop_track = True
-    player.loop_playlist = True
+    player.state.loop_track = True
+    player.state.loop_playlist = True
     player.reset_loops()
-    assert player.loop_track is False
-    assert player.loop_playlist is False
+    assert player.state.loop_track is False
+    assert player.state.loop_playlist is False
 
 def test_stop_sets_pause_flag():
     """
@@ -95,10 +91,9 @@ def test_stop_sets_pause_flag():
         Cel:
         Upewnić się, że pauza działa poprawnie.
     """
-    player.reset()
-    player.current = "track"
+    player.state.current = "track"
     player.stop()
-    assert player.is_paused is True
+    assert player.state.is_paused is True
 
 def test_play_resumes_if_current_exists():
     """
@@ -107,31 +102,161 @@ def test_play_resumes_if_current_exists():
         Cel:
         Zweryfikować poprawność wznawiania odtwarzania.
     """
-    player.reset()
-    player.current = "track"
-    player.is_paused = True
+    player.state.current = "track"
+    player.state.is_paused = True
     result = player.play()
     assert result == "track"
-    assert player.is_paused is False
+    assert player.state.is_paused is False
 
 def test_play_starts_from_queue():
     """
         Test sprawdzający, że play() pobiera pierwszy utwór z kolejki,
         jeśli current jest None.
         Scenariusz:
-        1. Reset odtwarzacza.
-        2. Dodanie utworu do kolejki.
-        3. Wywołanie play().
-        4. Oczekiwane: current ustawiony na pierwszy element kolejki.
+        1. Dodanie utworu do kolejki.
+        2. Wywołanie play().
+        3. Oczekiwane: current ustawiony na pierwszy element kolejki.
         Cel:
         Upewnić się, że odtwarzacz poprawnie startuje odtwarzanie z kolejki.
     """
-    player.reset()
     dummy = Track(id=1, title="track1", duration=180)
-    player.queue.append(dummy)
+    player.state.queue.append(dummy)
 
     result = player.play()
 
     assert result == dummy
-    assert player.current == dummy
+    assert player.state.current == dummy
+
+def test_remove_from_queue_uses_index(monkeypatch):
+    """
+        Test sprawdzający usuwanie utworów z kolejki przez indeks kolejki.
+        Scenariusz:
+        1. Podmiana pobierania danych utworów na słownik.
+        2. Dodanie do kolejki utworów 1, 2, 2
+           (pierwszy od razu staje się aktualnym utworem).
+        3. Usunięcie utworu 2 z kolejki - usuwane jest jedno wystąpienie.
+        4. Ponowne usunięcie utworu 2 i próba usunięcia nieobecnego utworu.
+        Cel:
+        Upewnić się, że indeks kolejki pozostaje spójny z kolejką,
+        także gdy ten sam utwór został dodany wielokrotnie.
+    """
+    tracks = {
+        1: player.TrackSnap(id=1, title="track1", duration=180, file_path=None),
+        2: player.TrackSnap(id=2, title="track2", duration=180, file_path=None),
+    }
+    monkeypatch.setattr(player, "_get_track_snapshot", tracks.get)
+    player.add_to_queue(1)
+    player.add_to_queue(2)
+    player.add_to_queue(2)
+
+    assert player.state.current.id == 1
+    assert player.remove_from_queue(2) is True
+    assert [t.id for t in player.get_queue()] == [2]
+    assert player.get_queue_titles() == ["track2"]
+    assert player.remove_from_queue(2) is True
+    assert player.remove_from_queue(2) is False
+    assert player.remove_from_queue(1) is False
+    assert player.get_queue() == ()
+    assert player.get_queue_titles() == []
+
+def test_remove_many_from_queue_rebuilds_queue_and_index(monkeypatch):
+    """
+        Test sprawdzający usuwanie wielu utworów z kolejki naraz.
+        Scenariusz:
+        1. Podmiana pobierania danych utworów na słownik.
+        2. Dodanie do kolejki utworów 1, 2, 3, 2, 3
+           (pierwszy od razu staje się aktualnym utworem).
+        3. Usunięcie utworów {2, 4} - usuwane są wszystkie wystąpienia utworu 2,
+           nieobecny utwór 4 jest pomijany.
+        4. Ponowne usunięcie tego samego zbioru.
+        Cel:
+        Upewnić się, że kolejka i jej indeks są przebudowywane spójnie.
+    """
+    tracks = {
+        i: player.TrackSnap(id=i, title=f"track{i}", duration=180, file_path=None)
+        for i in (1, 2, 3)
+    }
+    monkeypatch.setattr(player, "_get_track_snapshot", tracks.get)
+    for track_id in (1, 2, 3, 2, 3):
+        player.add_to_queue(track_id)
+
+    assert player.remove_many_from_queue({2, 4}) == 2
+    assert [t.id for t in player.get_queue()] == [3, 3]
+    assert player.get_queue_titles() == ["track3", "track3"]
+    assert set(player.state.queue_index) == {3}
+    assert player.remove_many_from_queue({2, 4}) == 0
+    assert player.remove_from_queue(3) is True
+    assert [t.id for t in player.get_queue()] == [3]
+
+def test_tick_uses_cached_duration_and_playlist_length():
+    """
+        Test sprawdzający odtwarzanie playlisty krokami tick().
+        Scenariusz:
+        1. Wybranie playlisty dwóch utworów o długości 2 s i 1 s.
+        2. Weryfikacja zapamiętanej liczby utworów i długości aktualnego utworu.
+        3. Wykonanie kolejnych kroków tick() aż do końca playlisty.
+        Cel:
+        Upewnić się, że zapamiętane długość utworu i liczba utworów playlisty
+        są aktualizowane przy każdej zmianie utworu.
+    """
+    first = player.TrackSnap(id=1, title="track1", duration=2, file_path=None)
+    second = player.TrackSnap(id=2, title="track2", duration=1, file_path=None)
+    player._select_playlist([first, second], loop=False)
+
+    assert player.state.advance is player._advance_playlist
+    assert player.state.playlist_len == 2
+    assert player.state.current_duration == 2
+    assert player.tick() is first
+    assert player.tick() is second
+    assert player.state.current_duration == 1
+    assert player.tick() is None
+    assert player.state.current_duration == 0
+    assert player.state.advance is player._advance_queue
+    player.reset()
+    assert player.state.playlist_len == 0
+
+def test_fast_forward_matches_repeated_tick():
+    """
+        Test sprawdzający przewijanie odtwarzacza funkcją fast_forward().
+        Scenariusz:
+        1. Wybranie playlisty z pętlą: dwa utwory o długości 2 s i 1 s.
+        2. Przewinięcie o 2 s - odtwarzany powinien być drugi utwór.
+        3. Przewinięcie o kolejną 1 s - pętla wraca do pierwszego utworu.
+        Cel:
+        Upewnić się, że fast_forward(n) daje ten sam stan co n wywołań tick().
+    """
+    first = player.TrackSnap(id=1, title="track1", duration=2, file_path=None)
+    second = player.TrackSnap(id=2, title="track2", duration=1, file_path=None)
+    player._select_playlist([first, second], loop=True)
+
+    assert player.fast_forward(2) is second
+    assert player.state.elapsed == 0
+    assert player.fast_forward(1) is first
+    assert player.fast_forward(0) is first
+
+def test_load_track_does_not_change_state(monkeypatch):
+    """
+        Test sprawdzający rozdzielenie odczytu utworu od zmiany stanu.
+        Scenariusz:
+        1. Podmiana pobierania danych utworów na słownik.
+        2. Wczytanie utworu funkcją load_track() - stan odtwarzacza
+           pozostaje bez zmian.
+        3. Dodanie wczytanego utworu funkcją enqueue() - odtwarzanie startuje.
+        4. enqueue(None) (nieistniejący utwór) nie zmienia stanu.
+        Cel:
+        Upewnić się, że odczyt wykonywany w puli wątków nie modyfikuje
+        współdzielonego stanu - robi to dopiero enqueue() w pętli zdarzeń.
+    """
+    snap = player.TrackSnap(id=1, title="track1", duration=180, file_path=None)
+    monkeypatch.setattr(player, "_get_track_snapshot", {1: snap}.get)
+
+    assert player.load_track(1) is snap
+    assert player.state.current is None
+    assert player.get_queue() == ()
+
+    player.enqueue(snap)
+    assert player.state.current is snap
 
+    player.enqueue(player.load_track(2))
+    assert player.state.current is snap
+    assert player.get_queue() == ()
@@ -3,58 +3,49 @@ Testy jednostkowe modelu Playlist.
 Sprawdzają poprawność tworzenia playlisty, dodawania utworów
 oraz powiązania z właścicielem.
 """
+import pytest
 from app.models import Playlist, User, Track
 
 def test_playlist_creation():
     """
-        Test sprawdzający poprawność tworzenia obiektu Artist.
+        Test sprawdzający poprawność tworzenia obiektu Playlist.
         Scenariusz:
-        1. Utworzenie artysty z przykładowymi danymi (id, name, country).
-        2. Weryfikacja, że pola name oraz country zostały poprawnie zapisane.
+        1. Utworzenie użytkownika.
+        2. Utworzenie playlisty i przypisanie jej do użytkownika.
+        3. Weryfikacja, że pola name oraz owner zostały poprawnie ustawione.
         Cel:
-        Upewnić się, że model Artist poprawnie przechowuje dane podstawowe
-        przekazane podczas inicjalizacji.
+        Upewnić się, że model Playlist poprawnie przechowuje dane podstawowe
+        oraz relację z właścicielem.
     """
     user = User(id=1, login="u")
     playlist = Playlist(id=1, name="MyPlaylist", owner=user)
     assert playlist.name == "MyPlaylist"
     assert playlist.owner == user
 
-def test_playlist_add_track():
+@pytest.mark.parametrize("added,removed,expected", [
+    (["T"], [], ["T"]),
+    (["T1", "T2"], ["T1"], ["T2"]),
+], ids=["add", "remove"])
+def test_playlist_tracks(added, removed, expected):
     """
-        Test sprawdzający możliwość aktualizacji pól obiektu Artist.
+        Test sprawdzający dodawanie i usuwanie utworów playlisty.
         Scenariusz:
-        1. Utworzenie artysty z nazwą "Old".
-        2. Zmiana nazwy artysty na "New".
-        3. Weryfikacja, że pole name zostało poprawnie zaktualizowane.
+        1. Utworzenie playlisty i utworów o tytułach z `added`.
+        2. Dodanie utworów do playlisty.
+        3. Usunięcie utworów o tytułach z `removed`.
+        4. Weryfikacja, że na playliście pozostały utwory z `expected`.
         Cel:
-        Zweryfikować, że obiekt Artist pozwala na modyfikację swoich pól
-        po utworzeniu instancji.
+        Zweryfikować poprawność relacji Playlist - Track przy dodawaniu
+        i usuwaniu utworów.
     """
     playlist = Playlist(id=1, name="P")
-    track = Track(id=1, title="T", duration=100)
-    playlist.tracks.append(track)
-    assert len(playlist.tracks) == 1
+    tracks = {
+        title: Track(id=i, title=title, duration=100)
+        for i, title in enumerate(added, start=1)
+    }
+    playlist.tracks.extend(tracks.values())
 
-def test_playlist_remove_track():
-    """
-    Test sprawdzający usuwanie utworu z playlisty.
-    Scenariusz:
-    1. Utworzenie playlisty i dwóch utworów.
-    2. Dodanie ich do playlisty.
-    3. Usunięcie jednego utworu.
-    4. Weryfikacja, że pozostał tylko drugi.
-    Cel:
-    Zweryfikować poprawność relacji Playlist - Track przy usuwaniu.
-    """
-    playlist = Playlist(id=1, name="P")
-    t1 = Track(id=1, title="T1", duration=100)
-    t2 = Track(id=2, title="T2", duration=120)
-
-    playlist.tracks.append(t1)
-    playlist.tracks.append(t2)
-
-    playlist.tracks.remove(t1)
+    for title in removed:
+        playlist.tracks.remove(tracks[title])
 
-    assert len(playlist.tracks) == 1
-    assert playlist.tracks[0].title == "T2"
+    assert [t.title for t in playlist.tracks] == expected
@@ -0,0 +1,83 @@
+"""
+Testy jednostkowe modułu sesji (`app.session`).
+Sprawdzają usuwanie wygasłych sesji, których nikt nie odczytuje,
+ograniczenie liczby sesji przechowywanych w pamięci oraz obsługę sesji
+w Redisie (z klientem zastąpionym prostą atrapą).
+"""
+import app.session as session
+
+def test_create_session_purges_expired_sessions(monkeypatch):
+    """
+        Test sprawdzający usuwanie wygasłych sesji przy tworzeniu nowej.
+        Scenariusz:
+        1. Ustawienie SESSION_TTL na wartość ujemną i utworzenie sesji,
+           która od razu wygasa i nie jest już odczytywana.
+        2. Przywrócenie TTL i utworzenie kolejnej sesji.
+        3. Weryfikacja, że w pamięci pozostała tylko nowa sesja.
+        Cel:
+        Upewnić się, że porzucone sesje nie zajmują pamięci bez końca.
+    """
+    monkeypatch.setattr(session, "_sessions", session.OrderedDict())
+    monkeypatch.setattr(session, "SESSION_TTL", -1)
+    expired = session.create_session(1)
+
+    monkeypatch.setattr(session, "SESSION_TTL", 60)
+    active = session.create_session(2)
+
+    assert expired not in session._sessions
+    assert list(session._sessions) == [active]
+    assert session.get_user_id(active) == 2
+
+def test_max_sessions_evicts_least_recently_used(monkeypatch):
+    """
+        Test sprawdzający ograniczenie liczby sesji.
+        Scenariusz:
+        1. Ustawienie MAX_SESSIONS na 2 i utworzenie dwóch sesji.
+        2. Odczyt pierwszej sesji (staje się ostatnio używaną).
+        3. Utworzenie trzeciej sesji.
+        4. Weryfikacja, że usunięta została druga (najdawniej używana) sesja.
+        Cel:
+        Zweryfikować, że liczba sesji w pamięci jest ograniczona, a odczyt
+        sesji chroni ją przed usunięciem.
+    """
+    monkeypatch.setattr(session, "_sessions", session.OrderedDict())
+    monkeypatch.setattr(session, "MAX_SESSIONS", 2)
+    first = session.create_session(1)
+    second = session.create_session(2)
+
+    assert session.get_user_id(first) == 1
+    third = session.create_session(3)
+
+    assert session.get_user_id(second) is None
+    assert session.get_user_id(first) == 1
+    assert session.get_user_id(third) == 3
+
+def test_redis_backend_create_get_delete(monkeypatch, fake_redis):
+    """
+        Test sprawdzający przechowywanie sesji w Redisie.
+        Scenariusz:
+        1. Podmiana klienta `_redis` na atrapę i utworzenie sesji.
+        2. Weryfikacja klucza `sess:<id>` z TTL oraz tego, że sesja nie
+           trafiła do słownika w pamięci.
+        3. Odczyt id użytkownika (przedłużenie TTL) i usunięcie sesji.
+        4. Weryfikacja, że usunięta i nieistniejąca sesja zwracają None.
+        Cel:
+        Zweryfikować gałąź SESSION_REDIS_URL bez uruchamiania serwera Redis.
+    """
+    monkeypatch.setattr(session, "_redis", fake_redis)
+    monkeypatch.setattr(session, "_sessions", session.OrderedDict())
+
+    session_id = session.create_session(7)
+
+    assert fake_redis.data == {f"sess:{session_id}": (b"7", session.SESSION_TTL)}
+    assert not session._sessions
+
+    fake_redis.data[f"sess:{session_id}"] = (b"7", 1)
+    assert session.get_user_id(session_id) == 7
+    assert fake_redis.data[f"sess:{session_id}"][1] == session.SESSION_TTL
+
+    session.delete_session(session_id)
+
+    assert fake_redis.data == {}
+    assert session.get_user_id(session_id) is None
+    assert session.get_user_id(None) is None
@@ -3,21 +3,27 @@ Testy jednostkowe modelu Track.
 Sprawdzają poprawność tworzenia utworu, aktualizacji pól
 oraz powiązań z albumem i artystami.
 """
+import pytest
 from app.models import Track, Album, Artist
 
-def test_track_creation():
+@pytest.mark.parametrize("fields", [
+    {"title": "Song", "duration": 180},
+    {"title": "Song", "duration": 180, "file_path": "static/tracks/1.mp3"},
+], ids=["basic", "file_path"])
+def test_track_fields(fields):
     """
         Test sprawdzający poprawność tworzenia obiektu Track.
         Scenariusz:
-        1. Utworzenie utworu z przykładowymi danymi (id, title, duration).
-        2. Weryfikacja, że pola title i duration zostały poprawnie zapisane.
+        1. Utworzenie utworu z przykładowymi danymi (title, duration
+           oraz opcjonalnie ścieżka pliku MP3 file_path).
+        2. Weryfikacja, że wszystkie pola zostały poprawnie zapisane.
         Cel:
         Upewnić się, że model Track poprawnie przechowuje dane podstawowe
-        przekazane podczas inicjalizacji.
+        i opcjonalne pole file_path przekazane podczas inicjalizacji.
     """
-    track = Track(id=1, title="Song", duration=180)
-    assert track.title == "Song"
-    assert track.duration == 180
+    track = Track(id=1, **fields)
+    for name, value in fields.items():
+        assert getattr(track, name) == value
 
 def test_track_assign_album():
     """
@@ -50,21 +56,3 @@ def test_track_add_artist():
     artist = Artist(id=1, name="A")
     track.artists.append(artist)
     assert track.artists[0].name == "A"
-
-def test_track_file_path():
-    """
-        Test sprawdzający poprawność przechowywania ścieżki pliku MP3.
-        Scenariusz:
-        1. Utworzenie utworu z podaną ścieżką file_path.
-        2. Weryfikacja, że ścieżka została poprawnie zapisana w modelu.
-        Cel:
-        Upewnić się, że model Track poprawnie przechowuje opcjonalne pole file_path.
-    """
-    track = Track(
-        id=1,
-        title="Song",
-        duration=180,
-        file_path="static/tracks/1.mp3"
-    )
-
-    assert track.file_path == "static/tracks/1.mp3"
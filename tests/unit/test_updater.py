@@ -0,0 +1,40 @@
+"""
+Testy jednostkowe generatora funkcji aktualizujących (`app.crud.updater`).
+Sprawdzają, że przepisywane są tylko pola ustawione w schemacie
+oraz że pola wykluczone są pomijane.
+"""
+from app.crud.updater import make_updater
+from app.models import Track
+from app.schemas import TrackUpdate
+
+def test_updater_sets_only_fields_set():
+    """
+        Test sprawdzający aktualizację wyłącznie przekazanych pól.
+        Scenariusz:
+        1. Utworzenie utworu z tytułem i czasem trwania.
+        2. Aktualizacja samego tytułu przez wygenerowaną funkcję.
+        3. Weryfikacja, że czas trwania pozostał bez zmian.
+        Cel:
+        Upewnić się, że pola nieprzekazane w żądaniu nie są nadpisywane.
+    """
+    track = Track(title="Old", duration=100)
+    make_updater(TrackUpdate)(track, TrackUpdate(title="New"))
+    assert track.title == "New"
+    assert track.duration == 100
+
+def test_updater_skips_excluded_fields():
+    """
+        Test sprawdzający pomijanie pól wykluczonych.
+        Scenariusz:
+        1. Utworzenie utworu bez ścieżki pliku.
+        2. Aktualizacja z polem file_path, które jest wykluczone.
+        3. Weryfikacja, że file_path nie został przepisany.
+        Cel:
+        Zweryfikować, że pola obsługiwane osobno (np. file_path) nie są
+        przepisywane bezpośrednio na obiekt ORM.
+    """
+    track = Track(title="T", duration=100)
+    updater = make_updater(TrackUpdate, ("artist_ids", "file_path"))
+    updater(track, TrackUpdate(file_path="1", duration=200))
+    assert track.file_path is None
+    assert track.duration == 200
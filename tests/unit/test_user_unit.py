@@ -3,73 +3,56 @@ Testy jednostkowe modelu User.
 Sprawdzają poprawność tworzenia użytkownika, aktualizacji pól
 oraz powiązań z playlistami.
 """
+import pytest
 from app.models import User, Playlist
 
-def test_user_creation():
+@pytest.mark.parametrize("initial,updated", [
+    ("test", None),
+    ("old", "new"),
+], ids=["create", "update"])
+def test_user_fields(initial, updated):
     """
-        Test sprawdzający poprawność tworzenia obiektu użytkownika.
+        Test sprawdzający tworzenie obiektu użytkownika i aktualizację jego pól.
         Scenariusz:
-        1. Utworzenie użytkownika z przykładowymi danymi (id, login, email).
+        1. Utworzenie użytkownika z loginem `initial` i przykładowym e-mailem.
         2. Weryfikacja, że pola login i email zostały poprawnie zapisane.
+        3. Jeśli podano `updated` - zmiana loginu i weryfikacja nowej wartości.
         Cel:
-        Upewnić się, że model User poprawnie przechowuje podstawowe dane
-        przekazane podczas inicjalizacji.
+        Upewnić się, że model User poprawnie przechowuje dane przekazane
+        podczas inicjalizacji i pozwala na ich modyfikację.
     """
-    user = User(id=1, login="test", email="a@b.pl")
-    assert user.login == "test"
+    user = User(id=1, login=initial, email="a@b.pl")
+    assert user.login == initial
     assert user.email == "a@b.pl"
 
-def test_user_update_fields():
-    """
-        Test sprawdzający możliwość aktualizacji pól użytkownika.
-        Scenariusz:
-        1. Utworzenie użytkownika z loginem "old".
-        2. Zmiana loginu na "new".
-        3. Weryfikacja, że pole login zostało zaktualizowane.
-        Cel:
-        Zweryfikować, że obiekt User pozwala na modyfikację swoich pól
-        po utworzeniu instancji.
-    """
-    user = User(id=1, login="old")
-    user.login = "new"
-    assert user.login == "new"
+    if updated is not None:
+        user.login = updated
+        assert user.login == updated
 
-def test_user_add_playlist():
+@pytest.mark.parametrize("added,removed,expected", [
+    (["P"], [], ["P"]),
+    (["P1", "P2"], ["P1"], ["P2"]),
+], ids=["add", "remove"])
+def test_user_playlists(added, removed, expected):
     """
-        Test sprawdzający powiązanie użytkownika z playlistą.
+        Test sprawdzający dodawanie i usuwanie playlist użytkownika.
         Scenariusz:
-        1. Utworzenie użytkownika.
-        2. Utworzenie playlisty.
-        3. Dodanie playlisty do listy playlist użytkownika.
-        4. Weryfikacja, że użytkownik ma dokładnie jedną playlistę.
+        1. Utworzenie użytkownika i playlist o nazwach z `added`.
+        2. Dodanie playlist do użytkownika.
+        3. Usunięcie playlist o nazwach z `removed`.
+        4. Weryfikacja, że użytkownikowi pozostały playlisty z `expected`.
         Cel:
         Upewnić się, że relacja User - Playlist działa poprawnie
-        na poziomie modelu i że playlisty można przypisywać użytkownikowi.
+        przy przypisywaniu i usuwaniu playlist.
     """
     user = User(id=1, login="u")
-    playlist = Playlist(id=1, name="P")
-    user.playlists.append(playlist)
-    assert len(user.playlists) == 1
-
-def test_user_remove_playlist():
-    """
-    Test sprawdzający usuwanie playlisty z listy playlist użytkownika.
-    Scenariusz:
-    1. Utworzenie użytkownika i dwóch playlist.
-    2. Dodanie playlist do użytkownika.
-    3. Usunięcie jednej playlisty.
-    4. Weryfikacja, że pozostała tylko jedna.
-    Cel:
-    Upewnić się, że relacja User - Playlist działa poprawnie przy usuwaniu.
-    """
-    user = User(id=1, login="u")
-    p1 = Playlist(id=1, name="P1")
-    p2 = Playlist(id=2, name="P2")
-
-    user.playlists.append(p1)
-    user.playlists.append(p2)
+    playlists = {
+        name: Playlist(id=i, name=name)
+        for i, name in enumerate(added, start=1)
+    }
+    user.playlists.extend(playlists.values())
 
-    user.playlists.remove(p1)
+    for name in removed:
+        user.playlists.remove(playlists[name])
 
-    assert len(user.playlists) == 1
-    assert user.playlists[0].name == "P2"
+    assert [p.name for p in user.playlists] == expected